@@ -0,0 +1,362 @@
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Optional
+
+import rlp
+import ujson
+from aiohttp import ClientSession, web
+from eth_account import Account
+from eth_utils import keccak, to_checksum_address
+
+
+ZERO_HASH = '0x' + '00' * 32
+OPTIMISM_PORTAL = '0x33f60714bbd74d62b66d79213c348614de51901c'
+TRANSACTION_DEPOSITED_TOPIC = '0xb3813568d9991fc951961fcb4c784893574240a28925604d09fc577c55bb7c32'
+DEPOSIT_GAS_LIMIT = 100_000
+
+
+class MockChain:
+    def __init__(self, chain_id: int, block_time: float = 1, latency: float = 0, error_rate: float = 0, balance: int = 10 * 10 ** 18, gas_price: int = 10 ** 9, deposit_url: Optional[str] = None):
+        self.chain_id = chain_id
+        self.deposit_url = deposit_url
+        self.block_time = block_time
+        self.latency = latency
+        self.error_rate = error_rate
+        self.balance = balance
+        self.gas_price = gas_price
+
+        self.block_number = 1
+        self.blocks = {0: [], 1: []}
+        self.block_hashes = {0: self._block_hash(0), 1: self._block_hash(1)}
+        self.mempool: list = []
+        self.nonces = defaultdict(int)
+        self.transactions: dict = {}
+        self.receipts: dict = {}
+        self.credits = defaultdict(int)
+
+        self.calls = Counter()
+        self.requests = 0
+        self.http_requests = 0
+        self.errors = 0
+        self.sent_at: dict = {}
+        self.confirmation_latencies: list = []
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._produce_blocks())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+    async def _produce_blocks(self) -> None:
+        while True:
+            await asyncio.sleep(self.block_time)
+            self.mine_block()
+
+    def mine_block(self) -> None:
+        self.block_number += 1
+        number = self.block_number
+        self.block_hashes[number] = self._block_hash(number)
+        self.blocks[number], self.mempool = self.mempool, []
+
+        cumulative_gas = 0
+        logs_count = 0
+        deposits = []
+        for index, tx_hash in enumerate(self.blocks[number]):
+            tx = self.transactions[tx_hash]
+            gas_used = min(tx['gas'], self._get_gas(tx['to'], tx['data']) * 9 // 10)
+            cumulative_gas += gas_used
+            tx.update(blockNumber=hex(number), blockHash=self.block_hashes[number], transactionIndex=hex(index))
+            self.receipts[tx_hash] = {
+                'transactionHash': tx_hash,
+                'transactionIndex': hex(index),
+                'blockHash': self.block_hashes[number],
+                'blockNumber': hex(number),
+                'from': tx['from'],
+                'to': tx['to'],
+                'cumulativeGasUsed': hex(cumulative_gas),
+                'gasUsed': hex(gas_used),
+                'effectiveGasPrice': hex(self.gas_price),
+                'contractAddress': self._contract_address(tx['from'], tx['nonce']) if tx['to'] is None else None,
+                'logs': [],
+                'logsBloom': '0x' + '00' * 256,
+                'status': '0x1',
+                'type': tx['type']
+            }
+
+            if self.deposit_url and (tx['to'] or '').lower() == OPTIMISM_PORTAL:
+                log = self._deposit_log(tx, logs_count)
+                self.receipts[tx_hash]['logs'].append(log)
+                deposits.append([self._deposit_tx_hash(log, tx), tx['from'], tx['from'], hex(tx['value'])])
+                logs_count += 1
+
+        if deposits:
+            asyncio.create_task(self._forward_deposits(deposits))
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.http_requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency * random.uniform(0.5, 1.5))
+
+        if self.error_rate and random.random() < self.error_rate:
+            self.errors += 1
+            if random.random() < 0.5:
+                return web.Response(status=429, text='Too Many Requests')
+            return web.json_response({'jsonrpc': '2.0', 'id': None, 'error': {'code': -32005, 'message': 'rate limit exceeded'}})
+
+        payload = ujson.loads(await request.read())
+        if isinstance(payload, list):
+            return web.json_response([self.dispatch(call) for call in payload], dumps=ujson.dumps)
+        return web.json_response(self.dispatch(payload), dumps=ujson.dumps)
+
+    def dispatch(self, call: dict) -> dict:
+        self.requests += 1
+        self.calls[call['method']] += 1
+
+        handler = getattr(self, call['method'], None)
+        if handler is None:
+            return {'jsonrpc': '2.0', 'id': call.get('id'), 'error': {'code': -32601, 'message': f'the method {call["method"]} does not exist/is not available'}}
+
+        try:
+            return {'jsonrpc': '2.0', 'id': call.get('id'), 'result': handler(*call.get('params', []))}
+        except ValueError as e:
+            return {'jsonrpc': '2.0', 'id': call.get('id'), 'error': {'code': -32000, 'message': str(e)}}
+
+    def eth_chainId(self) -> str:
+        return hex(self.chain_id)
+
+    def eth_blockNumber(self) -> str:
+        return hex(self.block_number)
+
+    def eth_gasPrice(self) -> str:
+        return hex(self.gas_price)
+
+    def eth_maxPriorityFeePerGas(self) -> str:
+        return hex(self.gas_price // 10)
+
+    def eth_getBalance(self, address: str, block: str = 'latest') -> str:
+        return hex(self.balance + self.credits[address.lower()])
+
+    def eth_getTransactionCount(self, address: str, block: str = 'latest') -> str:
+        return hex(self.nonces[address.lower()])
+
+    def eth_getCode(self, address: str, block: str = 'latest') -> str:
+        return '0x'
+
+    def eth_call(self, tx: dict, block: str = 'latest') -> str:
+        return '0x' + '00' * 32
+
+    def eth_estimateGas(self, tx: dict, block: str = 'latest') -> str:
+        return hex(self._get_gas(tx.get('to'), tx.get('data') or tx.get('input') or '0x'))
+
+    def eth_sendRawTransaction(self, raw_transaction: str) -> str:
+        raw = bytes.fromhex(raw_transaction[2:])
+        tx_hash = '0x' + keccak(raw).hex()
+        if tx_hash in self.transactions:
+            raise ValueError('already known')
+
+        tx = self._decode_transaction(raw)
+        sender = tx['from'].lower()
+        if tx['nonce'] < self.nonces[sender]:
+            raise ValueError(f'nonce too low: next nonce {self.nonces[sender]}, tx nonce {tx["nonce"]}')
+        if tx['nonce'] > self.nonces[sender]:
+            raise ValueError(f'nonce too high: next nonce {self.nonces[sender]}, tx nonce {tx["nonce"]}')
+
+        self.nonces[sender] += 1
+        tx['hash'] = tx_hash
+        self.transactions[tx_hash] = tx
+        self.mempool.append(tx_hash)
+        self.sent_at[tx_hash] = time.monotonic()
+        return tx_hash
+
+    def mock_deposit(self, tx_hash: str, from_: str, to_: str, value: str) -> str:
+        self.transactions[tx_hash] = {'from': from_, 'to': to_, 'nonce': 0, 'gas': DEPOSIT_GAS_LIMIT, 'value': int(value, 16), 'data': '0x', 'type': hex(0x7e)}
+        self.credits[to_.lower()] += int(value, 16)
+        self.mempool.append(tx_hash)
+        return tx_hash
+
+    def eth_getTransactionReceipt(self, tx_hash: str) -> Optional[dict]:
+        receipt = self.receipts.get(tx_hash)
+        if receipt:
+            self._record_confirmation(tx_hash)
+        return receipt
+
+    def eth_getTransactionByHash(self, tx_hash: str) -> Optional[dict]:
+        tx = self.transactions.get(tx_hash)
+        if tx is None:
+            return None
+        return {
+            'hash': tx_hash,
+            'from': tx['from'],
+            'to': tx['to'],
+            'nonce': hex(tx['nonce']),
+            'value': hex(tx['value']),
+            'gas': hex(tx['gas']),
+            'input': tx['data'],
+            'blockNumber': tx.get('blockNumber'),
+            'blockHash': tx.get('blockHash'),
+            'transactionIndex': tx.get('transactionIndex')
+        }
+
+    def eth_getBlockReceipts(self, block: str) -> Optional[list]:
+        number = self._parse_block(block)
+        if number not in self.blocks:
+            return None
+        for tx_hash in self.blocks[number]:
+            self._record_confirmation(tx_hash)
+        return [self.receipts[tx_hash] for tx_hash in self.blocks[number]]
+
+    def eth_getBlockByNumber(self, block: str, full_transactions: bool = False) -> Optional[dict]:
+        number = self._parse_block(block)
+        if number not in self.blocks:
+            return None
+        return {
+            'number': hex(number),
+            'hash': self.block_hashes[number],
+            'parentHash': self.block_hashes.get(number - 1, ZERO_HASH),
+            'timestamp': hex(int(time.time())),
+            'gasLimit': hex(30_000_000),
+            'gasUsed': '0x0',
+            'baseFeePerGas': hex(self.gas_price // 2),
+            'transactions': list(self.blocks[number])
+        }
+
+    def _record_confirmation(self, tx_hash: str) -> None:
+        sent_at = self.sent_at.pop(tx_hash, None)
+        if sent_at is not None:
+            self.confirmation_latencies.append(time.monotonic() - sent_at)
+
+    def _parse_block(self, block: str) -> int:
+        if block in ('latest', 'pending', 'safe', 'finalized'):
+            return self.block_number
+        if block == 'earliest':
+            return 0
+        return int(block, 16)
+
+    def _decode_transaction(self, raw: bytes) -> dict:
+        if raw[0] >= 0xc0:
+            nonce, _, gas, to_, value, data = rlp.decode(raw)[:6]
+            tx_type = '0x0'
+        else:
+            _, nonce, _, _, gas, to_, value, data = rlp.decode(raw[1:])[:8]
+            tx_type = hex(raw[0])
+
+        return {
+            'from': Account.recover_transaction(raw),
+            'to': to_checksum_address(to_) if to_ else None,
+            'nonce': int.from_bytes(nonce, 'big'),
+            'gas': int.from_bytes(gas, 'big'),
+            'value': int.from_bytes(value, 'big'),
+            'data': '0x' + data.hex(),
+            'type': tx_type
+        }
+
+    def _deposit_log(self, tx: dict, log_index: int) -> dict:
+        opaque_data = tx['value'].to_bytes(32, 'big') * 2 + DEPOSIT_GAS_LIMIT.to_bytes(8, 'big') + b'\x00'
+        data = (32).to_bytes(32, 'big') + len(opaque_data).to_bytes(32, 'big') + opaque_data.ljust(-(-len(opaque_data) // 32) * 32, b'\x00')
+        sender = '0x' + '00' * 12 + tx['from'][2:].lower()
+        return {
+            'address': to_checksum_address(OPTIMISM_PORTAL),
+            'topics': [TRANSACTION_DEPOSITED_TOPIC, sender, sender, ZERO_HASH],
+            'data': '0x' + data.hex(),
+            'blockHash': tx['blockHash'],
+            'blockNumber': tx['blockNumber'],
+            'transactionHash': tx['hash'],
+            'transactionIndex': tx['transactionIndex'],
+            'logIndex': hex(log_index),
+            'removed': False
+        }
+
+    @staticmethod
+    def _deposit_tx_hash(log: dict, tx: dict) -> str:
+        source_hash = keccak(bytes(32) + keccak(bytes.fromhex(log['blockHash'][2:]) + int(log['logIndex'], 16).to_bytes(32, 'big')))
+        sender = bytes.fromhex(tx['from'][2:])
+        return '0x' + keccak(b'\x7e' + rlp.encode([source_hash, sender, sender, tx['value'], tx['value'], DEPOSIT_GAS_LIMIT, 0, b''])).hex()
+
+    async def _forward_deposits(self, deposits: list) -> None:
+        await asyncio.sleep(self.block_time)
+        async with ClientSession() as session:
+            await session.post(self.deposit_url, json=[
+                {'jsonrpc': '2.0', 'id': index, 'method': 'mock_deposit', 'params': deposit}
+                for index, deposit in enumerate(deposits)
+            ])
+
+    @staticmethod
+    def _get_gas(to_: Optional[str], data: str) -> int:
+        if not to_:
+            return 1_500_000
+        if not data or data == '0x':
+            return 21_000
+        return 80_000
+
+    @staticmethod
+    def _contract_address(sender: str, nonce: int) -> str:
+        return to_checksum_address(keccak(rlp.encode([bytes.fromhex(sender[2:]), nonce]))[12:])
+
+    def _block_hash(self, number: int) -> str:
+        return '0x' + keccak(f'{self.chain_id}:{number}'.encode()).hex()
+
+    def get_stats(self) -> dict:
+        return {
+            'requests': self.requests,
+            'http_requests': self.http_requests,
+            'errors': self.errors,
+            'transactions': len(self.transactions),
+            'calls': dict(self.calls.most_common()),
+            'confirmation_latencies': self.confirmation_latencies
+        }
+
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.get_stats(), dumps=ujson.dumps)
+
+
+async def start_mock_rpc(chain: MockChain, host: str = '127.0.0.1', port: int = 0) -> tuple:
+    app = web.Application(client_max_size=16 * 1024 ** 2)
+    app.router.add_post('/', chain.handle)
+    app.router.add_get('/stats', chain.handle_stats)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    chain.start()
+    return runner, f'http://{host}:{site._server.sockets[0].getsockname()[1]}'
+
+
+def serve_in_process(chain_id: int, block_time: float, latency: float, error_rate: float, connection, deposit_url: Optional[str] = None) -> None:
+    async def serve_forever() -> None:
+        chain = MockChain(chain_id, block_time, latency, error_rate, deposit_url=deposit_url)
+        runner, url = await start_mock_rpc(chain)
+        connection.send(url)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve_forever())
+
+
+async def serve(args: argparse.Namespace) -> None:
+    chain = MockChain(args.chain_id, args.block_time, args.latency / 1000, args.error_rate, deposit_url=args.deposit_url)
+    runner, url = await start_mock_rpc(chain, args.host, args.port)
+    print(f'Mock JSON-RPC for chain {args.chain_id} listening on {url}')
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await chain.stop()
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Local JSON-RPC stand-in for Sepolia / Ink Sepolia.')
+    parser.add_argument('--chain-id', type=int, default=763373)
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8545)
+    parser.add_argument('--block-time', type=float, default=1)
+    parser.add_argument('--latency', type=float, default=0, help='Average response latency in milliseconds.')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of requests answered with a rate limit error.')
+    parser.add_argument('--deposit-url', help='Mock L2 RPC that receives deposits of transactions sent to the Optimism portal.')
+    try:
+        asyncio.run(serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,178 @@
+import argparse
+import asyncio
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+import ujson
+from aiohttp import ClientSession
+from eth_utils import keccak
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from benchmarks.mock_rpc import serve_in_process
+
+
+FLOWS = {
+    'bridge': 1,
+    'erc721': 2,
+    'erc20': 3,
+    'random': 4,
+    'domain': 5
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run a flow against local mock Sepolia / Ink Sepolia RPCs and report throughput.')
+    parser.add_argument('flow', choices=FLOWS.keys())
+    parser.add_argument('--keys', type=int, default=100, help='Number of synthetic wallets.')
+    parser.add_argument('--contracts', type=int, default=1, help='Contracts per wallet for erc721 / erc20.')
+    parser.add_argument('--concurrency', type=int, default=500, help='Maximum number of wallets in flight.')
+    parser.add_argument('--latency', type=float, default=20, help='Average RPC latency in milliseconds.')
+    parser.add_argument('--error-rate', type=float, default=0, help='Share of RPC requests answered with a rate limit error.')
+    parser.add_argument('--block-time', type=float, default=1, help='Block time of both mock chains in seconds.')
+    parser.add_argument('--signing', choices=('inline', 'thread', 'process'), help='Where transactions are signed. Default: SIGNING_PARAMS.')
+    parser.add_argument('--seed', type=int, default=0, help='Seed for token names and symbols.')
+    parser.add_argument('--json', help='Also write the report to this JSON file.')
+    return parser.parse_args()
+
+
+def configure(args: argparse.Namespace, eth_url: str, ink_url: str) -> None:
+    config.RPCS = {'ethereum_sepolia': [eth_url], 'ink_sepolia': [ink_url]}
+    config.DELAY_BETWEEN_TX = (0, 0)
+    config.DELAY_BETWEEN_ACC = (0, 0)
+    config.RPC_LIMITS = {**config.RPC_LIMITS, 'rps': 100_000, 'burst': 100_000, 'backoff_base': 0.05}
+    config.BRIDGE_PARAMS = {**config.BRIDGE_PARAMS, 'timeout': 60}
+    config.TOKEN_NAMES_PARAMS = {**config.TOKEN_NAMES_PARAMS, 'seed': args.seed}
+    if args.signing:
+        config.SIGNING_PARAMS = {**config.SIGNING_PARAMS, 'executor': None if args.signing == 'inline' else args.signing}
+
+
+def get_percentile(values: list, percentile: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percentile))]
+
+
+def get_peak_memory_mb() -> float:
+    try:
+        import resource
+    except ImportError:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 ** 2 if sys.platform == 'darwin' else peak / 1024
+
+
+async def start_mock_process(chain_id: int, args: argparse.Namespace, deposit_url: Optional[str] = None) -> tuple:
+    parent_connection, child_connection = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve_in_process, args=(chain_id, args.block_time, args.latency / 1000, args.error_rate, child_connection, deposit_url), daemon=True)
+    process.start()
+    url = await asyncio.get_running_loop().run_in_executor(None, parent_connection.recv)
+    return process, url
+
+
+async def get_mock_stats(url: str) -> dict:
+    async with ClientSession() as session:
+        async with session.get(f'{url}/stats') as response:
+            return await response.json(loads=ujson.loads)
+
+
+async def run(args: argparse.Namespace) -> dict:
+    ink_process, ink_url = await start_mock_process(763373, args)
+    eth_process, eth_url = await start_mock_process(11155111, args, deposit_url=ink_url)
+    configure(args, eth_url, ink_url)
+
+    from loguru import logger
+    logger.remove()
+    logger.add(sys.stderr, level='WARNING')
+
+    import src.menu
+    import src.random_interactions
+    from src.menu import Menu
+    from src.loop_monitor import LoopLagMonitor
+    from src.provider_pool import ProviderPool
+    from src.signing import SigningExecutor
+    from src.state_store import StateStore
+
+    private_keys = ['0x' + keccak(f'benchmark-key-{index}'.encode()).hex() for index in range(args.keys)]
+
+    workdir = tempfile.mkdtemp(prefix='ink-bench-')
+    domain_names_path = os.path.join(workdir, 'domain_names.txt')
+    with open(domain_names_path, 'w') as f:
+        f.write('\n'.join(f'bench{index}' for index in range(args.keys)))
+    src.menu.DOMAIN_NAMES_PATH = domain_names_path
+    src.random_interactions.DOMAIN_NAMES_PATH = domain_names_path
+
+    state_store = StateStore(os.path.join(workdir, 'state.db'))
+    menu = Menu(max_concurrency=args.concurrency, state_store=state_store)
+
+    loop_monitor = LoopLagMonitor(0.01)
+    loop_monitor.start()
+    started_at = time.monotonic()
+    try:
+        results = await menu.handle_choice(FLOWS[args.flow], private_keys, [], contracts_count=args.contracts)
+    finally:
+        elapsed = time.monotonic() - started_at
+        loop_monitor.stop()
+        await ProviderPool.close()
+        SigningExecutor.shutdown()
+        state_store.close()
+        try:
+            eth_stats, ink_stats = await get_mock_stats(eth_url), await get_mock_stats(ink_url)
+        finally:
+            eth_process.terminate()
+            ink_process.terminate()
+
+    transactions = eth_stats['transactions'] + ink_stats['transactions']
+    requests = eth_stats['requests'] + ink_stats['requests']
+    account_durations = menu.last_summary.durations if menu.last_summary else []
+    confirmations = eth_stats['confirmation_latencies'] + ink_stats['confirmation_latencies']
+
+    return {
+        'flow': args.flow,
+        'keys': args.keys,
+        'completed': sum(1 for result in results if result and not isinstance(result, BaseException)),
+        'elapsed_s': round(elapsed, 3),
+        'transactions': transactions,
+        'tx_per_s': round(transactions / elapsed, 2) if elapsed else 0,
+        'rpc_requests': requests,
+        'rpc_per_tx': round(requests / transactions, 2) if transactions else None,
+        'http_requests': eth_stats['http_requests'] + ink_stats['http_requests'],
+        'injected_errors': eth_stats['errors'] + ink_stats['errors'],
+        'account_p50_s': round(get_percentile(account_durations, 0.5), 3),
+        'account_p99_s': round(get_percentile(account_durations, 0.99), 3),
+        'confirmation_p50_s': round(get_percentile(confirmations, 0.5), 3),
+        'confirmation_p99_s': round(get_percentile(confirmations, 0.99), 3),
+        'loop_lag_p99_ms': round(loop_monitor.get_percentile(0.99) * 1000, 1),
+        'loop_lag_max_ms': round(loop_monitor.max_lag * 1000, 1),
+        'peak_memory_mb': round(get_peak_memory_mb(), 1),
+        'rpc_calls': {'sepolia': eth_stats['calls'], 'ink_sepolia': ink_stats['calls']}
+    }
+
+
+def print_report(report: dict) -> None:
+    width = max(len(key) for key in report)
+    for key, value in report.items():
+        if key != 'rpc_calls':
+            print(f'{key:<{width}}  {value}')
+
+    for network, calls in report['rpc_calls'].items():
+        if calls:
+            print(f'\n{network} RPC calls:')
+            for method, count in calls.items():
+                print(f'  {method:<32} {count}')
+
+
+if __name__ == '__main__':
+    args = parse_args()
+    report = asyncio.run(run(args))
+    print_report(report)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            f.write(ujson.dumps(report, indent=2))
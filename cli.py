@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import importlib.util
+import os
+import sys
+
+
+ACTIONS = {
+    'bridge': 1,
+    'erc721': 2,
+    'erc20': 3,
+    'random': 4,
+    'domain': 5
+}
+
+EXIT_OK = 0
+EXIT_FAILED = 1
+EXIT_USAGE = 2
+EXIT_INTERRUPTED = 130
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description='Run InkOnChain testnet actions without the interactive menu.')
+    parser.add_argument('action', choices=ACTIONS.keys(), help='Action to run for every wallet.')
+    parser.add_argument('--contracts', type=int, default=1, help='How many contracts to deploy per wallet (erc721, erc20).')
+    parser.add_argument('--keys', help='Path to the private keys file.')
+    parser.add_argument('--proxies', help='Path to the proxies file.')
+    parser.add_argument('--concurrency', type=int, help='Maximum number of wallets processed at the same time.')
+    parser.add_argument('--config', help='Path to a config.py to use instead of the default one.')
+    parser.add_argument('--state', help='Path to the run-state database.')
+    parser.add_argument('--resume', action='store_true', help='Skip tasks completed in a previous run and re-check their sent transactions.')
+    parser.add_argument('--processes', type=int, default=1, help='Split the wallets between this many worker processes. 0 uses one process per CPU core.')
+    parser.add_argument('--seed', type=int, help='Seed for token names and symbols, to make a run reproducible. Default: TOKEN_NAMES_PARAMS.')
+
+    args = parser.parse_args(argv)
+    if args.contracts < 1:
+        parser.error('--contracts must be a positive integer')
+    if args.concurrency is not None and args.concurrency < 1:
+        parser.error('--concurrency must be a positive integer')
+    if args.processes < 0:
+        parser.error('--processes must be a positive integer or 0')
+    return args
+
+
+def load_config(path: str) -> None:
+    spec = importlib.util.spec_from_file_location('config', path)
+    config = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(config)
+    sys.modules['config'] = config
+
+
+async def run(args: argparse.Namespace) -> int:
+    from loguru import logger
+
+    from src.menu import Menu
+    from src.key_registry import KeyRegistry
+    from src.log_setup import setup_logging
+    from src.provider_pool import ProviderPool
+    from src.rpc_metrics import RpcMetrics
+    from src.signing import SigningExecutor
+    from src.state_store import StateStore
+    from src.utils import Utils
+    from src.vars import PRIVATE_KEYS_PATH, PROXIES_PATH, STATE_PATH
+    from config import STATE_PARAMS
+
+    setup_logging()
+
+    private_keys = await KeyRegistry.load(args.keys or PRIVATE_KEYS_PATH)
+    proxies = await Utils.read_strings_from_file(args.proxies or PROXIES_PATH)
+    if not private_keys:
+        logger.error('No private keys to process.')
+        return EXIT_USAGE
+
+    state_store = StateStore(args.state or STATE_PATH, args.resume or STATE_PARAMS['resume'])
+    menu = Menu(max_concurrency=args.concurrency, state_store=state_store)
+    await RpcMetrics.start()
+    try:
+        results = await menu.handle_choice(ACTIONS[args.action], private_keys, proxies, contracts_count=args.contracts)
+    finally:
+        await RpcMetrics.stop()
+        await ProviderPool.close()
+        SigningExecutor.shutdown()
+        state_store.close()
+
+    return get_exit_code(results)
+
+
+def run_sharded(args: argparse.Namespace) -> int:
+    from loguru import logger
+
+    from src.key_registry import KeyRegistry
+    from src.log_setup import setup_logging
+    from src.sharded_runner import ShardedRunner
+    from src.utils import Utils
+    from src.vars import PRIVATE_KEYS_PATH, PROXIES_PATH
+    from config import STATE_PARAMS
+
+    setup_logging()
+
+    private_keys = asyncio.run(KeyRegistry.load(args.keys or PRIVATE_KEYS_PATH))
+    proxies = asyncio.run(Utils.read_strings_from_file(args.proxies or PROXIES_PATH))
+    if not private_keys:
+        logger.error('No private keys to process.')
+        return EXIT_USAGE
+
+    runner = ShardedRunner(args.processes or os.cpu_count() or 1, args.concurrency, args.state, args.resume or STATE_PARAMS['resume'], args.config)
+    results = runner.run(ACTIONS[args.action], private_keys, proxies, contracts_count=args.contracts)
+    return get_exit_code(results)
+
+
+def get_exit_code(results: list) -> int:
+    from loguru import logger
+
+    from src.preflight import PRUNED
+
+    pruned = sum(result == PRUNED for result in results)
+    failed = [result for result in results if result is None or result is False or isinstance(result, BaseException)]
+    if pruned:
+        logger.warning(f'{pruned}/{len(results)} accounts were skipped by the pre-flight check.')
+    if failed:
+        logger.error(f'{len(failed)}/{len(results)} accounts did not complete.')
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+def main(argv: list) -> int:
+    args = parse_args(argv)
+
+    for path in (args.config, args.keys, args.proxies):
+        if path and not os.path.isfile(path):
+            print(f'File not found: {path}', file=sys.stderr)
+            return EXIT_USAGE
+
+    if args.config:
+        load_config(args.config)
+
+    if args.seed is not None:
+        from config import TOKEN_NAMES_PARAMS
+        TOKEN_NAMES_PARAMS['seed'] = args.seed
+
+    try:
+        if args.processes != 1:
+            return run_sharded(args)
+        return asyncio.run(run(args))
+    except KeyboardInterrupt:
+        return EXIT_INTERRUPTED
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
@@ -9,12 +9,106 @@ RANDOM_CONFIG = {
     'max_actions': {
         'erc721_count': (1, 3),
         'erc20_count': (1, 3),
-    }
+    },
+    'max_parallel_actions': 4
+}
+
+TOKEN_NAMES_PARAMS = {
+    "seed": None
 }
 
 RPCS = {
-    "ethereum_sepolia": 'https://ethereum-sepolia-rpc.publicnode.com',
-    "ink_sepolia": 'https://rpc-gel-sepolia.inkonchain.com'
+    "ethereum_sepolia": ['https://ethereum-sepolia-rpc.publicnode.com'],
+    "ink_sepolia": ['https://rpc-gel-sepolia.inkonchain.com']
+}
+
+ROUTER_PARAMS = {
+    "broadcast": 2,
+    "eject_after": 3,
+    "cooldown": 30
+}
+
+HTTP_PARAMS = {
+    "connections": 100,
+    "keepalive_timeout": 30,
+    "timeout": 10,
+    "shared_proxy": None
+}
+
+RPC_LIMITS = {
+    "rps": 25,
+    "burst": 50,
+    "retries": 5,
+    "backoff_base": 0.5,
+    "backoff_max": 30,
+    "endpoints": {}
+}
+
+BATCH_PARAMS = {
+    "window": 0.01,
+    "max_size": 100
+}
+
+FEE_PARAMS = {
+    "eip1559": False,
+    "ttl": None
+}
+
+GAS_CACHE_PARAMS = {
+    "enabled": True,
+    "margin": 1.25
+}
+
+BATCH_EXECUTOR_PARAMS = {
+    "enabled": False,
+    "erc721_mints": (1, 3),
+    "erc20_actions": (3, 6)
+}
+
+PREFLIGHT_PARAMS = {
+    "enabled": True,
+    "unfunded": "last",
+    "margin": 1.5
+}
+
+SCHEDULER_PARAMS = {
+    "max_in_flight": 50,
+    "start_rate": None,
+    "task_timeout": None
+}
+
+STATE_PARAMS = {
+    "resume": False
+}
+
+KEYS_PARAMS = {
+    "cache": True,
+    "process_pool_threshold": 2000,
+    "workers": None
+}
+
+SIGNING_PARAMS = {
+    "executor": "thread",
+    "workers": None
+}
+
+LOG_PARAMS = {
+    "level": "INFO",
+    "console_level": "DEBUG",
+    "json": False,
+    "enqueue": True,
+    "buffering": 8192,
+    "rotation": "100 MB",
+    "retention": 10,
+    "compression": "gz"
+}
+
+METRICS_PARAMS = {
+    "summary": True,
+    "host": "127.0.0.1",
+    "port": None,
+    "dump_interval": None,
+    "loop_lag_interval": 0.1
 }
 
 DELAY_BETWEEN_TX = (5, 12)
@@ -0,0 +1,99 @@
+; Batch executor, assembled into batch_executor_bytecode.txt.
+; The deployer becomes the owner (storage slot 0). Calldata from the owner is a
+; packed list of calls: <20-byte target><2-byte length><calldata>, executed in
+; order; the first failing call reverts the whole batch with its revert data.
+; Calls from anyone else revert, except onERC721Received which is answered so
+; NFTs can be minted to the executor.
+
+; constructor
+CALLER
+PUSH1 0x00
+SSTORE                  ; owner = msg.sender
+PUSH1 0x71              ; runtime size
+DUP1
+PUSH1 0x0f              ; runtime offset
+PUSH1 0x00
+CODECOPY
+PUSH1 0x00
+RETURN
+
+; runtime
+PUSH1 0x00
+SLOAD
+CALLER
+EQ
+PUSH1 execute
+JUMPI                   ; owner -> execute
+PUSH1 0x00
+CALLDATALOAD
+PUSH1 0xe0
+SHR
+PUSH4 0x150b7a02
+EQ
+PUSH1 received
+JUMPI                   ; onERC721Received(...)
+PUSH1 0x00
+DUP1
+REVERT
+received:
+PUSH4 0x150b7a02
+PUSH1 0xe0
+SHL
+PUSH1 0x00
+MSTORE
+PUSH1 0x20
+PUSH1 0x00
+RETURN
+execute:
+PUSH1 0x00              ; [offset]
+loop:
+DUP1
+CALLDATASIZE
+GT
+ISZERO
+PUSH1 done
+JUMPI                   ; offset >= calldatasize -> done
+DUP1
+CALLDATALOAD
+PUSH1 0x60
+SHR                     ; [target, offset]
+DUP2
+PUSH1 0x14
+ADD
+CALLDATALOAD
+PUSH1 0xf0
+SHR                     ; [length, target, offset]
+DUP1
+DUP4
+PUSH1 0x16
+ADD
+PUSH1 0x00
+CALLDATACOPY            ; memory[0:length] = calldata[offset+22:offset+22+length]
+PUSH1 0x00
+PUSH1 0x00
+DUP3
+PUSH1 0x00
+PUSH1 0x00
+DUP7
+GAS
+CALL                    ; call(gas, target, 0, 0, length, 0, 0)
+ISZERO
+PUSH1 failed
+JUMPI
+SWAP1
+POP
+ADD
+PUSH1 0x16
+ADD                     ; offset += 22 + length
+PUSH1 loop
+JUMP
+done:
+STOP
+failed:
+RETURNDATASIZE
+PUSH1 0x00
+DUP1
+RETURNDATACOPY
+RETURNDATASIZE
+PUSH1 0x00
+REVERT
@@ -1,22 +1,37 @@
 import asyncio
+import multiprocessing
 
 from loguru import logger
 
 from src.utils import Utils
-from src.vars import PRIVATE_KEYS_PATH, PROXIES_PATH, LOGS_PATH
+from src.vars import PRIVATE_KEYS_PATH, PROXIES_PATH
 from src.menu import Menu
+from src.key_registry import KeyRegistry
+from src.log_setup import setup_logging
+from src.provider_pool import ProviderPool
+from src.rpc_metrics import RpcMetrics
+from src.signing import SigningExecutor
 
 
-logger.add(sink=LOGS_PATH, format="{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}", level="INFO", rotation="100 MB")
-
-menu = Menu()
-
 async def main():
+    menu = Menu()
     choice = menu.open_menu()
-    private_keys = await Utils.read_strings_from_file(PRIVATE_KEYS_PATH)
+    private_keys = await KeyRegistry.load(PRIVATE_KEYS_PATH)
     proxies = await Utils.read_strings_from_file(PROXIES_PATH)
-    await menu.handle_choice(choice, private_keys, proxies)
+    await RpcMetrics.start()
+    try:
+        await menu.handle_choice(choice, private_keys, proxies)
+    finally:
+        await RpcMetrics.stop()
+        await ProviderPool.close()
+        SigningExecutor.shutdown()
+        menu.state_store.close()
 
 if __name__ == '__main__':
-    asyncio.run(main())
+    multiprocessing.freeze_support()
+    setup_logging()
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        logger.warning('Interrupted by user.')
     
\ No newline at end of file
@@ -0,0 +1,55 @@
+import asyncio
+from typing import Awaitable, Callable, Optional
+
+
+class ActionNode:
+    def __init__(self, name: str, action: Callable[..., Awaitable], parents: tuple = ()):
+        self.name = name
+        self.action = action
+        self.parents = parents
+        self.result = None
+
+
+class ActionGraph:
+    def __init__(self, max_in_flight: Optional[int] = None):
+        self.max_in_flight = max_in_flight
+        self.nodes: dict = {}
+
+    def add(self, name: str, action: Callable[..., Awaitable], parents: tuple = ()) -> str:
+        missing = [parent for parent in parents if parent not in self.nodes]
+        if missing:
+            raise ValueError(f'Action {name} depends on unknown actions: {", ".join(missing)}')
+
+        self.nodes[name] = ActionNode(name, action, parents)
+        return name
+
+    def get_critical_path(self) -> int:
+        depths: dict = {}
+        for node in self.nodes.values():
+            depths[node.name] = 1 + max((depths[parent] for parent in node.parents), default=0)
+        return max(depths.values(), default=0)
+
+    def get_errors(self) -> dict:
+        return {node.name: node.result for node in self.nodes.values() if isinstance(node.result, Exception)}
+
+    async def run(self) -> dict:
+        semaphore = asyncio.Semaphore(self.max_in_flight) if self.max_in_flight else None
+        tasks: dict = {}
+
+        async def run_node(node: ActionNode):
+            parent_results = await asyncio.gather(*[tasks[parent] for parent in node.parents], return_exceptions=True)
+            if any(not result or isinstance(result, Exception) for result in parent_results):
+                return None
+
+            if semaphore is None:
+                return await node.action(*parent_results)
+            async with semaphore:
+                return await node.action(*parent_results)
+
+        for node in self.nodes.values():
+            tasks[node.name] = asyncio.ensure_future(run_node(node))
+
+        results = await asyncio.gather(*tasks.values(), return_exceptions=True)
+        for node, result in zip(self.nodes.values(), results):
+            node.result = result
+        return {node.name: node.result for node in self.nodes.values()}
@@ -0,0 +1,118 @@
+import random
+from decimal import Decimal
+from typing import Optional, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+ETHER_DECIMALS = 18
+SIGNIFICANT_DIGITS = 3
+PERCENT_SCALE = 10 ** 6
+MAX_UINT64 = 2 ** 64 - 1
+MAX_UINT64_DIGITS = len(str(MAX_UINT64))
+
+
+class Amount:
+    @staticmethod
+    def to_wei(amount: Union[int, float, str, Decimal], decimals: int = ETHER_DECIMALS) -> int:
+        return int(Decimal(str(amount)).scaleb(decimals))
+
+    @staticmethod
+    def to_ether(wei: int, decimals: int = ETHER_DECIMALS) -> Decimal:
+        return Decimal(wei).scaleb(-decimals)
+
+    @staticmethod
+    def format(wei: int, digits: Optional[int] = SIGNIFICANT_DIGITS, decimals: int = ETHER_DECIMALS) -> str:
+        if digits:
+            wei = Amount.round_down(wei, digits)
+        return f'{Amount.to_ether(wei, decimals).normalize():f}'
+
+    @staticmethod
+    def round_down(wei: int, digits: int = SIGNIFICANT_DIGITS) -> int:
+        step = 10 ** max(len(str(wei)) - digits, 0)
+        return wei // step * step
+
+    @staticmethod
+    def to_percent_units(percent: Union[int, float]) -> int:
+        return int(Decimal(str(percent)) * PERCENT_SCALE)
+
+    @staticmethod
+    def percent_of(balance: int, percent_units: int) -> int:
+        return balance * percent_units // (100 * PERCENT_SCALE)
+
+    @staticmethod
+    def get_bridge_mode(bridge_params: dict) -> tuple:
+        amount, percent = bridge_params['amount'], bridge_params['percent']
+        if amount is not False and percent is not False:
+            raise ValueError('both amount and percent are set. One of them must be set to False')
+
+        if amount is not False:
+            if isinstance(amount, tuple) and len(amount) == 2:
+                return 'amount', tuple(sorted(Amount.to_wei(value) for value in amount))
+            if isinstance(amount, (int, float)):
+                return 'amount', Amount.to_wei(amount)
+            raise ValueError(f'amount is set to {type(amount).__name__} type. Should be int, float or tuple')
+
+        if percent is not False:
+            if isinstance(percent, tuple) and len(percent) == 2:
+                return 'percent', tuple(sorted(Amount.to_percent_units(value) for value in percent))
+            if isinstance(percent, (int, float)):
+                return 'percent', Amount.to_percent_units(percent)
+            raise ValueError(f'percent is set to {type(percent).__name__} type. Should be int, float or tuple')
+
+        raise ValueError('both amount and percent are set to False. Cannot proceed with bridging')
+
+    @staticmethod
+    def get_bridge_amount(balance: int, bridge_params: dict, rng: Optional[random.Random] = None) -> int:
+        mode, value = Amount.get_bridge_mode(bridge_params)
+        rng = rng or random
+
+        if mode == 'amount':
+            return Amount.round_down(rng.randint(*value)) if isinstance(value, tuple) else value
+        return Amount.round_down(Amount.percent_of(balance, rng.randint(*value) if isinstance(value, tuple) else value))
+
+    @staticmethod
+    def get_bridge_amounts(balances: list, bridge_params: dict, seed: Optional[int] = None) -> list:
+        mode, value = Amount.get_bridge_mode(bridge_params)
+        if mode == 'amount' and not isinstance(value, tuple):
+            return [value] * len(balances)
+
+        if np is None or not Amount.fits_uint64(balances, mode, value):
+            rng = random.Random(seed)
+            return [Amount.get_bridge_amount(balance, bridge_params, rng) for balance in balances]
+
+        rng = np.random.default_rng(seed)
+        if isinstance(value, tuple):
+            values = rng.integers(*value, size=len(balances), endpoint=True, dtype=np.uint64)
+        else:
+            values = np.full(len(balances), value, dtype=np.uint64)
+
+        if mode == 'percent':
+            values = Amount.percent_of_batch(np.array(balances, dtype=np.uint64), values)
+        return Amount.round_down_batch(values)
+
+    @staticmethod
+    def fits_uint64(balances: list, mode: str, value: Union[int, tuple]) -> bool:
+        low, high = value if isinstance(value, tuple) else (value, value)
+        if low < 0 or high > MAX_UINT64:
+            return False
+        if mode == 'amount':
+            return True
+
+        max_balance = max(balances, default=0)
+        return max_balance <= MAX_UINT64 and Amount.percent_of(max_balance, high) <= MAX_UINT64 and 100 * PERCENT_SCALE * high <= MAX_UINT64
+
+    @staticmethod
+    def percent_of_batch(balances, percent_units):
+        scale = np.uint64(100 * PERCENT_SCALE)
+        return balances // scale * percent_units + balances % scale * percent_units // scale
+
+    @staticmethod
+    def round_down_batch(amounts, digits: int = SIGNIFICANT_DIGITS) -> list:
+        powers = np.array([10 ** power for power in range(MAX_UINT64_DIGITS)], dtype=np.uint64)
+        lengths = np.searchsorted(powers, amounts, side='right')
+        steps = powers[np.maximum(lengths - digits, 0)]
+        return (amounts // steps * steps).tolist()
@@ -0,0 +1,51 @@
+from typing import Optional
+from weakref import WeakKeyDictionary
+
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+from src.utils import Utils
+from src.vars import ERC20_ABI, ERC20_BYTECODE, ERC721_ABI, ERC721_BYTECODE, DOMAIN_ABI, BATCH_EXECUTOR_BYTECODE
+
+
+class ArtifactRegistry:
+    _abis: dict = {}
+    _bytecodes: dict = {}
+    _contracts: WeakKeyDictionary = WeakKeyDictionary()
+
+    @classmethod
+    async def preload(cls, abi_paths: tuple = (ERC20_ABI, ERC721_ABI, DOMAIN_ABI), bytecode_paths: tuple = (ERC20_BYTECODE, ERC721_BYTECODE, BATCH_EXECUTOR_BYTECODE)) -> None:
+        for abi_path in abi_paths:
+            await cls.get_abi(abi_path)
+
+        for bytecode_path in bytecode_paths:
+            await cls.get_bytecode(bytecode_path)
+
+    @classmethod
+    async def get_abi(cls, abi_path: str) -> list:
+        abi = cls._abis.get(abi_path)
+        if abi is None:
+            abi = await Utils.read_json(abi_path)
+            cls._abis[abi_path] = abi
+        return abi
+
+    @classmethod
+    async def get_bytecode(cls, bytecode_path: str) -> HexBytes:
+        bytecode = cls._bytecodes.get(bytecode_path)
+        if bytecode is None:
+            bytecode = HexBytes((await Utils.read_file(bytecode_path)).strip())
+            cls._bytecodes[bytecode_path] = bytecode
+        return bytecode
+
+    @classmethod
+    async def get_contract(cls, w3: AsyncWeb3, abi_path: str, address: Optional[str] = None, bytecode_path: Optional[str] = None):
+        key = (abi_path, bytecode_path)
+        factories = cls._contracts.setdefault(w3, {})
+        factory = factories.get(key)
+        if factory is None:
+            factory = w3.eth.contract(abi=await cls.get_abi(abi_path), bytecode=await cls.get_bytecode(bytecode_path) if bytecode_path else None)
+            factories[key] = factory
+
+        if address:
+            return factory(address=AsyncWeb3.to_checksum_address(address))
+        return factory
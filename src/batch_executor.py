@@ -0,0 +1,84 @@
+import asyncio
+from typing import Optional
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.artifacts import ArtifactRegistry
+from src.state_store import StateStore
+from src.vars import BATCH_EXECUTOR_BYTECODE
+
+
+class BatchExecutor:
+    _instances: dict = {}
+
+    def __init__(self, client):
+        self.client = client
+        self.address: Optional[str] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_client(cls, client) -> 'BatchExecutor':
+        key = (client.network.chain_id, client.wallet_address)
+        executor = cls._instances.get(key)
+        if executor is None:
+            executor = cls(client)
+            cls._instances[key] = executor
+        return executor
+
+    @staticmethod
+    def encode_calls(calls: list) -> str:
+        return '0x' + b''.join(
+            HexBytes(target) + len(HexBytes(data)).to_bytes(2, 'big') + HexBytes(data)
+            for target, data in calls
+        ).hex()
+
+    async def get_address(self) -> Optional[str]:
+        async with self._lock:
+            if self.address is None:
+                self.address = await StateStore.run_step(self.client, 'batch_executor', self._deploy, from_receipt=lambda receipt: receipt.contractAddress, shared=True) or None
+        return self.address
+
+    async def execute(self, contract, calls: list) -> Optional[bool]:
+        executor = await self.get_address()
+        if not executor:
+            return None
+
+        handed_over = await StateStore.run_step(self.client, 'handover', lambda: self._hand_over(contract, executor))
+        if not handed_over:
+            return None
+
+        calls = calls + [(contract.address, contract.encode_abi('transferOwnership', args=[self.client.wallet_address]))]
+        result = await StateStore.run_step(self.client, 'batch', lambda: self._send(executor, self.encode_calls(calls)))
+
+        if not result:
+            logger.warning(f'{self.client.wallet_address} | Batch for {contract.address} failed, taking the contract ownership back...')
+            await StateStore.run_step(self.client, 'reclaim', lambda: self._send(executor, self.encode_calls(calls[-1:])))
+        return result
+
+    async def get_owner(self, contract) -> str:
+        owner = await self.client.batcher.call(contract.address, contract.encode_abi('owner'))
+        return AsyncWeb3.to_checksum_address(owner[-20:])
+
+    async def _hand_over(self, contract, executor: str) -> Optional[bool]:
+        if await self.get_owner(contract) == executor:
+            return True
+        return await self._send(contract.address, contract.encode_abi('transferOwnership', args=[executor]))
+
+    async def _deploy(self) -> Optional[str]:
+        logger.info(f'{self.client.wallet_address} | Deploying batch executor in {self.client.network.name}...')
+        bytecode = await ArtifactRegistry.get_bytecode(BATCH_EXECUTOR_BYTECODE)
+
+        tx = await self.client.send_transaction(data=bytecode.hex())
+        if tx:
+            tx_receipt = await self.client.verif_tx(tx)
+            if tx_receipt:
+                return tx_receipt.contractAddress
+        return None
+
+    async def _send(self, to_: str, data: str) -> Optional[bool]:
+        tx = await self.client.send_transaction(to_=to_, data=data)
+        if tx:
+            return bool(await self.client.verif_tx(tx))
+        return None
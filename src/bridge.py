@@ -2,21 +2,23 @@ from typing import Optional, Union
 
 from loguru import logger
 
+from src.amounts import Amount
 from src.client import Client
+from src.deposits import OPTIMISM_PORTAL
 from src.manager import Manager
-from src.utils import Utils
 from config import BRIDGE_PARAMS
 
 
 class BridgeManager:  
-    async def bridge_eth(self, client_eth: Client, client_ink: Client, bridge_params: dict, account_index: int) -> bool:
-        balance = await client_eth.w3.eth.get_balance(client_eth.wallet_address)
+    async def bridge_eth(self, client_eth: Client, client_ink: Client, bridge_params: dict, account_index: int, bridge_amount: Optional[int] = None) -> bool:
+        balance = await client_eth.get_balance()
         
         if not Manager.is_balance_sufficient(balance, bridge_params["min_balance"]):
             logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: balance is less than minimum required.')
             return False
         
-        bridge_amount = self.calculate_bridge_amount(client_eth, balance, bridge_params, account_index)
+        if bridge_amount is None:
+            bridge_amount = self.calculate_bridge_amount(client_eth, balance, bridge_params, account_index)
 
         if bridge_amount is False:
             return False
@@ -29,32 +31,26 @@ class BridgeManager:
     
     @staticmethod
     def calculate_bridge_amount(client_eth: Client, balance: int, bridge_params: dict, account_index: int) -> Union[bool, int]:
-        if bridge_params["amount"] is not False and bridge_params["percent"] is not False:
-            logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: both amount and percent are set. One of them must be set to False.')
-            return False
-        
-        if bridge_params["amount"] is not False:
-            return Manager.calculate_amount(client_eth, bridge_params["amount"], account_index)
-        elif bridge_params["percent"] is not False:
-            return Manager.calculate_percent_amount(client_eth, balance, bridge_params["percent"], account_index)
-        else:
-            logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: both amount and percent are set to False. Cannot proceed with bridging.')
+        try:
+            return Amount.get_bridge_amount(balance, bridge_params)
+        except ValueError as e:
+            logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge cancelled: {e}.')
             return False
     
-    async def execute_bridge(self, client_eth: Client, client_ink: Client, bridge_amount: int, account_index: int) -> Optional[bool]:
+    async def execute_bridge(self, client_eth: Client, client_ink: Client, bridge_amount: int, account_index: int) -> bool:
         try:
-            bridge_fixed_amount = Utils.round_to_significant_digits(bridge_amount / 10 ** 18, 3)
-            
-            logger.info(f'Account {account_index+1} | {client_eth.wallet_address} | Attempting to bridge {bridge_fixed_amount} ETH...')
+            logger.info(f'Account {account_index+1} | {client_eth.wallet_address} | Attempting to bridge {Amount.format(bridge_amount)} ETH...')
             
-            result = await client_eth.bridge_eth(
-                contract_address='0x33f60714BbD74d62b66D79213C348614DE51901C',
+            initial_balance = await client_ink.get_balance()
+            receipt = await client_eth.bridge_eth(
+                contract_address=OPTIMISM_PORTAL,
                 value=bridge_amount
             )
 
-            await Manager.wait_for_positive_balance(client_ink, account_index, BRIDGE_PARAMS['timeout'])
+            if not receipt:
+                return False
 
-            return result
+            return await Manager.wait_for_deposit(client_ink, receipt, initial_balance, account_index, BRIDGE_PARAMS['timeout'])
         except Exception as e:
             logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Error during bridging ETH: {e}.')
             return False
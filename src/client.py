@@ -3,38 +3,56 @@ import random
 from typing import Optional, Union
 
 from web3 import AsyncWeb3
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
 from loguru import logger
 
-from src.utils import Utils
-from src.models import Network, TokenAmount
+from src.artifacts import ArtifactRegistry
+from src.batch_executor import BatchExecutor
+from src.key_registry import Signer
+from src.signing import SigningExecutor
+from src.models import Network
+from src.nonce_manager import NonceManager
+from src.receipt_watcher import ReceiptWatcher
+from src.fee_oracle import FeeOracle
+from src.gas_cache import GasEstimateCache
+from src.provider_pool import ProviderPool
+from src.rpc_batcher import RpcBatcher
+from src.state_store import StateStore
+
+
+MAX_NONCE_RETRIES = 3
+NONCE_GAP_DELAY = 0.5
+TRANSFER_GAS = 21_000
+FEE_KEYS = ('gasPrice', 'maxFeePerGas', 'maxPriorityFeePerGas')
+INTERACT_VALUES = [10000, 50000, 100000, 250000, 500000, 1000000]
 
 
 class Client:
-    def __init__(self, private_key: str, network: Network, proxy: str = None):
-        self.private_key = private_key
+    def __init__(self, private_key: Union[str, Signer], network: Network, proxy: str = None):
+        self.signer = private_key if isinstance(private_key, Signer) else Signer.for_key(private_key)
         self.network = network
         self.proxy = proxy
-        if proxy:
-            self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(endpoint_uri=self.network.rpc, request_kwargs={"proxy": f"http://{proxy}"}))
-        else:
-            self.w3 = AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(endpoint_uri=self.network.rpc))
-        self.wallet_address = AsyncWeb3.to_checksum_address(self.w3.eth.account.from_key(private_key).address)
-        self.nonce_lock = asyncio.Lock()
+        self.w3 = ProviderPool.get_w3(self.network, proxy)
+        self.wallet_address = self.signer.address
+        self.batcher = RpcBatcher.for_w3(self.w3)
+        self.nonce_manager = NonceManager.for_wallet(self.w3, self.network, self.wallet_address)
+        self.receipt_watcher = ReceiptWatcher.for_network(self.network)
+        self.fee_oracle = FeeOracle.for_network(self.network)
+        self.gas_cache = GasEstimateCache.for_network(self.network)
 
     async def get_balance(self) -> int:
-        return await self.w3.eth.get_balance(self.wallet_address)
+        return await self.batcher.get_balance(self.wallet_address)
 
     async def get_transaction_count(self) -> int:
-        async with self.nonce_lock:
-            return await self.w3.eth.get_transaction_count(self.wallet_address)
+        return await self.batcher.get_transaction_count(self.wallet_address, 'latest')
         
     async def send_transaction(self, to_: str = None, data: str = None, value: int = None, tx_params: dict = None) -> Optional[str]:
         if not tx_params:
             tx_params = {
                 'from': self.wallet_address,
-                'gasPrice': await self.w3.eth.gas_price,
-                'nonce': await self.get_transaction_count(),
-                'chainId': await self.w3.eth.chain_id
+                'chainId': self.network.chain_id,
+                **await self.fee_oracle.get_fee_params()
             }
 
             if to_:
@@ -54,144 +72,242 @@ class Client:
                 logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
                 return None
         
-        else:
-            tx_params = tx_params
-        
+        for _ in range(MAX_NONCE_RETRIES):
+            tx_params['nonce'] = await self.nonce_manager.get_nonce()
+
+            try:
+                sign = await SigningExecutor.sign(self.signer, tx_params)
+                tx_hash = await self._send_raw_transaction(sign.rawTransaction)
+                StateStore.record_tx(tx_hash)
+                return tx_hash
+            
+            except Exception as e:
+                if 'already known' in str(e) or ('nonce too low' in str(e) and await self._is_broadcast(sign.hash)):
+                    StateStore.record_tx(sign.hash)
+                    return sign.hash
+                elif 'nonce too low' in str(e) or 'replacement transaction underpriced' in str(e):
+                    await self.nonce_manager.resync()
+                    continue
+                
+                logger.warning(f'{self.wallet_address} | Error sending transaction: {e}')
+                if await self.nonce_manager.release(tx_params['nonce']):
+                    await self._fill_nonce_gap(tx_params)
+                return None
+
+        logger.warning(f'{self.wallet_address} | Error sending transaction: nonce is still out of sync after {MAX_NONCE_RETRIES} attempts.')
+        return None
+
+    async def _fill_nonce_gap(self, tx_params: dict) -> None:
+        fee_params = {key: tx_params[key] for key in FEE_KEYS if key in tx_params} or await self.fee_oracle.get_fee_params()
+        filler = {
+            'from': self.wallet_address,
+            'to': self.wallet_address,
+            'value': 0,
+            'gas': TRANSFER_GAS,
+            'chainId': self.network.chain_id,
+            'nonce': tx_params['nonce'],
+            **fee_params
+        }
+
         try:
-            sign = self.w3.eth.account.sign_transaction(tx_params, self.private_key)
-            return await self.w3.eth.send_raw_transaction(sign.rawTransaction)
-        
+            sign = await SigningExecutor.sign(self.signer, filler)
+            await self._send_raw_transaction(sign.rawTransaction)
+            logger.info(f'{self.wallet_address} | Sent an empty transaction with nonce {filler["nonce"]} so the later transactions are not stuck behind it.')
         except Exception as e:
-            if 'nonce too low' in str(e):
-                tx_params['nonce'] += 1
-                return await self.send_transaction(tx_params=tx_params)
-            elif 'replacement transaction underpriced' in str(e):
-                tx_params['nonce'] += 1
-                return await self.send_transaction(tx_params=tx_params)
-            
-            logger.warning(f'{self.wallet_address} | Error sending transaction: {e}')
-            return None
+            logger.warning(f'{self.wallet_address} | Failed to fill nonce gap {filler["nonce"]}, later transactions may be stuck: {e}')
+            await self.nonce_manager.resync()
+
+    async def _send_raw_transaction(self, raw_transaction: bytes) -> bytes:
+        for _ in range(MAX_NONCE_RETRIES):
+            try:
+                return await self.w3.eth.send_raw_transaction(raw_transaction)
+            except Exception as e:
+                if 'nonce too high' not in str(e):
+                    raise
+                await asyncio.sleep(NONCE_GAP_DELAY)
+        return await self.w3.eth.send_raw_transaction(raw_transaction)
+
+    async def _is_broadcast(self, tx_hash: bytes) -> bool:
+        try:
+            await self.w3.eth.get_transaction(tx_hash)
+            return True
+        except TransactionNotFound:
+            return False
 
     async def send_transaction_with_abimethod(self, contract, method: str, *args, value: Optional[int] = None) -> Optional[str]:
         tx_params = {
             'to': contract.address,
             'from': self.wallet_address,
             'data': contract.encode_abi(method, args=args),
-            'gasPrice': await self.w3.eth.gas_price,
-            'nonce': await self.get_transaction_count(),
-            'chainId': await self.w3.eth.chain_id
+            'chainId': self.network.chain_id,
+            **await self.fee_oracle.get_fee_params()
         }
         
         if value:
             tx_params['value'] = value
+
+        gas_key = self.gas_cache.get_call_key(tx_params['data'], value)
+        cached_gas = self.gas_cache.get(gas_key)
+
+        if cached_gas:
+            tx_params['gas'] = cached_gas
+        else:
+            try:
+                estimate_gas = await self.w3.eth.estimate_gas(tx_params)
+                tx_params['gas'] = int(estimate_gas * 1.1) 
+            
+            except Exception as e:
+                logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
+                return None
         
-        try:
-            estimate_gas = await self.w3.eth.estimate_gas(tx_params)
-            tx_params['gas'] = int(estimate_gas * 1.1) 
-        
-        except Exception as e:
-            logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
-            return None
-        
-        return await self.send_transaction(tx_params=tx_params)
+        tx = await self.send_transaction(tx_params=tx_params)
+        if tx:
+            self.gas_cache.track(tx, gas_key)
+        return tx
 
-    async def _register_domain(self, domain_name: str, expiries: int, contract_address: str, abi_path: str, value: int) -> Optional[bool]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=contract_abi)
+    async def _register_domain(self, domain_name: str, expiries: int, contract_address: str, abi_path: str, value: int) -> bool:
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, address=contract_address)
 
         args = [[self.wallet_address], [domain_name], [expiries], '0x0000000000000000000000000000000000000000', 0]
         
         tx = await self.send_transaction_with_abimethod(contract, 'registerDomains', *args, value=value)
         if tx:
-            return await self.verif_tx(tx)
-        return None
+            return bool(await self.verif_tx(tx))
+        return False
     
-    async def bridge_eth(self, contract_address: str, value: Union[TokenAmount, int]) -> Optional[bool]:
+    async def bridge_eth(self, contract_address: str, value: int) -> Union[AttributeDict, bool]:
         bal = await self.get_balance()
         if bal <= value:
             logger.warning(f'{self.wallet_address} | Bridge cancelled: balance is less than amount to bridge.')
-            return None
+            return False
 
         tx = await self.send_transaction(to_=contract_address, value=value)
         if tx:
-            await self.verif_tx(tx)
-            return True
+            return await self.verif_tx(tx)
+        return False
 
     async def deploy_contract(self, name: str, symbol: str, abi_path: str, bytecode_path: str, increase_gas: float = 1.1) -> Optional[str]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract_bytecode = await Utils.read_file(bytecode_path)
-        contract = self.w3.eth.contract(abi=contract_abi, bytecode=contract_bytecode)
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, bytecode_path=bytecode_path)
+        constructor = contract.constructor(name, symbol)
 
         tx_params = {
-            'chainId': await self.w3.eth.chain_id,
+            'chainId': self.network.chain_id,
             'from': self.wallet_address,
-            'nonce': await self.get_transaction_count(),
-            'gasPrice': await self.w3.eth.gas_price
+            **await self.fee_oracle.get_fee_params()
         }
 
-        try:
-            estimate_gas = await contract.constructor(name, symbol).estimate_gas({'from': self.wallet_address})
-            tx_params['gas'] = int(estimate_gas * increase_gas)
-        
-        except Exception as e:
-            logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
-            return None
+        gas_key = self.gas_cache.get_deploy_key(contract.bytecode, constructor.data_in_transaction)
+        cached_gas = self.gas_cache.get(gas_key)
 
-        construct_tx = await contract.constructor(name, symbol).build_transaction(tx_params)
+        if cached_gas:
+            tx_params['gas'] = cached_gas
+        else:
+            try:
+                estimate_gas = await constructor.estimate_gas({'from': self.wallet_address})
+                tx_params['gas'] = int(estimate_gas * increase_gas)
+            
+            except Exception as e:
+                logger.warning(f'{self.wallet_address} | Error estimating gas: {e}')
+                return None
+
+        construct_tx = await constructor.build_transaction(tx_params)
         tx = await self.send_transaction(tx_params=construct_tx)
 
         if tx:
-            if await self.verif_tx(tx):
-                tx_receipt = await self.w3.eth.wait_for_transaction_receipt(tx, timeout=200)
+            self.gas_cache.track(tx, gas_key)
+            tx_receipt = await self.verif_tx(tx)
+            if tx_receipt:
                 return tx_receipt.contractAddress
             
             logger.warning(f'{self.wallet_address} | Contract deployment failed.')
             return None
 
     async def mint_nft(self, contract_address: str, abi_path: str) -> Optional[bool]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=contract_abi)
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, address=contract_address)
 
         tx = await self.send_transaction_with_abimethod(contract, 'createCollectible')
         if tx:
-            return await self.verif_tx(tx)
-        return None
+            return bool(await self.verif_tx(tx))
+        return False
 
     async def random_interact_with_contract(self, contract_address: str, abi_path: str) -> Optional[bool]:
-        contract_abi = await Utils.read_json(abi_path)
-        contract = self.w3.eth.contract(address=AsyncWeb3.to_checksum_address(contract_address), abi=contract_abi)
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, address=contract_address)
 
-        values = [10000, 50000, 100000, 250000, 500000, 1000000]
         available_methods = ['mint', 'burn', 'pause']
         args = []
 
         random_method = random.choice(available_methods)
         
         if random_method == 'mint':
-            random_value = random.choice(values)
+            random_value = random.choice(INTERACT_VALUES)
             args = [self.wallet_address, random_value * 10 ** 18]
         elif random_method == 'burn':
-            random_value = random.choice(values)
+            random_value = random.choice(INTERACT_VALUES)
             args = [random_value * 10 ** 18]
         
         tx = await self.send_transaction_with_abimethod(contract, random_method, *args)
         
         if tx:
-            return await self.verif_tx(tx)
-        return None
+            return bool(await self.verif_tx(tx))
+        return False
     
-    async def verif_tx(self, tx_hash: str) -> bool:
+    async def batch_mint_nft(self, contract_address: str, abi_path: str, mints_count: int) -> Optional[bool]:
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, address=contract_address)
+        executor = BatchExecutor.for_client(self)
+        executor_address = await executor.get_address()
+        if not executor_address:
+            return None
+
+        first_token_id = int.from_bytes(await self.batcher.call(contract.address, contract.encode_abi('tokenCounter')), 'big')
+
+        calls = [(contract.address, contract.encode_abi('createCollectible'))] * mints_count
+        calls += [
+            (contract.address, contract.encode_abi('transferFrom', args=[executor_address, self.wallet_address, first_token_id + i]))
+            for i in range(mints_count)
+        ]
+        return await executor.execute(contract, calls)
+
+    async def random_batch_interact_with_contract(self, contract_address: str, abi_path: str, actions_count: int) -> Optional[bool]:
+        contract = await ArtifactRegistry.get_contract(self.w3, abi_path, address=contract_address)
+        executor = BatchExecutor.for_client(self)
+        executor_address = await executor.get_address()
+        if not executor_address:
+            return None
+
+        paused = int.from_bytes(await self.batcher.call(contract.address, contract.encode_abi('paused')), 'big') == 1
+        calls = []
+
+        for _ in range(actions_count):
+            random_method = random.choice(['mint', 'burn', 'pause'])
+            amount = random.choice(INTERACT_VALUES) * 10 ** 18
+
+            if random_method == 'mint':
+                calls.append((contract.address, contract.encode_abi('mint', args=[self.wallet_address, amount])))
+            elif random_method == 'burn':
+                calls.append((contract.address, contract.encode_abi('mint', args=[executor_address, amount])))
+                calls.append((contract.address, contract.encode_abi('burn', args=[amount])))
+            else:
+                calls.append((contract.address, contract.encode_abi('unpause' if paused else 'pause')))
+                paused = not paused
+
+        return await executor.execute(contract, calls)
+
+    async def verif_tx(self, tx_hash: str) -> Union[AttributeDict, bool]:
         try:
-            data = await self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=200)
+            data = await self.receipt_watcher.wait_for_receipt(tx_hash, timeout=200)
+            
+            StateStore.record_receipt(data)
+            self.gas_cache.observe(data)
             
             if data.get('status') == 1:
-                logger.debug(f'{self.wallet_address} | Transaction was successful: {tx_hash.hex()}. Explorer: {self.network.explorer}')
-                return True
+                logger.bind(tx_hash=data['transactionHash'].hex()).debug(f'{self.wallet_address} | Transaction was successful: {tx_hash.hex()}. Explorer: {self.network.explorer}')
+                return data
             
             else:
-                logger.warning(f'{self.wallet_address} | Transaction failed: {data["transactionHash"].hex()}. Explorer: {self.network.explorer}')
+                logger.bind(tx_hash=data['transactionHash'].hex()).warning(f'{self.wallet_address} | Transaction failed: {data["transactionHash"].hex()}. Explorer: {self.network.explorer}')
                 return False
         
         except Exception as e:
+            self.gas_cache.forget(tx_hash)
             logger.warning(f'{self.wallet_address} | Unexpected error in <verif_tx> function: {e}')
             return False
@@ -0,0 +1,71 @@
+from typing import Optional
+
+import rlp
+from eth_utils import keccak
+from hexbytes import HexBytes
+from web3 import AsyncWeb3
+
+
+OPTIMISM_PORTAL = '0x33f60714BbD74d62b66D79213C348614DE51901C'
+TRANSACTION_DEPOSITED_TOPIC = HexBytes('0xb3813568d9991fc951961fcb4c784893574240a28925604d09fc577c55bb7c32')
+DEPOSIT_TX_TYPE = 0x7e
+USER_DEPOSIT_DOMAIN = bytes(32)
+
+
+class Deposit:
+    def __init__(self, source_hash: bytes, from_: str, to_: Optional[str], mint: int, value: int, gas: int, data: bytes):
+        self.source_hash = source_hash
+        self.from_ = from_
+        self.to_ = to_
+        self.mint = mint
+        self.value = value
+        self.gas = gas
+        self.data = data
+
+    @classmethod
+    def from_log(cls, log: dict) -> 'Deposit':
+        topics = [HexBytes(topic) for topic in log['topics']]
+        if len(topics) != 4 or topics[0] != TRANSACTION_DEPOSITED_TOPIC:
+            raise ValueError('Log is not a TransactionDeposited event')
+
+        version = int.from_bytes(topics[3], 'big')
+        if version != 0:
+            raise ValueError(f'Unsupported deposit version {version}')
+
+        data = HexBytes(log['data'])
+        opaque_length = int.from_bytes(data[32:64], 'big')
+        opaque_data = bytes(data[64:64 + opaque_length])
+
+        is_creation = opaque_data[72] == 1
+        l1_block_hash = HexBytes(log['blockHash'])
+        source_hash = keccak(USER_DEPOSIT_DOMAIN + keccak(l1_block_hash + int(log['logIndex']).to_bytes(32, 'big')))
+
+        return cls(
+            source_hash=source_hash,
+            from_=AsyncWeb3.to_checksum_address(topics[1][-20:]),
+            to_=None if is_creation else AsyncWeb3.to_checksum_address(topics[2][-20:]),
+            mint=int.from_bytes(opaque_data[:32], 'big'),
+            value=int.from_bytes(opaque_data[32:64], 'big'),
+            gas=int.from_bytes(opaque_data[64:72], 'big'),
+            data=opaque_data[73:]
+        )
+
+    @property
+    def tx_hash(self) -> HexBytes:
+        return HexBytes(keccak(bytes([DEPOSIT_TX_TYPE]) + rlp.encode([
+            self.source_hash,
+            HexBytes(self.from_),
+            HexBytes(self.to_) if self.to_ else b'',
+            self.mint,
+            self.value,
+            self.gas,
+            0,
+            self.data
+        ])))
+
+
+def get_deposits(receipt: dict, portal_address: str = OPTIMISM_PORTAL) -> list:
+    return [
+        Deposit.from_log(log) for log in receipt.get('logs', [])
+        if log['address'].lower() == portal_address.lower() and log['topics'] and HexBytes(log['topics'][0]) == TRANSACTION_DEPOSITED_TOPIC
+    ]
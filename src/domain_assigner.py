@@ -0,0 +1,91 @@
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from src.artifacts import ArtifactRegistry
+from src.models import ink_sepolia
+from src.provider_pool import ProviderPool
+from src.rpc_batcher import RpcBatcher
+from src.utils import Utils
+from src.vars import DOMAIN_ABI
+
+
+DOMAIN_REGISTRY = '0xf180136DdC9e4F8c9b5A9FE59e2b1f07265C5D4D'
+
+
+class DomainAssigner:
+    _instances: dict = {}
+
+    def __init__(self, path: str):
+        self.path = path
+        self.assigned: Optional[list] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_path(cls, path: str) -> 'DomainAssigner':
+        assigner = cls._instances.get(path)
+        if assigner is None:
+            assigner = cls(path)
+            cls._instances[path] = assigner
+        return assigner
+
+    async def get_name(self, account_index: int, total_accounts: int) -> Optional[str]:
+        async with self._lock:
+            if self.assigned is None:
+                self.assigned = await self.assign(total_accounts)
+        return self.assigned[account_index] if account_index < len(self.assigned) else None
+
+    async def assign(self, total_accounts: int) -> list:
+        try:
+            names = await Utils.read_strings_from_file(self.path)
+        except OSError as e:
+            logger.error(f'Error during reading domain names: {e}.')
+            return []
+
+        if len(names) < total_accounts:
+            logger.error(f"Number of domain names ({len(names)}) is less than the number of wallets ({total_accounts}).")
+            return []
+
+        available = await self.get_availability(names)
+        seen = set()
+        for index, name in enumerate(names):
+            if name.lower() in seen:
+                available[index] = False
+            seen.add(name.lower())
+
+        spares = iter([name for name, is_available in zip(names[total_accounts:], available[total_accounts:]) if is_available])
+        assigned = []
+        for account_index, (name, is_available) in enumerate(zip(names[:total_accounts], available[:total_accounts])):
+            if is_available:
+                assigned.append(name)
+                continue
+
+            spare = next(spares, None)
+            if spare:
+                logger.warning(f'Account {account_index+1} | Domain name "{name}.ink" is taken or duplicated, using "{spare}.ink" instead.')
+            else:
+                logger.error(f'Account {account_index+1} | Domain name "{name}.ink" is taken or duplicated and there are no spare names left.')
+            assigned.append(spare)
+
+        logger.info(f'Domain names checked: {sum(available[:total_accounts])}/{total_accounts} available, {sum(name is None for name in assigned)} accounts without a name.')
+        return assigned
+
+    @staticmethod
+    async def get_availability(names: list) -> list:
+        w3 = ProviderPool.get_shared_w3(ink_sepolia)
+        batcher = RpcBatcher.for_w3(w3)
+        contract = await ArtifactRegistry.get_contract(w3, DOMAIN_ABI, address=DOMAIN_REGISTRY)
+
+        async def is_available(name: str) -> bool:
+            try:
+                token_id, protected = await asyncio.gather(
+                    batcher.call(contract.address, contract.encode_abi('domainLookup', args=[name])),
+                    batcher.call(contract.address, contract.encode_abi('protectedDomains', args=[name]))
+                )
+            except Exception as e:
+                logger.warning(f'Failed to check availability of "{name}.ink", assuming it is available: {e}.')
+                return True
+            return int.from_bytes(token_id, 'big') == 0 and int.from_bytes(protected, 'big') == 0
+
+        return list(await asyncio.gather(*[is_available(name) for name in names]))
@@ -0,0 +1,99 @@
+import time
+from collections import deque
+from typing import Optional
+
+from loguru import logger
+
+from config import ROUTER_PARAMS
+
+
+class EndpointStats:
+    def __init__(self, url: str):
+        self.url = url
+        self.latencies = deque(maxlen=200)
+        self.outcomes = deque(maxlen=50)
+        self.consecutive_errors = 0
+        self.healthy = True
+        self.ejected_at = 0.0
+        self.checking = False
+
+    def get_percentile(self, percentile: float) -> Optional[float]:
+        if not self.latencies:
+            return None
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * percentile))]
+
+    @property
+    def p50(self) -> Optional[float]:
+        return self.get_percentile(0.5)
+
+    @property
+    def p95(self) -> Optional[float]:
+        return self.get_percentile(0.95)
+
+    @property
+    def error_rate(self) -> float:
+        return self.outcomes.count(False) / len(self.outcomes) if self.outcomes else 0.0
+
+
+class EndpointRouter:
+    _instances: dict = {}
+
+    def __init__(self, urls: list):
+        self.urls = list(urls)
+        self.stats = {url: EndpointStats(url) for url in self.urls}
+
+    @classmethod
+    def for_endpoints(cls, urls: list) -> 'EndpointRouter':
+        key = tuple(urls)
+        router = cls._instances.get(key)
+        if router is None:
+            router = cls(urls)
+            cls._instances[key] = router
+        return router
+
+    def get_candidates(self) -> list:
+        healthy = [stats for stats in self.stats.values() if stats.healthy]
+        ejected = sorted((stats for stats in self.stats.values() if not stats.healthy), key=lambda stats: stats.ejected_at)
+        healthy.sort(key=lambda stats: (stats.p50 or 0.0, stats.error_rate))
+        return [stats.url for stats in healthy + ejected]
+
+    def get_broadcast_targets(self) -> list:
+        return self.get_candidates()[:max(1, ROUTER_PARAMS['broadcast'])]
+
+    def get_due_for_health_check(self) -> list:
+        now = time.monotonic()
+        due = []
+        for stats in self.stats.values():
+            if not stats.healthy and not stats.checking and now - stats.ejected_at >= ROUTER_PARAMS['cooldown']:
+                stats.checking = True
+                due.append(stats.url)
+        return due
+
+    def record_success(self, url: str, latency: float) -> None:
+        stats = self.stats[url]
+        stats.latencies.append(latency)
+        stats.outcomes.append(True)
+        stats.consecutive_errors = 0
+
+    def record_failure(self, url: str) -> None:
+        stats = self.stats[url]
+        stats.outcomes.append(False)
+        stats.consecutive_errors += 1
+
+        if stats.healthy and len(self.urls) > 1 and (stats.consecutive_errors >= ROUTER_PARAMS['eject_after'] or (len(stats.outcomes) >= 10 and stats.error_rate > 0.5)):
+            stats.healthy = False
+            stats.ejected_at = time.monotonic()
+            logger.warning(f'{url} | RPC ejected after {stats.consecutive_errors} consecutive errors ({stats.error_rate:.0%} error rate).')
+
+    def record_health_check(self, url: str, is_healthy: bool) -> None:
+        stats = self.stats[url]
+        stats.checking = False
+
+        if is_healthy:
+            stats.healthy = True
+            stats.consecutive_errors = 0
+            stats.outcomes.clear()
+            logger.info(f'{url} | RPC readmitted after a successful health check.')
+        else:
+            stats.ejected_at = time.monotonic()
@@ -1,15 +1,17 @@
-from typing import Union
+import random
+from typing import Optional, Union
 
 from loguru import logger
 
 from src.client import Client
 from src.utils import Utils
 from src.vars import ERC20_ABI, ERC20_BYTECODE
+from config import BATCH_EXECUTOR_PARAMS
 
 
 class ERC20Manager():
     async def deploy_erc20(self, client_ink: Client, name: str, symbol: str, account_index: int, is_first_tx: bool = False) -> Union[bool, str]:
-        balance = await client_ink.w3.eth.get_balance(client_ink.wallet_address)
+        balance = await client_ink.get_balance()
     
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Deploy cancelled: zero balance.')
@@ -38,7 +40,7 @@ class ERC20Manager():
             return False
 
     async def interact_with_contract(self, client_ink: Client, contract_address: str, account_index: int) -> bool:
-        balance = await client_ink.w3.eth.get_balance(client_ink.wallet_address)
+        balance = await client_ink.get_balance()
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Interact cancelled: zero balance.')
@@ -55,3 +57,25 @@ class ERC20Manager():
         except Exception as e:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error during interacting with contract: {e}.')
             return False
+
+    async def batch_interact(self, client_ink: Client, contract_address: str, account_index: int, n_actions: Optional[int] = None) -> bool:
+        balance = await client_ink.get_balance()
+        
+        if balance <= 0:
+            logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Interact cancelled: zero balance.')
+            return False
+        
+        n_actions = n_actions or random.randint(*BATCH_EXECUTOR_PARAMS['erc20_actions'])
+
+        try:
+            logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Attempting {n_actions} batched interactions with ERC-20 contract {contract_address}...')
+            result = await Utils.execute_with_delay(client_ink.random_batch_interact_with_contract(
+                contract_address=contract_address,
+                abi_path=ERC20_ABI,
+                actions_count=n_actions
+            ), client_ink.wallet_address, account_index)
+            
+            return result
+        except Exception as e:
+            logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error during batched interactions with contract: {e}.')
+            return False
@@ -1,15 +1,17 @@
-from typing import Union
+import random
+from typing import Optional, Union
 
 from loguru import logger
 
 from src.client import Client
 from src.utils import Utils
 from src.vars import ERC721_ABI, ERC721_BYTECODE
+from config import BATCH_EXECUTOR_PARAMS
 
 
 class ERC721Manager:
     async def deploy_erc721(self, client_ink: Client, name: str, symbol: str, account_index: int, is_first_tx: bool = False) -> Union[bool, str]:
-        balance = await client_ink.w3.eth.get_balance(client_ink.wallet_address)
+        balance = await client_ink.get_balance()
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Deploy cancelled: zero balance.')
@@ -38,7 +40,7 @@ class ERC721Manager:
             return False
 
     async def mint_nft(self, client_ink: Client, contract_address: str, account_index: int) -> bool:
-        balance = await client_ink.w3.eth.get_balance(client_ink.wallet_address)
+        balance = await client_ink.get_balance()
         
         if balance <= 0:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Mint cancelled: zero balance.')
@@ -55,3 +57,25 @@ class ERC721Manager:
         except Exception as e:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error during minting NFT: {e}.')
             return False
+
+    async def batch_interact(self, client_ink: Client, contract_address: str, account_index: int, n_actions: Optional[int] = None) -> bool:
+        balance = await client_ink.get_balance()
+        
+        if balance <= 0:
+            logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Mint cancelled: zero balance.')
+            return False
+        
+        n_actions = n_actions or random.randint(*BATCH_EXECUTOR_PARAMS['erc721_mints'])
+
+        try:
+            logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Attempting to mint {n_actions} NFTs in one batch with contract {contract_address}...')
+            result = await Utils.execute_with_delay(client_ink.batch_mint_nft(
+                contract_address=contract_address, 
+                abi_path=ERC721_ABI,
+                mints_count=n_actions
+            ), client_ink.wallet_address, account_index)
+            
+            return result
+        except Exception as e:
+            logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error during batched minting NFTs: {e}.')
+            return False
@@ -0,0 +1,69 @@
+import asyncio
+import time
+from typing import Optional
+
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.models import Network
+from src.provider_pool import ProviderPool
+from config import FEE_PARAMS
+
+
+class FeeOracle:
+    _instances: dict = {}
+
+    def __init__(self, w3: AsyncWeb3, network: Network, ttl: Optional[float] = None):
+        self.w3 = w3
+        self.network = network
+        self.ttl = ttl if ttl is not None else network.block_time
+        self._gas_price: Optional[int] = None
+        self._base_fee: Optional[int] = None
+        self._priority_fee: Optional[int] = None
+        self._updated_at = 0.0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_network(cls, network: Network) -> 'FeeOracle':
+        oracle = cls._instances.get(network.chain_id)
+        if oracle is None:
+            oracle = cls(ProviderPool.get_shared_w3(network), network, FEE_PARAMS['ttl'])
+            cls._instances[network.chain_id] = oracle
+        return oracle
+
+    async def get_gas_price(self) -> int:
+        await self._refresh()
+        return self._gas_price
+
+    async def get_fee_params(self) -> dict:
+        await self._refresh()
+
+        if FEE_PARAMS['eip1559'] and self._base_fee is not None:
+            return {
+                'maxFeePerGas': 2 * self._base_fee + self._priority_fee,
+                'maxPriorityFeePerGas': self._priority_fee
+            }
+        return {'gasPrice': self._gas_price}
+
+    async def _refresh(self) -> None:
+        if self._gas_price is not None and time.monotonic() - self._updated_at < self.ttl:
+            return
+
+        async with self._lock:
+            if self._gas_price is not None and time.monotonic() - self._updated_at < self.ttl:
+                return
+
+            self._gas_price = await self.w3.eth.gas_price
+            if FEE_PARAMS['eip1559']:
+                await self._refresh_eip1559()
+            self._updated_at = time.monotonic()
+
+    async def _refresh_eip1559(self) -> None:
+        try:
+            block = await self.w3.eth.get_block('latest')
+            self._base_fee = block.get('baseFeePerGas')
+            if self._base_fee is not None:
+                self._priority_fee = await self.w3.eth.max_priority_fee
+        except Exception as e:
+            logger.debug(f'{self.network.name} | EIP-1559 fees are not available, using gas price instead: {e}')
+            self._base_fee = None
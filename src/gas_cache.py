@@ -0,0 +1,62 @@
+from typing import Optional, Union
+
+from eth_utils import keccak
+from hexbytes import HexBytes
+from loguru import logger
+
+from src.models import Network
+from config import GAS_CACHE_PARAMS
+
+
+class GasEstimateCache:
+    _instances: dict = {}
+
+    def __init__(self, network: Network, margin: float):
+        self.network = network
+        self.margin = margin
+        self._gas_used: dict = {}
+        self._pending: dict = {}
+        self._bytecode_hashes: dict = {}
+
+    @classmethod
+    def for_network(cls, network: Network) -> 'GasEstimateCache':
+        cache = cls._instances.get(network.chain_id)
+        if cache is None:
+            cache = cls(network, GAS_CACHE_PARAMS['margin'])
+            cls._instances[network.chain_id] = cache
+        return cache
+
+    @staticmethod
+    def get_call_key(data: Union[str, bytes], value: Optional[int] = None) -> tuple:
+        data = HexBytes(data)
+        return 'call', bytes(data[:4]), len(data), bool(value)
+
+    def get_deploy_key(self, bytecode: Union[str, bytes], data: Union[str, bytes]) -> tuple:
+        bytecode, data = HexBytes(bytecode), HexBytes(data)
+        bytecode_hash = self._bytecode_hashes.get(bytecode)
+        if bytecode_hash is None:
+            bytecode_hash = keccak(bytecode)
+            self._bytecode_hashes[bytecode] = bytecode_hash
+        return 'deploy', bytecode_hash, len(data) - len(bytecode)
+
+    def get(self, key: tuple) -> Optional[int]:
+        if not GAS_CACHE_PARAMS['enabled']:
+            return None
+        gas_used = self._gas_used.get(key)
+        return int(gas_used * self.margin) if gas_used else None
+
+    def track(self, tx_hash: bytes, key: tuple) -> None:
+        self._pending[HexBytes(tx_hash)] = key
+
+    def forget(self, tx_hash: bytes) -> None:
+        self._pending.pop(HexBytes(tx_hash), None)
+
+    def observe(self, receipt: dict) -> None:
+        key = self._pending.pop(HexBytes(receipt['transactionHash']), None)
+        if key is None:
+            return
+
+        if receipt.get('status') == 1:
+            self._gas_used[key] = max(self._gas_used.get(key, 0), receipt['gasUsed'])
+        elif self._gas_used.pop(key, None) is not None:
+            logger.debug(f'{self.network.name} | Transaction {HexBytes(receipt["transactionHash"]).hex()} reverted, dropping its cached gas estimate.')
@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import aiofiles
+import ujson
+from eth_account import Account
+from eth_account.signers.local import LocalAccount
+from loguru import logger
+
+from src.vars import ADDRESS_CACHE_PATH
+from config import KEYS_PARAMS
+
+
+MAX_CACHED_FILES = 5
+
+
+def derive_address(private_key: str) -> Optional[str]:
+    try:
+        return Account.from_key(private_key).address
+    except Exception:
+        return None
+
+
+def derive_addresses(private_keys: list) -> list:
+    return [derive_address(private_key) for private_key in private_keys]
+
+
+class Signer:
+    _instances: dict = {}
+
+    def __init__(self, private_key: str, address: Optional[str] = None):
+        self.private_key = private_key
+        self._address = address
+        self._account: Optional[LocalAccount] = None
+
+    @classmethod
+    def for_key(cls, private_key: str, address: Optional[str] = None) -> 'Signer':
+        signer = cls._instances.get(private_key)
+        if signer is None:
+            signer = cls(private_key, address)
+            cls._instances[private_key] = signer
+        return signer
+
+    @property
+    def account(self) -> LocalAccount:
+        if self._account is None:
+            self._account = Account.from_key(self.private_key)
+            self._address = self._account.address
+        return self._account
+
+    @property
+    def address(self) -> str:
+        if self._address is None:
+            return self.account.address
+        return self._address
+
+    def sign_transaction(self, tx_params: dict):
+        return self.account.sign_transaction(tx_params)
+
+
+class KeyRegistry:
+    @classmethod
+    async def load(cls, path: str) -> list:
+        async with aiofiles.open(path, 'rb') as f:
+            contents = await f.read()
+
+        private_keys = [line.strip() for line in contents.decode().splitlines() if line.strip()]
+        file_hash = hashlib.sha256(contents).hexdigest()
+
+        cache = await cls._read_cache() if KEYS_PARAMS['cache'] else {}
+        addresses = cache.get(file_hash)
+        if addresses is None or len(addresses) != len(private_keys):
+            addresses = await cls.derive(private_keys)
+            if KEYS_PARAMS['cache']:
+                cache.pop(file_hash, None)
+                cache[file_hash] = addresses
+                await cls._write_cache(dict(list(cache.items())[-MAX_CACHED_FILES:]))
+        else:
+            logger.info(f'Loaded {len(addresses)} wallet addresses from cache.')
+
+        for line, address in enumerate(addresses, start=1):
+            if address is None:
+                logger.error(f'Invalid private key on line {line} of {path}.')
+
+        return [Signer.for_key(private_key, address) for private_key, address in zip(private_keys, addresses)]
+
+    @staticmethod
+    async def derive(private_keys: list) -> list:
+        if len(private_keys) < KEYS_PARAMS['process_pool_threshold']:
+            return derive_addresses(private_keys)
+
+        workers = KEYS_PARAMS['workers'] or os.cpu_count() or 1
+        chunk_size = -(-len(private_keys) // (workers * 4))
+        chunks = [private_keys[i:i + chunk_size] for i in range(0, len(private_keys), chunk_size)]
+
+        loop = asyncio.get_running_loop()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = await asyncio.gather(*[loop.run_in_executor(executor, derive_addresses, chunk) for chunk in chunks])
+
+        logger.info(f'Derived {len(private_keys)} wallet addresses with {workers} processes.')
+        return [address for chunk in results for address in chunk]
+
+    @staticmethod
+    async def _read_cache() -> dict:
+        try:
+            async with aiofiles.open(ADDRESS_CACHE_PATH, 'r') as f:
+                return ujson.loads(await f.read())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    async def _write_cache(cache: dict) -> None:
+        try:
+            async with aiofiles.open(ADDRESS_CACHE_PATH, 'w') as f:
+                await f.write(ujson.dumps(cache))
+        except OSError as e:
+            logger.warning(f'Failed to write address cache to {ADDRESS_CACHE_PATH}: {e}.')
@@ -0,0 +1,43 @@
+import sys
+
+import ujson
+from loguru import logger
+
+from src.vars import LOGS_PATH, JSON_LOGS_PATH
+from config import LOG_PARAMS
+
+
+TEXT_FORMAT = '{time:YYYY-MM-DD at HH:mm:ss} | {level} | {message}'
+JSON_FIELDS = ('account', 'address', 'network', 'action', 'tx_hash', 'duration', 'status')
+
+
+def json_format(record: dict) -> str:
+    extra = record['extra']
+    entry = {
+        'time': record['time'].isoformat(),
+        'level': record['level'].name,
+        'message': record['message'],
+        **{field: extra[field] for field in JSON_FIELDS if extra.get(field) is not None}
+    }
+    if record['exception']:
+        entry['exception'] = repr(record['exception'].value)
+    extra['serialized'] = ujson.dumps(entry, ensure_ascii=False)
+    return '{extra[serialized]}\n'
+
+
+def setup_logging() -> None:
+    logger.remove()
+    logger.add(sys.stderr, level=LOG_PARAMS['console_level'], enqueue=LOG_PARAMS['enqueue'])
+
+    file_params = {
+        'level': LOG_PARAMS['level'],
+        'enqueue': LOG_PARAMS['enqueue'],
+        'rotation': LOG_PARAMS['rotation'],
+        'retention': LOG_PARAMS['retention'],
+        'compression': LOG_PARAMS['compression'],
+        'buffering': LOG_PARAMS['buffering']
+    }
+    if LOG_PARAMS['json']:
+        logger.add(sink=JSON_LOGS_PATH, format=json_format, **file_params)
+    else:
+        logger.add(sink=LOGS_PATH, format=TEXT_FORMAT, **file_params)
@@ -0,0 +1,38 @@
+import asyncio
+from collections import deque
+from typing import Optional
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.1):
+        self.interval = interval
+        self.lags = deque(maxlen=10000)
+        self.max_lag = 0.0
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            started_at = loop.time()
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, loop.time() - started_at - self.interval)
+            self.lags.append(lag)
+            self.max_lag = max(self.max_lag, lag)
+
+    def get_percentile(self, percentile: float) -> float:
+        if not self.lags:
+            return 0.0
+        lags = sorted(self.lags)
+        return lags[min(len(lags) - 1, int(len(lags) * percentile))]
+
+    def __str__(self):
+        return (f'p50 {self.get_percentile(0.5) * 1000:.1f}ms, p99 {self.get_percentile(0.99) * 1000:.1f}ms, '
+                f'max {self.max_lag * 1000:.1f}ms over {len(self.lags)} samples')
@@ -1,77 +1,62 @@
 import asyncio
 import time
-import random
-from typing import Optional, Union
-from decimal import Decimal
+from typing import Union
 
 from loguru import logger
+from web3.exceptions import TransactionNotFound
 
+from src.amounts import Amount
 from src.client import Client
-from src.utils import Utils
+from src.deposits import get_deposits
 
 
 class Manager:
     @staticmethod
-    async def wait_for_positive_balance(client: Client, account_index: int, timeout: int) -> bool:
+    async def wait_for_deposit(client: Client, l1_receipt: dict, initial_balance: int, account_index: int, timeout: int) -> bool:
+        try:
+            deposits = [deposit for deposit in get_deposits(l1_receipt) if deposit.to_ == client.wallet_address]
+        except Exception as e:
+            logger.warning(f'Account {account_index+1} | {client.wallet_address} | Failed to parse deposit event: {e}.')
+            deposits = []
+
+        if not deposits:
+            logger.warning(f'Account {account_index+1} | {client.wallet_address} | No deposit event in bridge transaction, waiting for balance change in {client.network.name}...')
+            return await Manager.wait_for_balance_increase(client, initial_balance, account_index, timeout)
+
+        tx_hash = deposits[0].tx_hash
+        logger.info(f'Account {account_index+1} | {client.wallet_address} | Waiting for deposit transaction {tx_hash.hex()} in {client.network.name}...')
+        try:
+            receipt = await client.w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            receipt = None
+
+        try:
+            receipt = receipt or await client.receipt_watcher.wait_for_receipt(tx_hash, timeout=timeout)
+        except TimeoutError:
+            logger.error(f'Account {account_index+1} | {client.wallet_address} | Error: Timeout waiting for deposit transaction after {timeout} seconds.')
+            return False
+
+        if receipt.get('status') != 1:
+            logger.warning(f'Account {account_index+1} | {client.wallet_address} | Deposit transaction {tx_hash.hex()} failed, only the minted ETH was credited.')
+        logger.info(f'Account {account_index+1} | {client.wallet_address} | Deposit of {deposits[0].mint / 10 ** 18} ETH arrived in {client.network.name}.')
+        return True
+
+    @staticmethod
+    async def wait_for_balance_increase(client: Client, initial_balance: int, account_index: int, timeout: int) -> bool:
         start_time = time.time()
         while True:
             balance = await client.get_balance()
             
-            if balance > 0:
-                logger.info(f'Account {account_index+1} | {client.wallet_address} | Balance is positive: {balance / 10 ** 18} ETH.')
+            if balance > initial_balance:
+                logger.info(f'Account {account_index+1} | {client.wallet_address} | Balance increased to {balance / 10 ** 18} ETH.')
                 return True
             
             if time.time() - start_time > timeout:
-                logger.error(f'Account {account_index+1} | {client.wallet_address} | Error: Timeout waiting for positive balance after {timeout} seconds.')
+                logger.error(f'Account {account_index+1} | {client.wallet_address} | Error: Timeout waiting for balance increase after {timeout} seconds.')
                 return False
             
-            logger.info(f'Account {account_index+1} | {client.wallet_address} | Waiting for positive balance in {client.network.name}...')
-            await asyncio.sleep(10)
+            await asyncio.sleep(client.network.block_time)
 
     @staticmethod
     def is_balance_sufficient(balance: int, min_balance: Union[bool, float]) -> bool:
-        return min_balance is False or balance > int(min_balance * 10 ** 18)
-
-    @staticmethod
-    def calculate_amount(client_eth: Client, amount: Union[int, float, tuple], account_index: int) -> Optional[int]:
-        if isinstance(amount, (int, float)):
-            return int(amount * 10 ** 18)
-        elif isinstance(amount, tuple) and len(amount) == 2:
-            return Manager.calculate_random_amount(amount)
-        else:
-            logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Operation cancelled: amount is set to {type(amount)} type. Should be int, float or tuple.')
-            return False
-
-    @staticmethod
-    def calculate_random_amount(amount_range: tuple) -> int:
-        min_amount, max_amount = amount_range
-        unformatted_amount = random.uniform(min_amount, max_amount)
-        formatted_amount = Utils.round_to_significant_digits(unformatted_amount, 3)
-        return int(Decimal(formatted_amount) * 10 ** 18)
-
-    @staticmethod
-    def calculate_percent_amount(client_eth: Client, balance: int, percent: Union[int, tuple], account_index: int) -> Optional[int]:
-        if isinstance(percent, int):
-            return Manager.calculate_fixed_percent_amount(balance, percent)
-        elif isinstance(percent, tuple) and len(percent) == 2:
-            return Manager.calculate_random_percent_amount(balance, percent)
-        else:
-            logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Operation cancelled: percent is set to {type(percent)} type. Should be int or tuple.')
-            return False
-
-    @staticmethod
-    def calculate_fixed_percent_amount(balance: int, percent: int) -> int:
-        percent_value = percent / 100
-        unformatted_amount = (balance / 10 ** 18) * percent_value
-        formatted_amount = Utils.round_to_significant_digits(unformatted_amount, 3)
-        return int(Decimal(formatted_amount) * 10 ** 18)
-
-    @staticmethod
-    def calculate_random_percent_amount(balance: int, percent_range: tuple) -> int:
-        min_percent, max_percent = percent_range
-        min_amount = (balance / 10 ** 18) * (min_percent / 100)
-        max_amount = (balance / 10 ** 18) * (max_percent / 100)
-        unformatted_amount = random.uniform(min_amount, max_amount)
-        formatted_amount = Utils.round_to_significant_digits(unformatted_amount, 3)
-        return int(Decimal(formatted_amount) * 10 ** 18)
-    
\ No newline at end of file
+        return min_balance is False or balance > Amount.to_wei(min_balance)
@@ -1,24 +1,37 @@
-import random
-import asyncio
+from functools import partial
 from typing import Optional
 
 from loguru import logger
 
+from src.amounts import Amount
 from src.client import Client
+from src.artifacts import ArtifactRegistry
+from src.key_registry import Signer
 from src.models import ethereum_sepolia, ink_sepolia
-from src.utils import Utils
-from src.vars import NAMES_PATH, SYMBOLS_PATH, DOMAIN_NAMES_PATH
-from config import BRIDGE_PARAMS, DELAY_BETWEEN_ACC
+from src.provider_pool import ProviderPool
+from src.rpc_batcher import RpcBatcher
+from src.state_store import StateStore
+from src.vars import NAMES_PATH, SYMBOLS_PATH, DOMAIN_NAMES_PATH, STATE_PATH
+from config import BRIDGE_PARAMS, STATE_PARAMS, BATCH_EXECUTOR_PARAMS, PREFLIGHT_PARAMS
 
 from src.register_domain import DomainManager
+from src.domain_assigner import DomainAssigner
+from src.name_generator import NameGenerator
 from src.bridge import BridgeManager
 from src.erc_721 import ERC721Manager
 from src.erc_20 import ERC20Manager
 from src.random_interactions import RandomManager
+from src.scheduler import AccountScheduler
+from src.preflight import PRUNED, PreflightPlanner
 
 
 class Menu:
-    def __init__(self):
+    def __init__(self, max_concurrency: Optional[int] = None, state_store: Optional[StateStore] = None, account_indices: Optional[list] = None, total_accounts: Optional[int] = None):
+        self.max_concurrency = max_concurrency
+        self.account_indices = account_indices
+        self.total_accounts = total_accounts
+        self.state_store = state_store or StateStore(STATE_PATH, STATE_PARAMS['resume'])
+        self.last_summary = None
         self.bridge_manager = BridgeManager()
         self.erc721_manager = ERC721Manager()
         self.erc20_manager = ERC20Manager()
@@ -44,20 +57,67 @@ class Menu:
         choice = int(input('Choose an option (1-6): '))
         return choice
     
-    async def handle_choice(self, choice: int, private_keys: list, proxies: list) -> Optional[bool]:
+    async def _run_accounts(self, process_account, accounts: list, *args) -> list:
+        scheduler = AccountScheduler(max_in_flight=self.max_concurrency)
+        try:
+            return await scheduler.run([
+                partial(self._run_account, process_account, private_key, account_index, *args)
+                for account_index, private_key in accounts
+            ])
+        finally:
+            self.last_summary = scheduler.summary
+
+    @staticmethod
+    async def _run_account(process_account, private_key, account_index: int, *args):
+        with logger.contextualize(account=account_index+1):
+            return await process_account(private_key, account_index, *args)
+
+    async def _plan_accounts(self, choice: int, accounts: list, contracts_count: Optional[int]) -> list:
+        try:
+            wallet_plans = await PreflightPlanner(choice, contracts_count).run([private_key for _, private_key in accounts], [account_index for account_index, _ in accounts])
+            return [(wallet_plan.account_index, wallet_plan.private_key) for wallet_plan in wallet_plans]
+        except Exception as e:
+            logger.warning(f'Pre-flight check failed, scheduling all accounts: {e}')
+            return accounts
+
+    @staticmethod
+    async def _plan_bridge_amounts(accounts: list) -> dict:
+        try:
+            addresses = [(private_key if isinstance(private_key, Signer) else Signer.for_key(private_key)).address for _, private_key in accounts]
+            balances = await RpcBatcher.get_balances(ethereum_sepolia, addresses)
+            amounts = Amount.get_bridge_amounts(balances, BRIDGE_PARAMS)
+        except Exception as e:
+            logger.warning(f'Failed to plan bridge amounts, calculating them for each account: {e}')
+            return {}
+        return {account_index: amount for (account_index, _), amount in zip(accounts, amounts)}
+
+    async def handle_choice(self, choice: int, private_keys: list, proxies: list, contracts_count: Optional[int] = None) -> Optional[list]:
+        if choice in (2, 3) and contracts_count is None:
+            contracts_count = int(input('Enter an integer number of how many contracts you want to deploy: '))
+
+        ProviderPool.set_shared_proxy(proxies)
+
+        if choice in (2, 3, 4, 5):
+            await ArtifactRegistry.preload()
+
+        all_accounts = list(zip(self.account_indices or range(len(private_keys)), private_keys))
+        accounts = all_accounts
+        if PREFLIGHT_PARAMS['enabled'] and choice in (1, 2, 3, 4, 5):
+            accounts = await self._plan_accounts(choice, all_accounts, contracts_count)
+
         if choice == 1:
+            bridge_amounts = await self._plan_bridge_amounts(accounts)
+
             async def process_account(private_key: str, account_index: int):
                 try:
                     proxy = proxies[account_index % len(proxies)] if proxies else None
                     client_eth = Client(private_key, ethereum_sepolia, proxy)
                     client_ink = Client(private_key, ink_sepolia, proxy)
             
-                    result = await self.bridge_manager.bridge_eth(client_eth, client_ink, BRIDGE_PARAMS, account_index)
+                    result = await self.state_store.run(client_eth, 'bridge', lambda: self.bridge_manager.bridge_eth(client_eth, client_ink, BRIDGE_PARAMS, account_index, bridge_amounts.get(account_index)))
             
-                    if isinstance(result, Exception) or result is False:
+                    if isinstance(result, Exception) or not result:
                         logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge failed with error: {result}.')
-                    elif result is None:
-                        logger.warning(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge completed with no result.')
                     else:
                         logger.success(f'Account {account_index+1} | {client_eth.wallet_address} | Bridge completed successfully.')
                     
@@ -67,23 +127,9 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_eth.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i)
-                ))
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+            results = await self._run_accounts(process_account, accounts)
 
         elif choice == 2:
-            second_choice = int(input('Enter an integer number of how many contracts you want to deploy: '))
-
             async def process_account(private_key: str, account_index: int):
                 try:
                     proxy = proxies[account_index % len(proxies)] if proxies else None
@@ -91,51 +137,33 @@ class Menu:
             
                     account_results = []
 
-                    for contract_index in range(second_choice):
-                        name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                        contract_address = await self.erc721_manager.deploy_erc721(client_ink, name, symbol, account_index, is_first_tx=(contract_index==0))
+                    for contract_index in range(contracts_count):
+                        name, symbol = await NameGenerator.for_paths(NAMES_PATH, SYMBOLS_PATH).get_name_and_symbol()
+                        contract_address = await self.state_store.run(client_ink, f'erc721_deploy_{contract_index}', lambda: self.erc721_manager.deploy_erc721(client_ink, name, symbol, account_index, is_first_tx=(contract_index==0)), from_receipt=lambda receipt: receipt.contractAddress)
                        
-                        if isinstance(contract_address, Exception) or contract_address is False:
+                        if isinstance(contract_address, Exception) or not contract_address:
                             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 contract deployment {contract_index+1} failed with error: {contract_address}.')
-                        elif contract_address is None:
-                            logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 contract deployment {contract_index+1} completed with no result.')
                         else:
                             logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 contract deployment {contract_index+1} completed successfully.')
                         
                         if contract_address:
                             account_results.append((contract_index, contract_address))
-                            mint_result = await self.erc721_manager.mint_nft(client_ink, contract_address, account_index)
+                            mint_result = await self.state_store.run(client_ink, f'erc721_mint_{contract_index}', lambda: (self.erc721_manager.batch_interact if BATCH_EXECUTOR_PARAMS['enabled'] else self.erc721_manager.mint_nft)(client_ink, contract_address, account_index))
                     
-                            if isinstance(mint_result, Exception) or mint_result is False:
+                            if isinstance(mint_result, Exception) or not mint_result:
                                 logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Mint NFT with contract {contract_index+1} failed with error: {mint_result}.')
-                            elif mint_result is None:
-                                logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | Mint NFT with contract {contract_index+1} completed with no result.')
                             else:
                                 logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | Mint NFT with contract {contract_index+1} completed successfully.')
             
-                    return account_results
+                    return account_results or False
             
                 except Exception as e:
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error processing account: {e}.')
-                    return []
-
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i))
-                )
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
+                    return False
 
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+            results = await self._run_accounts(process_account, accounts)
 
         elif choice == 3:
-            second_choice = int(input('Enter an integer number of how many contracts you want to deploy: '))
-
             async def process_account(private_key: str, account_index: int):
                 try:
                     proxy = proxies[account_index % len(proxies)] if proxies else None
@@ -143,47 +171,31 @@ class Menu:
             
                     account_results = []
             
-                    for contract_index in range(second_choice):
-                        name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
-                        contract_address = await self.erc20_manager.deploy_erc20(client_ink, name, symbol, account_index, is_first_tx=(contract_index==0))
+                    for contract_index in range(contracts_count):
+                        name, symbol = await NameGenerator.for_paths(NAMES_PATH, SYMBOLS_PATH).get_name_and_symbol()
+                        contract_address = await self.state_store.run(client_ink, f'erc20_deploy_{contract_index}', lambda: self.erc20_manager.deploy_erc20(client_ink, name, symbol, account_index, is_first_tx=(contract_index==0)), from_receipt=lambda receipt: receipt.contractAddress)
                 
-                        if isinstance(contract_address, Exception) or contract_address is False:
+                        if isinstance(contract_address, Exception) or not contract_address:
                             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 contract deployment {contract_index+1} failed with error: {contract_address}.')
-                        elif contract_address is None:
-                            logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 contract deployment {contract_index+1} completed with no result.')
                         else:
                             logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 contract deployment {contract_index+1} completed successfully.')
                 
                         if contract_address:
                             account_results.append((contract_index, contract_address))
-                            interact_result = await self.erc20_manager.interact_with_contract(client_ink, contract_address, account_index)
+                            interact_result = await self.state_store.run(client_ink, f'erc20_interact_{contract_index}', lambda: (self.erc20_manager.batch_interact if BATCH_EXECUTOR_PARAMS['enabled'] else self.erc20_manager.interact_with_contract)(client_ink, contract_address, account_index))
                     
-                            if isinstance(interact_result, Exception) or interact_result is False:
+                            if isinstance(interact_result, Exception) or not interact_result:
                                 logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Interact with contract {contract_index+1} failed with error: {interact_result}.')
-                            elif interact_result is None:
-                                logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | Interact with contract {contract_index+1} completed with no result.')
                             else:
                                 logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | Interact with contract {contract_index+1} completed successfully.')
             
-                    return account_results
+                    return account_results or False
             
                 except Exception as e:
                     logger.error(f'Error processing account {account_index+1}: {e}.')
-                    return []
-
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i)
-                ))
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
+                    return False
 
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+            results = await self._run_accounts(process_account, accounts)
         
         elif choice == 4:
             async def process_account(private_key: str, account_index: int, total_accounts: int):
@@ -191,12 +203,10 @@ class Menu:
                     proxy = proxies[account_index % len(proxies)] if proxies else None
                     client_ink = Client(private_key, ink_sepolia, proxy)
             
-                    result = await self.random_manager.random_interactions(client_ink, account_index, total_accounts)
+                    result = await self.random_manager.random_interactions(client_ink, account_index, total_accounts, self.state_store)
             
-                    if isinstance(result, Exception) or result is False:
+                    if isinstance(result, Exception) or not result:
                         logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Random interactions failed with error: {result}.')
-                    elif result is None:
-                        logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | Random interactions completed with no result.')
                     else:
                         logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | Random interactions completed successfully.')
             
@@ -206,19 +216,7 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i, len(private_keys))
-                ))
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+            results = await self._run_accounts(process_account, accounts, self.total_accounts or len(private_keys))
 
         elif choice == 5:
             async def process_account(private_key: str, account_index: int, total_accounts: int):
@@ -226,16 +224,14 @@ class Menu:
                     proxy = proxies[account_index % len(proxies)] if proxies else None
                     client_ink = Client(private_key, ink_sepolia, proxy)
             
-                    domain_name = await Utils.get_domain_name(DOMAIN_NAMES_PATH, account_index, total_accounts)
+                    domain_name = await DomainAssigner.for_path(DOMAIN_NAMES_PATH).get_name(account_index, total_accounts)
                     if not domain_name:
                         return False
                     
-                    result = await self.domain_manager.register_domain(client_ink, domain_name, account_index)
+                    result = await self.state_store.run(client_ink, 'domain', lambda: self.domain_manager.register_domain(client_ink, domain_name, account_index))
             
-                    if isinstance(result, Exception) or result is False:
+                    if isinstance(result, Exception) or not result:
                         logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Domain registration failed with error: {result}.')
-                    elif result is None:
-                        logger.warning(f'Account {account_index+1} | {client_ink.wallet_address} | Domain registration completed with no result.')
                     else:
                         logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | Domain registration completed successfully.')
             
@@ -245,19 +241,7 @@ class Menu:
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error processing account: {e}.')
                     return False
 
-            account_tasks = []
-            for i, private_key in enumerate(private_keys):
-                account_tasks.append(asyncio.create_task(
-                    process_account(private_key, i, len(private_keys))
-                ))
-        
-                if i < len(private_keys) - 1:
-                    delay = random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
-                    logger.info(f'Waiting {delay} seconds before starting next account...')
-                    await asyncio.sleep(delay)
-
-            if account_tasks:
-                await asyncio.gather(*account_tasks, return_exceptions=True)
+            results = await self._run_accounts(process_account, accounts, self.total_accounts or len(private_keys))
 
         elif choice == 6:
             logger.info('Exiting...')
@@ -265,5 +249,8 @@ class Menu:
         
         else:
             logger.error('Please enter a number from 1 to 6.')
+            return None
 
         logger.info('Finished.')
+        results_by_index = dict(zip([account_index for account_index, _ in accounts], results))
+        return [results_by_index.get(account_index, PRUNED) for account_index, _ in all_accounts]
@@ -1,34 +1,19 @@
-from decimal import Decimal
 from typing import Union
 
 from config import RPCS
 
 
-class TokenAmount:
-    Wei: int
-    Ether: Decimal
-    decimals: int
-
-    def __init__(self, amount: Union[int, float, str, Decimal], decimals: int = 18, wei: bool = False) -> None:
-        if wei:
-            self.Wei: int = amount
-            self.Ether: Decimal = Decimal(str(amount)) / 10 ** decimals
-
-        else:
-            self.Wei: int = int(Decimal(str(amount)) * 10 ** decimals)
-            self.Ether: Decimal = Decimal(str(amount))
-
-        self.decimals = decimals
-
-
 class Network:
-    def __init__(self, name: str, rpc: str, chain_id: int, coin_symbol: str, explorer: str, decimals: int = 18):
+    def __init__(self, name: str, rpc: Union[str, list], chain_id: int, coin_symbol: str, explorer: str, decimals: int = 18, block_time: float = 12, op_stack: bool = False):
         self.name = name
-        self.rpc = rpc
+        self.rpcs = [rpc] if isinstance(rpc, str) else list(rpc)
+        self.rpc = self.rpcs[0]
         self.chain_id = chain_id
         self.coin_symbol = coin_symbol
         self.decimals = decimals
         self.explorer = explorer
+        self.block_time = block_time
+        self.op_stack = op_stack
 
     def __str__(self):
         return self.name
@@ -39,7 +24,8 @@ ethereum_sepolia = Network(
     rpc=RPCS['ethereum_sepolia'],
     chain_id=11155111,
     coin_symbol='ETH',
-    explorer='https://sepolia.etherscan.io/'
+    explorer='https://sepolia.etherscan.io/',
+    block_time=12
 )
 
 ink_sepolia = Network(
@@ -47,5 +33,7 @@ ink_sepolia = Network(
     rpc=RPCS['ink_sepolia'],
     chain_id=763373,
     coin_symbol='ETH',
-    explorer='https://explorer-sepolia.inkonchain.com/'
+    explorer='https://explorer-sepolia.inkonchain.com/',
+    block_time=1,
+    op_stack=True
 )
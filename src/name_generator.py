@@ -0,0 +1,66 @@
+import asyncio
+import random
+from typing import Optional
+
+from loguru import logger
+
+from src.utils import Utils
+from config import TOKEN_NAMES_PARAMS
+
+
+class NameGenerator:
+    _instances: dict = {}
+    shard_index: int = 0
+    shards_count: int = 1
+
+    def __init__(self, names_path: str, symbols_path: str, seed: Optional[int] = None):
+        self.names_path = names_path
+        self.symbols_path = symbols_path
+        self.seed = seed
+        self.pairs: Optional[list] = None
+        self.position = 0
+        self.cycle = 0
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_paths(cls, names_path: str, symbols_path: str) -> 'NameGenerator':
+        key = (names_path, symbols_path)
+        generator = cls._instances.get(key)
+        if generator is None:
+            generator = cls(names_path, symbols_path, TOKEN_NAMES_PARAMS['seed'])
+            cls._instances[key] = generator
+        return generator
+
+    @classmethod
+    def set_shard(cls, shard_index: int, shards_count: int) -> None:
+        cls.shard_index = shard_index
+        cls.shards_count = shards_count
+
+    async def load(self) -> list:
+        names, symbols = await asyncio.gather(
+            Utils.read_strings_from_file(self.names_path),
+            Utils.read_strings_from_file(self.symbols_path)
+        )
+        pairs = list(dict.fromkeys(zip(names, symbols)))
+        if not pairs:
+            raise ValueError(f'No token names in {self.names_path} and {self.symbols_path}')
+        return pairs
+
+    def shuffle(self) -> None:
+        random.Random(f'{self.seed}:{self.cycle}' if self.seed is not None else None).shuffle(self.pairs)
+        self.position = self.shard_index % len(self.pairs)
+
+    async def get_name_and_symbol(self) -> tuple:
+        async with self._lock:
+            if self.pairs is None:
+                self.pairs = await self.load()
+                self.shuffle()
+
+            if self.position >= len(self.pairs):
+                self.cycle += 1
+                logger.warning(f'All {len(self.pairs)} token names were used, starting to reuse them.')
+                self.shuffle()
+
+            pair = self.pairs[self.position]
+            self.position += self.shards_count
+            return pair
@@ -0,0 +1,46 @@
+import asyncio
+from typing import Optional
+
+from web3 import AsyncWeb3
+
+from src.models import Network
+from src.rpc_batcher import RpcBatcher
+
+
+class NonceManager:
+    _instances: dict = {}
+
+    def __init__(self, w3: AsyncWeb3, wallet_address: str):
+        self.batcher = RpcBatcher.for_w3(w3)
+        self.wallet_address = wallet_address
+        self._next_nonce: Optional[int] = None
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def for_wallet(cls, w3: AsyncWeb3, network: Network, wallet_address: str) -> 'NonceManager':
+        key = (network.chain_id, wallet_address)
+        manager = cls._instances.get(key)
+        if manager is None:
+            manager = cls(w3, wallet_address)
+            cls._instances[key] = manager
+        return manager
+
+    async def get_nonce(self) -> int:
+        async with self._lock:
+            if self._next_nonce is None:
+                self._next_nonce = await self.batcher.get_transaction_count(self.wallet_address)
+
+            nonce = self._next_nonce
+            self._next_nonce += 1
+            return nonce
+
+    async def release(self, nonce: int) -> bool:
+        async with self._lock:
+            if self._next_nonce == nonce + 1:
+                self._next_nonce = nonce
+                return False
+            return self._next_nonce is not None and nonce < self._next_nonce
+
+    async def resync(self) -> None:
+        async with self._lock:
+            self._next_nonce = None
@@ -0,0 +1,187 @@
+import asyncio
+from typing import Optional
+
+from loguru import logger
+
+from src.amounts import Amount
+from src.artifacts import ArtifactRegistry
+from src.fee_oracle import FeeOracle
+from src.key_registry import Signer
+from src.models import Network, ethereum_sepolia, ink_sepolia
+from src.provider_pool import ProviderPool
+from src.rpc_batcher import RpcBatcher
+from src.vars import ERC20_ABI, ERC20_BYTECODE, ERC721_ABI, ERC721_BYTECODE, BATCH_EXECUTOR_BYTECODE
+from config import BRIDGE_PARAMS, RANDOM_CONFIG, BATCH_EXECUTOR_PARAMS, PREFLIGHT_PARAMS
+
+
+GAS_PRICE_ORACLE = '0x420000000000000000000000000000000000000F'
+GET_L1_FEE_SELECTOR = '0x49948e0e'
+CALL_DATA_SIZE = 100
+
+BRIDGE_GAS = 120_000
+DEPLOY_GAS = {ERC721_BYTECODE: 2_000_000, ERC20_BYTECODE: 1_500_000, BATCH_EXECUTOR_BYTECODE: 120_000}
+DEPLOY_ABIS = {ERC721_BYTECODE: ERC721_ABI, ERC20_BYTECODE: ERC20_ABI}
+ESTIMATE_MARGIN = 1.1
+CALL_GAS = 100_000
+BATCH_CALL_GAS = 60_000
+DOMAIN_GAS = 250_000
+DOMAIN_MAX_VALUE = Amount.to_wei('0.00005')
+PRUNED = 'pruned'
+
+
+class WalletPlan:
+    def __init__(self, account_index: int, private_key, address: str, balance: int, other_balance: int, nonces: tuple, other_nonces: tuple, required: int):
+        self.account_index = account_index
+        self.private_key = private_key
+        self.address = address
+        self.balance = balance
+        self.other_balance = other_balance
+        self.nonce, self.pending_nonce = nonces
+        self.other_nonce, self.other_pending_nonce = other_nonces
+        self.required = required
+
+    @property
+    def pending_txs(self) -> int:
+        return self.pending_nonce - self.nonce
+
+    @property
+    def other_pending_txs(self) -> int:
+        return self.other_pending_nonce - self.other_nonce
+
+    @property
+    def status(self) -> str:
+        if self.balance < self.required:
+            return 'unfunded'
+        if self.pending_txs > 0:
+            return 'pending'
+        return 'ok'
+
+    def __str__(self):
+        return (f'Account {self.account_index+1} | {self.address} | {self.status}: balance {self.balance / 10 ** 18:.6f} ETH '
+                f'({self.other_balance / 10 ** 18:.6f} ETH in the other network), estimated cost {self.required / 10 ** 18:.6f} ETH, '
+                f'nonce {self.nonce}, {self.pending_txs} pending transactions ({self.other_pending_txs} in the other network)')
+
+
+class PreflightPlanner:
+    def __init__(self, choice: int, contracts_count: Optional[int] = None):
+        self.choice = choice
+        self.contracts_count = contracts_count or 1
+        self.deploy_gas = dict(DEPLOY_GAS)
+
+    @property
+    def network(self) -> Network:
+        return ethereum_sepolia if self.choice == 1 else ink_sepolia
+
+    @property
+    def other_network(self) -> Network:
+        return ink_sepolia if self.choice == 1 else ethereum_sepolia
+
+    def get_actions(self) -> list:
+        if self.choice == 1:
+            amount = BRIDGE_PARAMS['amount']
+            if isinstance(amount, tuple):
+                amount = max(amount)
+            value = max(amount or 0, BRIDGE_PARAMS['min_balance'] or 0)
+            return [(BRIDGE_GAS, None, Amount.to_wei(value))]
+
+        if self.choice == 5:
+            return [(DOMAIN_GAS, None, DOMAIN_MAX_VALUE)]
+
+        if self.choice == 4:
+            erc721_count = -(-sum(RANDOM_CONFIG['max_actions']['erc721_count']) // 2)
+            erc20_count = -(-sum(RANDOM_CONFIG['max_actions']['erc20_count']) // 2)
+            return self.get_contract_actions(ERC721_BYTECODE, erc721_count) + self.get_contract_actions(ERC20_BYTECODE, erc20_count) + [(DOMAIN_GAS, None, DOMAIN_MAX_VALUE)]
+
+        bytecode_path = ERC721_BYTECODE if self.choice == 2 else ERC20_BYTECODE
+        return self.get_contract_actions(bytecode_path, self.contracts_count)
+
+    def get_contract_actions(self, bytecode_path: str, contracts_count: int) -> list:
+        if not contracts_count:
+            return []
+
+        actions = [(self.deploy_gas[bytecode_path], bytecode_path, 0)] * contracts_count
+        if not BATCH_EXECUTOR_PARAMS['enabled']:
+            return actions + [(CALL_GAS, CALL_DATA_SIZE, 0)] * contracts_count
+
+        max_actions = BATCH_EXECUTOR_PARAMS['erc721_mints' if bytecode_path == ERC721_BYTECODE else 'erc20_actions'][1]
+        batch_gas = CALL_GAS + 2 * max_actions * BATCH_CALL_GAS
+        return actions + [(self.deploy_gas[BATCH_EXECUTOR_BYTECODE], BATCH_EXECUTOR_BYTECODE, 0)] + [(CALL_GAS, CALL_DATA_SIZE, 0), (batch_gas, CALL_DATA_SIZE, 0)] * contracts_count
+
+    async def estimate_deploy_gas(self, w3, address: str) -> None:
+        bytecode_paths = {2: [ERC721_BYTECODE], 3: [ERC20_BYTECODE], 4: [ERC721_BYTECODE, ERC20_BYTECODE]}.get(self.choice, [])
+
+        async def estimate(bytecode_path: str) -> None:
+            try:
+                contract = await ArtifactRegistry.get_contract(w3, DEPLOY_ABIS[bytecode_path], bytecode_path=bytecode_path)
+                self.deploy_gas[bytecode_path] = int(await contract.constructor('Preflight', 'PRE').estimate_gas({'from': address}) * ESTIMATE_MARGIN)
+            except Exception as e:
+                logger.debug(f'{self.network.name} | Failed to estimate deployment gas, using {DEPLOY_GAS[bytecode_path]}: {e}')
+
+        await asyncio.gather(*[estimate(bytecode_path) for bytecode_path in bytecode_paths])
+
+    async def get_required_amount(self, address: Optional[str] = None) -> int:
+        w3 = ProviderPool.get_shared_w3(self.network)
+        if address:
+            await self.estimate_deploy_gas(w3, address)
+        fee_params = await FeeOracle.for_network(self.network).get_fee_params()
+        gas_price = fee_params.get('maxFeePerGas') or fee_params['gasPrice']
+
+        actions = self.get_actions()
+        l1_fees = await asyncio.gather(*[self.get_l1_fee(w3, data) for _, data, _ in actions])
+        return int(sum(gas * gas_price + l1_fee for (gas, _, _), l1_fee in zip(actions, l1_fees)) * PREFLIGHT_PARAMS['margin']) + sum(value for _, _, value in actions)
+
+    async def get_l1_fee(self, w3, data) -> int:
+        if not self.network.op_stack or data is None:
+            return 0
+
+        data = bytes(await ArtifactRegistry.get_bytecode(data)) if isinstance(data, str) else b'\x01' * data
+        calldata = GET_L1_FEE_SELECTOR + (32).to_bytes(32, 'big').hex() + len(data).to_bytes(32, 'big').hex() + data.ljust(-(-len(data) // 32) * 32, b'\x00').hex()
+        try:
+            return int.from_bytes(await RpcBatcher.for_w3(w3).call(GAS_PRICE_ORACLE, calldata), 'big')
+        except Exception as e:
+            logger.debug(f'{self.network.name} | Failed to get L1 data fee: {e}')
+            return 0
+
+    async def plan(self, private_keys: list, account_indices: list) -> list:
+        addresses = [(key if isinstance(key, Signer) else Signer.for_key(key)).address for key in private_keys]
+
+        required, balances, other_balances, nonces, other_nonces = await asyncio.gather(
+            self.get_required_amount(addresses[0] if addresses else None),
+            RpcBatcher.get_balances(self.network, addresses),
+            RpcBatcher.get_balances(self.other_network, addresses),
+            self.get_nonces(self.network, addresses),
+            self.get_nonces(self.other_network, addresses)
+        )
+
+        return [
+            WalletPlan(account_index, private_key, address, balance, other_balance, wallet_nonces, wallet_other_nonces, required)
+            for account_index, private_key, address, balance, other_balance, wallet_nonces, wallet_other_nonces
+            in zip(account_indices, private_keys, addresses, balances, other_balances, nonces, other_nonces)
+        ]
+
+    @staticmethod
+    async def get_nonces(network: Network, addresses: list) -> list:
+        batcher = RpcBatcher.for_w3(ProviderPool.get_shared_w3(network))
+        latest, pending = await asyncio.gather(
+            asyncio.gather(*[batcher.get_transaction_count(address, 'latest') for address in addresses]),
+            RpcBatcher.get_transaction_counts(network, addresses)
+        )
+        return list(zip(latest, pending))
+
+    async def run(self, private_keys: list, account_indices: list) -> list:
+        wallet_plans = await self.plan(private_keys, account_indices)
+
+        ready = [wallet_plan for wallet_plan in wallet_plans if wallet_plan.status == 'ok']
+        pending = [wallet_plan for wallet_plan in wallet_plans if wallet_plan.status == 'pending']
+        unfunded = [wallet_plan for wallet_plan in wallet_plans if wallet_plan.status == 'unfunded']
+
+        for wallet_plan in pending + unfunded:
+            logger.warning(str(wallet_plan))
+
+        scheduled = ready + pending + (unfunded if PREFLIGHT_PARAMS['unfunded'] == 'last' else [])
+        required = wallet_plans[0].required if wallet_plans else 0
+        logger.info(f'Pre-flight plan in {self.network.name}: estimated cost {required / 10 ** 18:.6f} ETH per wallet, '
+                    f'{len(ready)} ready, {len(pending)} with pending transactions (moved to the end), '
+                    f'{len(unfunded)} unfunded ({"moved to the end" if PREFLIGHT_PARAMS["unfunded"] == "last" else "skipped"}), '
+                    f'{len(scheduled)}/{len(wallet_plans)} wallets scheduled.')
+        return scheduled
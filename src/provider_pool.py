@@ -0,0 +1,247 @@
+import asyncio
+import time
+from typing import Any, Optional
+
+import ujson
+from aiohttp import ClientConnectionError, ClientError, ClientResponseError, ClientSession, ClientTimeout, TCPConnector
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.providers.async_rpc import AsyncHTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+from src.models import Network
+from src.rate_limiter import EndpointLimiter
+from src.endpoint_router import EndpointRouter
+from src.rpc_metrics import RpcMetrics, THROTTLED_CODES
+from config import HTTP_PARAMS, RPC_LIMITS
+
+
+RETRY_STATUSES = (429, 502, 503, 504)
+INVALID_REQUEST_CODE = -32600
+
+
+class BatchNotSupportedError(ValueError):
+    pass
+
+
+def static_chain_id_middleware(chain_id: int):
+    async def middleware(make_request, w3: AsyncWeb3):
+        async def inner(method, params):
+            if method == 'eth_chainId':
+                return {'jsonrpc': '2.0', 'id': 0, 'result': chain_id}
+            return await make_request(method, params)
+        return inner
+    return middleware
+
+
+class PooledHTTPProvider(AsyncHTTPProvider):
+    _middlewares = ()
+
+    def __init__(self, endpoint_uris: list, proxy: Optional[str] = None):
+        super().__init__(endpoint_uri=endpoint_uris[0])
+        self.router = EndpointRouter.for_endpoints(endpoint_uris)
+        self.proxy = f'http://{proxy}' if proxy else None
+        self._background_tasks: set = set()
+
+    async def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        if method == 'eth_sendRawTransaction':
+            raw_response = await self.broadcast(request_data, (method,))
+        else:
+            raw_response = await self.route(request_data, (method,))
+        return self.decode_rpc_response(raw_response)
+
+    async def make_batch_request(self, calls: list) -> list:
+        request_ids = [next(self.request_counter) for _ in calls]
+        request_data = ujson.dumps([
+            {'jsonrpc': '2.0', 'method': method, 'params': params, 'id': request_id}
+            for request_id, (method, params) in zip(request_ids, calls)
+        ]).encode()
+        raw_response = ujson.loads(await self.route(request_data, tuple(method for method, _ in calls)))
+
+        if not isinstance(raw_response, list):
+            error = raw_response.get('error') or {}
+            if self._is_batch_not_supported(error):
+                raise BatchNotSupportedError(f'Batch request rejected by {self.endpoint_uri}: {error}')
+            raise ValueError(f'Batch request failed on {self.endpoint_uri}: {error or raw_response}')
+
+        responses = {response.get('id'): response for response in raw_response}
+        return [responses.get(request_id, {'error': {'message': 'Missing response in batch'}}) for request_id in request_ids]
+
+    async def route(self, request_data: bytes, methods: tuple) -> bytes:
+        self._schedule_health_checks()
+
+        candidates = self.router.get_candidates()
+        for index, endpoint_uri in enumerate(candidates):
+            is_last = index == len(candidates) - 1
+            try:
+                return await self._timed_post(endpoint_uri, request_data, methods, RPC_LIMITS['retries'] if is_last else 0)
+            except (ClientError, asyncio.TimeoutError) as e:
+                if is_last:
+                    raise
+                logger.debug(f'{endpoint_uri} | Request failed, trying next RPC: {e}')
+
+    async def broadcast(self, request_data: bytes, methods: tuple) -> bytes:
+        targets = self.router.get_broadcast_targets()
+        if len(targets) == 1:
+            return await self.route(request_data, methods)
+
+        tasks = [asyncio.create_task(self._timed_post(endpoint_uri, request_data, methods, RPC_LIMITS['retries'])) for endpoint_uri in targets]
+        for task in tasks:
+            self._keep_reference(task)
+
+        error_response, error = None, None
+        for next_response in asyncio.as_completed(tasks):
+            try:
+                raw_response = await next_response
+            except (ClientError, asyncio.TimeoutError) as e:
+                error = error or e
+                continue
+
+            if 'result' in ujson.loads(raw_response):
+                return raw_response
+            error_response = error_response or raw_response
+
+        if error_response is not None:
+            return error_response
+        raise error
+
+    async def _timed_post(self, endpoint_uri: str, request_data: bytes, methods: tuple, retries: int) -> bytes:
+        started_at = time.monotonic()
+        try:
+            raw_response = await self.post(endpoint_uri, request_data, methods, retries)
+        except (ClientError, asyncio.TimeoutError):
+            self.router.record_failure(endpoint_uri)
+            raise
+
+        self.router.record_success(endpoint_uri, time.monotonic() - started_at)
+        return raw_response
+
+    def _schedule_health_checks(self) -> None:
+        for endpoint_uri in self.router.get_due_for_health_check():
+            self._keep_reference(asyncio.create_task(self._health_check(endpoint_uri)))
+
+    async def _health_check(self, endpoint_uri: str) -> None:
+        try:
+            raw_response = await self.post(endpoint_uri, self.encode_rpc_request(RPCEndpoint('eth_blockNumber'), []), ('eth_blockNumber',), 0)
+            is_healthy = 'result' in ujson.loads(raw_response)
+        except Exception:
+            is_healthy = False
+        self.router.record_health_check(endpoint_uri, is_healthy)
+
+    def _keep_reference(self, task: asyncio.Task) -> None:
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def post(self, endpoint_uri: str, request_data: bytes, methods: tuple, retries: int) -> bytes:
+        limiter = EndpointLimiter.for_endpoint(endpoint_uri)
+
+        for attempt in range(retries + 1):
+            await limiter.acquire()
+            try:
+                raw_response = await self._post(endpoint_uri, request_data, methods)
+                if not self._is_throttled_response(raw_response):
+                    limiter.on_success()
+                    return raw_response
+                limiter.on_throttled()
+                if attempt == retries:
+                    return raw_response
+                retry_after = None
+
+            except ClientResponseError as e:
+                if e.status not in RETRY_STATUSES or attempt == retries:
+                    raise
+                if e.status == 429:
+                    limiter.on_throttled()
+                retry_after = self._get_retry_after(e)
+
+            except (asyncio.TimeoutError, ClientConnectionError):
+                if attempt == retries:
+                    raise
+                retry_after = None
+
+            delay = retry_after if retry_after is not None else limiter.get_backoff(attempt)
+            logger.debug(f'{endpoint_uri} | Request throttled or failed, retrying in {delay:.2f}s (attempt {attempt+1}/{retries})')
+            await asyncio.sleep(delay)
+
+    async def _post(self, endpoint_uri: str, request_data: bytes, methods: tuple) -> bytes:
+        session = ProviderPool.get_session(endpoint_uri)
+        started_at = time.monotonic()
+        try:
+            async with session.post(endpoint_uri, data=request_data, headers=self.get_request_headers(), proxy=self.proxy) as response:
+                response.raise_for_status()
+                raw_response = await response.read()
+        except (ClientError, asyncio.TimeoutError) as e:
+            RpcMetrics.record_failure(methods, endpoint_uri, self.proxy, time.monotonic() - started_at, e)
+            raise
+
+        RpcMetrics.record_response(methods, endpoint_uri, self.proxy, time.monotonic() - started_at, raw_response, request_data)
+        return raw_response
+
+    @staticmethod
+    def _is_throttled_response(raw_response: bytes) -> bool:
+        if b'"error"' not in raw_response[:200] or raw_response.startswith(b'['):
+            return False
+
+        error = ujson.loads(raw_response).get('error') or {}
+        message = str(error.get('message', '')).lower()
+        return error.get('code') in THROTTLED_CODES or 'rate limit' in message or 'too many requests' in message
+
+    @staticmethod
+    def _is_batch_not_supported(error: dict) -> bool:
+        message = str(error.get('message', '')).lower()
+        if error.get('code') in THROTTLED_CODES or 'rate limit' in message or 'too many requests' in message:
+            return False
+        return error.get('code') == INVALID_REQUEST_CODE or 'batch' in message
+
+    @staticmethod
+    def _get_retry_after(error: ClientResponseError) -> Optional[float]:
+        try:
+            return min(float(error.headers.get('Retry-After')), RPC_LIMITS['backoff_max'])
+        except (AttributeError, TypeError, ValueError):
+            return None
+
+
+class ProviderPool:
+    _sessions: dict = {}
+    _web3s: dict = {}
+    _shared_proxy: Optional[str] = None
+
+    @classmethod
+    def set_shared_proxy(cls, proxies: list) -> None:
+        proxy = HTTP_PARAMS['shared_proxy']
+        if proxy is None:
+            proxy = proxies[0] if proxies else None
+        cls._shared_proxy = proxy or None
+
+    @classmethod
+    def get_shared_w3(cls, network: Network) -> AsyncWeb3:
+        return cls.get_w3(network, cls._shared_proxy)
+
+    @classmethod
+    def get_w3(cls, network: Network, proxy: Optional[str] = None) -> AsyncWeb3:
+        key = (tuple(network.rpcs), proxy)
+        w3 = cls._web3s.get(key)
+        if w3 is None:
+            w3 = AsyncWeb3(PooledHTTPProvider(network.rpcs, proxy))
+            w3.middleware_onion.add(static_chain_id_middleware(network.chain_id), 'static_chain_id')
+            cls._web3s[key] = w3
+        return w3
+
+    @classmethod
+    def get_session(cls, endpoint_uri: str) -> ClientSession:
+        session = cls._sessions.get(endpoint_uri)
+        if session is None or session.closed:
+            session = ClientSession(
+                connector=TCPConnector(limit=HTTP_PARAMS['connections'], keepalive_timeout=HTTP_PARAMS['keepalive_timeout']),
+                timeout=ClientTimeout(total=HTTP_PARAMS['timeout'])
+            )
+            cls._sessions[endpoint_uri] = session
+        return session
+
+    @classmethod
+    async def close(cls) -> None:
+        for session in cls._sessions.values():
+            await session.close()
+        cls._sessions.clear()
@@ -1,15 +1,19 @@
 import random
+from functools import partial
 from typing import Optional
 
 from loguru import logger
 
+from src.action_graph import ActionGraph
 from src.client import Client
+from src.domain_assigner import DomainAssigner
 from src.erc_20 import ERC20Manager
 from src.erc_721 import ERC721Manager
+from src.name_generator import NameGenerator
 from src.register_domain import DomainManager
-from src.utils import Utils
+from src.state_store import StateStore
 from src.vars import NAMES_PATH, SYMBOLS_PATH, DOMAIN_NAMES_PATH
-from config import RANDOM_CONFIG
+from config import RANDOM_CONFIG, BATCH_EXECUTOR_PARAMS
 
 
 class RandomManager:
@@ -19,72 +23,103 @@ class RandomManager:
         self.domain_manager = DomainManager()
         
     @staticmethod
-    async def random_interactions(client_ink: Client, account_index: int, total_accounts: int) -> Optional[bool]:
+    async def random_interactions(client_ink: Client, account_index: int, total_accounts: int, state_store: StateStore) -> Optional[bool]:
         try:
             erc721_manager = ERC721Manager()
             erc20_manager = ERC20Manager()
             domain_manager = DomainManager()
 
-            erc721_count = random.randint(RANDOM_CONFIG['max_actions']['erc721_count'][0], RANDOM_CONFIG['max_actions']['erc721_count'][1])
-            erc20_count = random.randint(RANDOM_CONFIG['max_actions']['erc20_count'][0], RANDOM_CONFIG['max_actions']['erc20_count'][1])
+            async def make_plan() -> list:
+                return [
+                    random.randint(RANDOM_CONFIG['max_actions']['erc721_count'][0], RANDOM_CONFIG['max_actions']['erc721_count'][1]),
+                    random.randint(RANDOM_CONFIG['max_actions']['erc20_count'][0], RANDOM_CONFIG['max_actions']['erc20_count'][1])
+                ]
+
+            erc721_count, erc20_count = await state_store.run(client_ink, 'random_plan', make_plan)
             domain_count = 1
 
             logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Planning to deploy {erc721_count} ERC-721 contracts...')
             logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Planning to deploy {erc20_count} ERC-20 contracts...')
             logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Planning to register {domain_count} domains...')
         
-            for i in range(erc721_count):
-                name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
+            graph = ActionGraph(RANDOM_CONFIG['max_parallel_actions'])
+
+            async def deploy_erc721(i: int):
+                name, symbol = await NameGenerator.for_paths(NAMES_PATH, SYMBOLS_PATH).get_name_and_symbol()
                 logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Deploying ERC-721 contract {i+1}/{erc721_count}...')
             
-                contract_address = await erc721_manager.deploy_erc721(client_ink, name, symbol, account_index, is_first_tx=(i==0 and erc721_count > 0))
+                contract_address = await state_store.run(client_ink, f'random_erc721_deploy_{i}', lambda: erc721_manager.deploy_erc721(client_ink, name, symbol, account_index, is_first_tx=(i==0 and erc721_count > 0)), from_receipt=lambda receipt: receipt.contractAddress)
             
                 if isinstance(contract_address, Exception):
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Deploy {i+1} failed with error: {contract_address}.')
                 elif contract_address:
                     logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Deploy {i+1} completed successfully.')
+                return contract_address
 
-                    logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Starting mint for ERC-721 contract {i+1}.')
-                    mint_result = await erc721_manager.mint_nft(client_ink, contract_address, account_index)
-                
-                    if isinstance(mint_result, Exception):
-                        logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Mint {i+1} failed with error: {mint_result}.')
-                    else:
-                        logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Mint {i+1} completed successfully.')
-        
-            for i in range(erc20_count):
-                name, symbol = await Utils.get_random_name_and_symbol(NAMES_PATH, SYMBOLS_PATH)
+            async def mint_erc721(i: int, contract_address: str):
+                logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Starting mint for ERC-721 contract {i+1}.')
+                mint_result = await state_store.run(client_ink, f'random_erc721_mint_{i}', lambda: (erc721_manager.batch_interact if BATCH_EXECUTOR_PARAMS['enabled'] else erc721_manager.mint_nft)(client_ink, contract_address, account_index))
+            
+                if isinstance(mint_result, Exception):
+                    logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Mint {i+1} failed with error: {mint_result}.')
+                else:
+                    logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-721 Mint {i+1} completed successfully.')
+                return mint_result
+
+            async def deploy_erc20(i: int):
+                name, symbol = await NameGenerator.for_paths(NAMES_PATH, SYMBOLS_PATH).get_name_and_symbol()
                 logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Deploying ERC-20 contract {i+1}/{erc20_count}...')
             
-                contract_address = await erc20_manager.deploy_erc20(client_ink, name, symbol, account_index, is_first_tx=(i==0 and erc721_count == 0))
+                contract_address = await state_store.run(client_ink, f'random_erc20_deploy_{i}', lambda: erc20_manager.deploy_erc20(client_ink, name, symbol, account_index, is_first_tx=(i==0 and erc721_count == 0)), from_receipt=lambda receipt: receipt.contractAddress)
             
                 if isinstance(contract_address, Exception):
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Deploy {i+1} failed with error: {contract_address}.')
                 elif contract_address:
                     logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Deploy {i+1} completed successfully.')
+                return contract_address
 
-                    logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Starting interaction with ERC-20 contract {i+1}...')
-                    interact_result = await erc20_manager.interact_with_contract(client_ink, contract_address, account_index)
-                
-                    if isinstance(interact_result, Exception):
-                        logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Interaction {i+1} failed with error: {interact_result}.')
-                    else:
-                        logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Interaction {i+1} completed successfully.')
+            async def interact_erc20(i: int, contract_address: str):
+                logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Starting interaction with ERC-20 contract {i+1}...')
+                interact_result = await state_store.run(client_ink, f'random_erc20_interact_{i}', lambda: (erc20_manager.batch_interact if BATCH_EXECUTOR_PARAMS['enabled'] else erc20_manager.interact_with_contract)(client_ink, contract_address, account_index))
+            
+                if isinstance(interact_result, Exception):
+                    logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Interaction {i+1} failed with error: {interact_result}.')
+                else:
+                    logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | ERC-20 Interaction {i+1} completed successfully.')
+                return interact_result
 
-            for i in range(domain_count):
-                domain_name = await Utils.get_domain_name(DOMAIN_NAMES_PATH, account_index, total_accounts)
+            async def register_domain(i: int):
+                domain_name = await DomainAssigner.for_path(DOMAIN_NAMES_PATH).get_name(account_index, total_accounts)
                 logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Registering domain {i+1}/{domain_count}: {domain_name}...')
             
-                result = await domain_manager.register_domain(client_ink, domain_name, account_index)
+                result = await state_store.run(client_ink, 'domain', lambda: domain_manager.register_domain(client_ink, domain_name, account_index))
             
                 if isinstance(result, Exception):
                     logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Domain Registration {i+1} failed with error: {result}.')
                 else:
                     logger.success(f'Account {account_index+1} | {client_ink.wallet_address} | Domain Registration {i+1} completed successfully.')
+                return result
+
+            for i in range(erc721_count):
+                deploy = graph.add(f'erc721_deploy_{i}', partial(deploy_erc721, i))
+                graph.add(f'erc721_mint_{i}', partial(mint_erc721, i), parents=(deploy,))
+
+            for i in range(erc20_count):
+                deploy = graph.add(f'erc20_deploy_{i}', partial(deploy_erc20, i))
+                graph.add(f'erc20_interact_{i}', partial(interact_erc20, i), parents=(deploy,))
+
+            for i in range(domain_count):
+                graph.add(f'domain_{i}', partial(register_domain, i))
+
+            logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Running {len(graph.nodes)} actions, up to {graph.max_in_flight or len(graph.nodes)} at once, critical path of {graph.get_critical_path()} actions...')
+            await graph.run()
 
-            return True
+            errors = graph.get_errors()
+            for name, error in errors.items():
+                logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Action {name} failed with error: {error}.')
+            return False if errors else True
 
         except Exception as e:
             logger.error(f'Account {account_index+1} | Error during random interactions: {e}')
-            return None
+            return False
         
\ No newline at end of file
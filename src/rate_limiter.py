@@ -0,0 +1,59 @@
+import asyncio
+import random
+import time
+
+from config import RPC_LIMITS
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float = 1):
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: float = 1) -> None:
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                await asyncio.sleep((tokens - self._tokens) / self.rate)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class EndpointLimiter:
+    _instances: dict = {}
+
+    def __init__(self, rps: float, burst: float):
+        self.max_rate = rps
+        self.bucket = TokenBucket(rps, burst)
+
+    @classmethod
+    def for_endpoint(cls, endpoint_uri: str) -> 'EndpointLimiter':
+        limiter = cls._instances.get(endpoint_uri)
+        if limiter is None:
+            limits = RPC_LIMITS['endpoints'].get(endpoint_uri, {})
+            limiter = cls(limits.get('rps', RPC_LIMITS['rps']), limits.get('burst', RPC_LIMITS['burst']))
+            cls._instances[endpoint_uri] = limiter
+        return limiter
+
+    async def acquire(self) -> None:
+        await self.bucket.acquire()
+
+    def on_success(self) -> None:
+        if self.bucket.rate < self.max_rate:
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + self.max_rate * 0.05)
+
+    def on_throttled(self) -> None:
+        self.bucket.rate = max(self.max_rate * 0.05, self.bucket.rate / 2)
+
+    @staticmethod
+    def get_backoff(attempt: int) -> float:
+        return random.uniform(0, min(RPC_LIMITS['backoff_max'], RPC_LIMITS['backoff_base'] * 2 ** attempt))
@@ -0,0 +1,123 @@
+import asyncio
+from typing import Union
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+from web3.datastructures import AttributeDict
+from web3.exceptions import TransactionNotFound
+from web3.types import RPCEndpoint
+from web3._utils.method_formatters import receipt_formatter
+
+from src.models import Network
+from src.provider_pool import ProviderPool
+
+
+STRAGGLER_POLLS = 5
+METHOD_NOT_FOUND_CODE = -32601
+METHOD_NOT_FOUND_MESSAGES = ('does not exist', 'not available', 'not found', 'not supported', 'unsupported')
+
+
+class ReceiptWatcher:
+    _instances: dict = {}
+
+    def __init__(self, w3: AsyncWeb3, network: Network):
+        self.w3 = w3
+        self.network = network
+        self._pending: dict = {}
+        self._last_block = None
+        self._task = None
+        self._block_receipts_supported = True
+
+    @classmethod
+    def for_network(cls, network: Network) -> 'ReceiptWatcher':
+        watcher = cls._instances.get(network.chain_id)
+        if watcher is None:
+            watcher = cls(ProviderPool.get_shared_w3(network), network)
+            cls._instances[network.chain_id] = watcher
+        return watcher
+
+    async def wait_for_receipt(self, tx_hash: Union[str, bytes], timeout: float = 200) -> AttributeDict:
+        tx_hash = HexBytes(tx_hash).hex()
+
+        if tx_hash not in self._pending:
+            self._pending[tx_hash] = [asyncio.get_running_loop().create_future(), 0]
+        future = self._pending[tx_hash][0]
+
+        if self._task is None or self._task.done():
+            self._last_block = None
+            self._task = asyncio.create_task(self._run())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'Transaction {tx_hash} is not in the chain after {timeout} seconds')
+        finally:
+            if not future.done():
+                self._pending.pop(tx_hash, None)
+
+    async def _run(self) -> None:
+        while self._pending:
+            try:
+                await self._poll()
+            except Exception as e:
+                logger.debug(f'{self.network.name} | Receipt watcher error: {e}')
+
+            await asyncio.sleep(self.network.block_time)
+
+    async def _poll(self) -> None:
+        latest_block = await self.w3.eth.block_number
+        if self._last_block is None:
+            self._last_block = latest_block - 1
+
+        for block_number in range(self._last_block + 1, latest_block + 1):
+            if not self._pending:
+                break
+            await self._scan_block(block_number)
+        self._last_block = max(self._last_block, latest_block)
+
+        await self._check_stragglers()
+
+    async def _scan_block(self, block_number: int) -> None:
+        if self._block_receipts_supported:
+            try:
+                receipts = await self.w3.manager.coro_request(RPCEndpoint('eth_getBlockReceipts'), [hex(block_number)])
+                for receipt in receipts or []:
+                    self._resolve(AttributeDict.recursive(receipt_formatter(receipt)))
+                return
+
+            except Exception as e:
+                if not self.is_method_not_found(e):
+                    raise
+                logger.debug(f'{self.network.name} | eth_getBlockReceipts is not available, scanning blocks instead: {e}')
+                self._block_receipts_supported = False
+
+        block = await self.w3.eth.get_block(block_number)
+        for tx_hash in block['transactions']:
+            if HexBytes(tx_hash).hex() in self._pending:
+                self._resolve(await self.w3.eth.get_transaction_receipt(tx_hash))
+
+    @staticmethod
+    def is_method_not_found(error: Exception) -> bool:
+        details = error.args[0] if error.args and isinstance(error.args[0], dict) else {}
+        if details.get('code') == METHOD_NOT_FOUND_CODE:
+            return True
+        message = str(details.get('message', error)).lower()
+        return 'method' in message and any(text in message for text in METHOD_NOT_FOUND_MESSAGES)
+
+    async def _check_stragglers(self) -> None:
+        for tx_hash, entry in list(self._pending.items()):
+            entry[1] += 1
+            if entry[1] < STRAGGLER_POLLS:
+                continue
+
+            entry[1] = 0
+            try:
+                self._resolve(await self.w3.eth.get_transaction_receipt(tx_hash))
+            except TransactionNotFound:
+                continue
+
+    def _resolve(self, receipt: AttributeDict) -> None:
+        entry = self._pending.pop(HexBytes(receipt['transactionHash']).hex(), None)
+        if entry and not entry[0].done():
+            entry[0].set_result(receipt)
@@ -1,15 +1,15 @@
 import random
-from typing import Optional
 
 from loguru import logger
 
 from src.client import Client
+from src.domain_assigner import DOMAIN_REGISTRY
 from src.vars import DOMAIN_ABI
 
 
 class DomainManager:
     @staticmethod
-    async def register_domain(client_ink: Client, domain_name: str, account_index: int) -> Optional[bool]:
+    async def register_domain(client_ink: Client, domain_name: str, account_index: int) -> bool:
         try:
             logger.info(f'Account {account_index+1} | {client_ink.wallet_address} | Attempting to register domain name "{domain_name}.ink"...')
             
@@ -17,18 +17,18 @@ class DomainManager:
             value = int((0.000005 * expiries) * 10 ** 18)
             
             if type(domain_name) != str:
-                logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Domain name should be type(str): {e}.')
-                return None
+                logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Domain name should be type(str), got {type(domain_name).__name__}.')
+                return False
             
             return await client_ink._register_domain(
                 domain_name=domain_name,
                 expiries=expiries,
-                contract_address='0xf180136DdC9e4F8c9b5A9FE59e2b1f07265C5D4D',
+                contract_address=DOMAIN_REGISTRY,
                 abi_path=DOMAIN_ABI,
                 value=value
             )
         
         except Exception as e:
             logger.error(f'Account {account_index+1} | {client_ink.wallet_address} | Error during registering domain: {e}.')
-            return None
+            return False
         
\ No newline at end of file
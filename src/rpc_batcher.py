@@ -0,0 +1,114 @@
+import asyncio
+from typing import Any
+
+from hexbytes import HexBytes
+from loguru import logger
+from web3 import AsyncWeb3
+
+from src.models import Network
+from src.provider_pool import ProviderPool, BatchNotSupportedError
+from src.rate_limiter import EndpointLimiter
+from config import BATCH_PARAMS
+
+
+BATCH_RETRIES = 2
+
+
+class RpcBatcher:
+    _instances: dict = {}
+
+    def __init__(self, w3: AsyncWeb3):
+        self.provider = w3.provider
+        self._queue: list = []
+        self._flush_handle = None
+        self._tasks: set = set()
+        self._batch_supported = True
+
+    @classmethod
+    def for_w3(cls, w3: AsyncWeb3) -> 'RpcBatcher':
+        batcher = cls._instances.get(w3.provider)
+        if batcher is None:
+            batcher = cls(w3)
+            cls._instances[w3.provider] = batcher
+        return batcher
+
+    @classmethod
+    async def get_balances(cls, network: Network, addresses: list) -> list:
+        batcher = cls.for_w3(ProviderPool.get_shared_w3(network))
+        return await asyncio.gather(*[batcher.get_balance(address) for address in addresses])
+
+    @classmethod
+    async def get_transaction_counts(cls, network: Network, addresses: list) -> list:
+        batcher = cls.for_w3(ProviderPool.get_shared_w3(network))
+        return await asyncio.gather(*[batcher.get_transaction_count(address) for address in addresses])
+
+    async def get_balance(self, address: str, block: str = 'latest') -> int:
+        return int(await self.request('eth_getBalance', [address, block]), 16)
+
+    async def get_transaction_count(self, address: str, block: str = 'pending') -> int:
+        return int(await self.request('eth_getTransactionCount', [address, block]), 16)
+
+    async def get_code(self, address: str, block: str = 'latest') -> HexBytes:
+        return HexBytes(await self.request('eth_getCode', [address, block]))
+
+    async def call(self, to_: str, data: str, block: str = 'latest') -> HexBytes:
+        return HexBytes(await self.request('eth_call', [{'to': to_, 'data': data}, block]))
+
+    async def request(self, method: str, params: list) -> Any:
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((method, params, future))
+
+        if len(self._queue) >= BATCH_PARAMS['max_size']:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(BATCH_PARAMS['window'], self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._queue = self._queue, []
+        if batch:
+            task = asyncio.create_task(self._send(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, batch: list) -> None:
+        try:
+            if self._batch_supported and len(batch) > 1:
+                responses = await self._send_batch(batch)
+            else:
+                responses = await asyncio.gather(*[self.provider.make_request(method, params) for method, params, _ in batch])
+
+        except Exception as e:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (method, _, future), response in zip(batch, responses):
+            if future.done():
+                continue
+            if 'error' in response:
+                future.set_exception(ValueError(f'{method} failed: {response["error"]}'))
+            else:
+                future.set_result(response['result'])
+
+    async def _send_batch(self, batch: list) -> list:
+        calls = [(method, params) for method, params, _ in batch]
+        for attempt in range(BATCH_RETRIES + 1):
+            try:
+                return await self.provider.make_batch_request(calls)
+            except BatchNotSupportedError as e:
+                logger.debug(f'{self.provider.endpoint_uri} | JSON-RPC batching is not supported, sending requests one by one: {e}')
+                self._batch_supported = False
+                return await asyncio.gather(*[self.provider.make_request(method, params) for method, params in calls])
+            except ValueError as e:
+                if attempt == BATCH_RETRIES:
+                    raise
+                delay = EndpointLimiter.get_backoff(attempt)
+                logger.debug(f'{self.provider.endpoint_uri} | Batch request failed, retrying in {delay:.2f}s: {e}')
+                await asyncio.sleep(delay)
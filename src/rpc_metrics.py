@@ -0,0 +1,299 @@
+import asyncio
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Optional
+from urllib.parse import urlparse
+
+import aiofiles
+import ujson
+from aiohttp import ClientConnectionError, ClientResponseError, web
+from loguru import logger
+
+from src.loop_monitor import LoopLagMonitor
+from src.state_store import current_task
+from src.vars import METRICS_PATH
+from config import METRICS_PARAMS
+
+
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+THROTTLED_CODES = (429, -32005, -32029)
+
+
+class MethodStats:
+    def __init__(self):
+        self.calls = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.errors = defaultdict(int)
+
+    def observe(self, latency: float, error: Optional[str] = None) -> None:
+        self.calls += 1
+        self.total_time += latency
+        self.max_time = max(self.max_time, latency)
+        self.buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+        if error:
+            self.errors[error] += 1
+
+    def merge(self, other: 'MethodStats') -> None:
+        self.calls += other.calls
+        self.total_time += other.total_time
+        self.max_time = max(self.max_time, other.max_time)
+        self.buckets = [count + other_count for count, other_count in zip(self.buckets, other.buckets)]
+        for category, count in other.errors.items():
+            self.errors[category] += count
+
+    def get_percentile(self, percentile: float) -> float:
+        if not self.calls:
+            return 0.0
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= self.calls * percentile:
+                return min(LATENCY_BUCKETS[index], self.max_time) if index < len(LATENCY_BUCKETS) else self.max_time
+        return self.max_time
+
+    def to_dict(self) -> dict:
+        return {
+            'calls': self.calls,
+            'total_time': round(self.total_time, 3),
+            'p50': self.get_percentile(0.5),
+            'p95': self.get_percentile(0.95),
+            'max': round(self.max_time, 3),
+            'errors': dict(self.errors)
+        }
+
+
+class RpcMetrics:
+    methods: dict = defaultdict(MethodStats)
+    wallets: dict = defaultdict(MethodStats)
+    _runner: Optional[web.AppRunner] = None
+    _dump_task: Optional[asyncio.Task] = None
+    loop_monitor: Optional[LoopLagMonitor] = None
+
+    @classmethod
+    def record_response(cls, methods: tuple, endpoint_uri: str, proxy: Optional[str], latency: float, raw_response: bytes, request_data: bytes) -> None:
+        errors = {}
+        if b'"error"' in raw_response:
+            response = ujson.loads(raw_response)
+            if isinstance(response, list):
+                request_methods = {call.get('id'): call.get('method') for call in ujson.loads(request_data)}
+                for item in response:
+                    if item.get('error'):
+                        errors.setdefault(request_methods.get(item.get('id')), []).append(cls.get_rpc_error_category(item['error']))
+            elif response.get('error'):
+                errors[methods[0]] = [cls.get_rpc_error_category(response['error'])]
+
+        for method in methods:
+            method_errors = errors.get(method)
+            cls._observe(method, endpoint_uri, proxy, latency, method_errors.pop() if method_errors else None, len(methods) > 1)
+
+    @classmethod
+    def record_failure(cls, methods: tuple, endpoint_uri: str, proxy: Optional[str], latency: float, error: Exception) -> None:
+        category = cls.get_transport_error_category(error)
+        for method in methods:
+            cls._observe(method, endpoint_uri, proxy, latency, category, len(methods) > 1)
+
+    @classmethod
+    def _observe(cls, method: str, endpoint_uri: str, proxy: Optional[str], latency: float, error: Optional[str], is_batch: bool) -> None:
+        cls.methods[(method, cls.get_endpoint_label(endpoint_uri), cls.get_proxy_label(proxy))].observe(latency, error)
+
+        task = current_task.get()
+        wallet = '(batch)' if is_batch else task[1] if task else '-'
+        cls.wallets[wallet].observe(latency, error)
+
+    @staticmethod
+    def get_rpc_error_category(error: dict) -> str:
+        message = str(error.get('message', '')).lower()
+        if error.get('code') in THROTTLED_CODES or 'rate limit' in message or 'too many requests' in message:
+            return 'throttled'
+        if 'revert' in message:
+            return 'reverted'
+        if 'already known' in message:
+            return 'already_known'
+        if 'nonce' in message:
+            return 'nonce'
+        if 'underpriced' in message or 'fee too low' in message:
+            return 'underpriced'
+        if 'insufficient funds' in message:
+            return 'insufficient_funds'
+        return 'rpc_error'
+
+    @staticmethod
+    def get_transport_error_category(error: Exception) -> str:
+        if isinstance(error, ClientResponseError):
+            return 'http_429' if error.status == 429 else f'http_{error.status // 100}xx'
+        if isinstance(error, asyncio.TimeoutError):
+            return 'timeout'
+        if isinstance(error, ClientConnectionError):
+            return 'connection'
+        return 'client_error'
+
+    @staticmethod
+    def get_endpoint_label(endpoint_uri: str) -> str:
+        return urlparse(endpoint_uri).netloc or endpoint_uri
+
+    @staticmethod
+    def get_proxy_label(proxy: Optional[str]) -> str:
+        return proxy.rsplit('@', 1)[-1].split('://')[-1] if proxy else 'direct'
+
+    @classmethod
+    def merge(cls, methods: dict, wallets: dict) -> None:
+        for key, stats in methods.items():
+            cls.methods[key].merge(stats)
+        for wallet, stats in wallets.items():
+            cls.wallets[wallet].merge(stats)
+
+    @classmethod
+    def get_method_totals(cls) -> dict:
+        totals = defaultdict(MethodStats)
+        for (method, _, _), stats in cls.methods.items():
+            totals[method].merge(stats)
+        return dict(sorted(totals.items(), key=lambda item: item[1].total_time, reverse=True))
+
+    @classmethod
+    def to_dict(cls) -> dict:
+        return {
+            'generated_at': time.time(),
+            'methods': [
+                {'method': method, 'endpoint': endpoint, 'proxy': proxy, **stats.to_dict()}
+                for (method, endpoint, proxy), stats in cls.methods.items()
+            ],
+            'wallets': {wallet: stats.to_dict() for wallet, stats in cls.wallets.items()},
+            'event_loop_lag': {
+                'p50': cls.loop_monitor.get_percentile(0.5),
+                'p99': cls.loop_monitor.get_percentile(0.99),
+                'max': cls.loop_monitor.max_lag
+            } if cls.loop_monitor else None
+        }
+
+    @classmethod
+    def to_prometheus(cls) -> str:
+        lines = [
+            '# HELP rpc_requests_total JSON-RPC calls by method, endpoint and proxy.',
+            '# TYPE rpc_requests_total counter'
+        ]
+        for (method, endpoint, proxy), stats in cls.methods.items():
+            lines.append(f'rpc_requests_total{{method="{method}",endpoint="{endpoint}",proxy="{proxy}"}} {stats.calls}')
+
+        lines += [
+            '# HELP rpc_request_duration_seconds JSON-RPC round trip time by method, endpoint and proxy.',
+            '# TYPE rpc_request_duration_seconds histogram'
+        ]
+        for (method, endpoint, proxy), stats in cls.methods.items():
+            labels = f'method="{method}",endpoint="{endpoint}",proxy="{proxy}"'
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + ('+Inf',), stats.buckets):
+                cumulative += count
+                lines.append(f'rpc_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'rpc_request_duration_seconds_sum{{{labels}}} {stats.total_time}')
+            lines.append(f'rpc_request_duration_seconds_count{{{labels}}} {stats.calls}')
+
+        lines += [
+            '# HELP rpc_errors_total Failed JSON-RPC calls by method, endpoint, proxy and error category.',
+            '# TYPE rpc_errors_total counter'
+        ]
+        for (method, endpoint, proxy), stats in cls.methods.items():
+            for category, count in stats.errors.items():
+                lines.append(f'rpc_errors_total{{method="{method}",endpoint="{endpoint}",proxy="{proxy}",category="{category}"}} {count}')
+
+        lines += [
+            '# HELP rpc_wallet_requests_total JSON-RPC calls by wallet.',
+            '# TYPE rpc_wallet_requests_total counter'
+        ]
+        for wallet, stats in cls.wallets.items():
+            lines.append(f'rpc_wallet_requests_total{{wallet="{wallet}"}} {stats.calls}')
+
+        lines += [
+            '# HELP rpc_wallet_request_seconds_total JSON-RPC round trip time by wallet.',
+            '# TYPE rpc_wallet_request_seconds_total counter'
+        ]
+        for wallet, stats in cls.wallets.items():
+            lines.append(f'rpc_wallet_request_seconds_total{{wallet="{wallet}"}} {stats.total_time}')
+
+        if cls.loop_monitor:
+            lines += [
+                '# HELP event_loop_lag_seconds How late the event loop wakes up a sleeping task.',
+                '# TYPE event_loop_lag_seconds summary',
+                f'event_loop_lag_seconds{{quantile="0.5"}} {cls.loop_monitor.get_percentile(0.5)}',
+                f'event_loop_lag_seconds{{quantile="0.99"}} {cls.loop_monitor.get_percentile(0.99)}',
+                f'event_loop_lag_seconds{{quantile="1"}} {cls.loop_monitor.max_lag}'
+            ]
+
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def get_summary(cls) -> str:
+        totals = cls.get_method_totals()
+        total_time = sum(stats.total_time for stats in totals.values()) or 1
+        rows = [('method', 'calls', 'errors', 'total s', 'share', 'avg ms', 'p50 ms', 'p95 ms')]
+        for method, stats in totals.items():
+            rows.append((
+                method,
+                str(stats.calls),
+                str(sum(stats.errors.values())),
+                f'{stats.total_time:.2f}',
+                f'{stats.total_time / total_time:.0%}',
+                f'{stats.total_time / stats.calls * 1000:.0f}',
+                f'<={stats.get_percentile(0.5) * 1000:.0f}',
+                f'<={stats.get_percentile(0.95) * 1000:.0f}'
+            ))
+
+        widths = [max(len(row[column]) for row in rows) for column in range(len(rows[0]))]
+        return '\n'.join('  '.join(value.ljust(width) for value, width in zip(row, widths)) for row in rows)
+
+    @classmethod
+    async def start(cls) -> None:
+        if METRICS_PARAMS['port']:
+            app = web.Application()
+            app.router.add_get('/metrics', cls._handle_metrics)
+            cls._runner = web.AppRunner(app, access_log=None)
+            await cls._runner.setup()
+            await web.TCPSite(cls._runner, METRICS_PARAMS['host'], METRICS_PARAMS['port']).start()
+            logger.info(f'RPC metrics available at http://{METRICS_PARAMS["host"]}:{METRICS_PARAMS["port"]}/metrics')
+
+        if METRICS_PARAMS['dump_interval']:
+            cls._dump_task = asyncio.create_task(cls._dump_periodically())
+
+        if METRICS_PARAMS['loop_lag_interval']:
+            cls.loop_monitor = LoopLagMonitor(METRICS_PARAMS['loop_lag_interval'])
+            cls.loop_monitor.start()
+
+    @classmethod
+    async def stop(cls) -> None:
+        if cls.loop_monitor:
+            cls.loop_monitor.stop()
+
+        if cls._dump_task:
+            cls._dump_task.cancel()
+            cls._dump_task = None
+            await cls.dump()
+
+        if cls._runner:
+            await cls._runner.cleanup()
+            cls._runner = None
+
+        if METRICS_PARAMS['summary'] and cls.methods:
+            logger.info(f'RPC summary:\n{cls.get_summary()}')
+
+        if METRICS_PARAMS['summary'] and cls.loop_monitor:
+            logger.info(f'Event loop lag: {cls.loop_monitor}')
+
+    @classmethod
+    async def dump(cls, path: str = METRICS_PATH) -> None:
+        async with aiofiles.open(path, 'w') as f:
+            await f.write(ujson.dumps(cls.to_dict(), indent=2))
+
+    @classmethod
+    async def _dump_periodically(cls) -> None:
+        while True:
+            await asyncio.sleep(METRICS_PARAMS['dump_interval'])
+            try:
+                await cls.dump()
+            except OSError as e:
+                logger.warning(f'Failed to write RPC metrics to {METRICS_PATH}: {e}')
+
+    @classmethod
+    async def _handle_metrics(cls, request: web.Request) -> web.Response:
+        return web.Response(text=cls.to_prometheus(), content_type='text/plain', charset='utf-8')
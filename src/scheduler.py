@@ -0,0 +1,107 @@
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, Optional
+
+from loguru import logger
+
+from src.rate_limiter import TokenBucket
+from config import DELAY_BETWEEN_ACC, SCHEDULER_PARAMS
+
+
+class RunSummary:
+    def __init__(self, total: int):
+        self.total = total
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.cancelled = 0
+        self.durations: list = []
+        self.started_at = time.monotonic()
+        self.finished_at: Optional[float] = None
+
+    @property
+    def not_started(self) -> int:
+        return self.total - self.completed - self.failed - self.timed_out - self.cancelled
+
+    def __str__(self):
+        elapsed = (self.finished_at or time.monotonic()) - self.started_at
+        average = sum(self.durations) / len(self.durations) if self.durations else 0
+        return (f'{self.completed}/{self.total} accounts completed, {self.failed} failed, {self.timed_out} timed out, '
+                f'{self.cancelled} cancelled, {self.not_started} not started in {elapsed:.1f}s '
+                f'(average {average:.1f}s, max {max(self.durations, default=0):.1f}s per account)')
+
+
+class AccountScheduler:
+    def __init__(self, max_in_flight: Optional[int] = None, start_rate: Optional[float] = None, task_timeout: Optional[float] = None):
+        self.max_in_flight = max_in_flight or SCHEDULER_PARAMS['max_in_flight']
+        self.start_rate = start_rate if start_rate is not None else SCHEDULER_PARAMS['start_rate']
+        self.task_timeout = task_timeout if task_timeout is not None else SCHEDULER_PARAMS['task_timeout']
+        self.summary: Optional[RunSummary] = None
+
+    async def run(self, jobs: list) -> list:
+        self.summary = RunSummary(len(jobs))
+        results = [None] * len(jobs)
+        pending = iter(range(len(jobs)))
+
+        start_limiter = TokenBucket(self.start_rate) if self.start_rate else None
+        start_lock = asyncio.Lock()
+        next_start = [0.0]
+
+        async def wait_for_start_slot() -> None:
+            if start_limiter:
+                await start_limiter.acquire()
+                return
+
+            async with start_lock:
+                delay = next_start[0] - time.monotonic()
+                if delay > 0:
+                    logger.info(f'Waiting {delay:.0f} seconds before starting next account...')
+                    await asyncio.sleep(delay)
+                next_start[0] = time.monotonic() + random.randint(DELAY_BETWEEN_ACC[0], DELAY_BETWEEN_ACC[1])
+
+        async def worker() -> None:
+            for index in pending:
+                await wait_for_start_slot()
+                results[index] = await self._run_job(jobs[index])
+
+        workers = [asyncio.create_task(worker()) for _ in range(min(self.max_in_flight, len(jobs)))]
+        try:
+            await asyncio.gather(*workers)
+        except asyncio.CancelledError:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            logger.warning('Run interrupted, remaining accounts were cancelled.')
+            raise
+        finally:
+            self.summary.finished_at = time.monotonic()
+            logger.info(f'Run summary: {self.summary}')
+
+        return results
+
+    async def _run_job(self, job: Callable[[], Awaitable]):
+        started_at = time.monotonic()
+        try:
+            result = await asyncio.wait_for(job(), self.task_timeout)
+            if result is not None and result is not False and not isinstance(result, BaseException):
+                self.summary.completed += 1
+            else:
+                self.summary.failed += 1
+            return result
+
+        except asyncio.TimeoutError:
+            self.summary.timed_out += 1
+            logger.error(f'Account task timed out after {self.task_timeout} seconds.')
+            return TimeoutError(f'Account task timed out after {self.task_timeout} seconds')
+
+        except asyncio.CancelledError:
+            self.summary.cancelled += 1
+            raise
+
+        except Exception as e:
+            self.summary.failed += 1
+            return e
+
+        finally:
+            self.summary.durations.append(time.monotonic() - started_at)
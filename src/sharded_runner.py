@@ -0,0 +1,194 @@
+import asyncio
+import math
+import multiprocessing
+import random
+import signal
+import time
+from queue import Empty
+from typing import Optional
+
+from loguru import logger
+
+
+QUEUE_POLL_INTERVAL = 0.5
+STOP_POLL_INTERVAL = 0.5
+FORWARDED_FIELDS = ('account', 'address', 'network', 'action', 'tx_hash', 'duration', 'status')
+
+
+def forward_logs(queue):
+    def sink(message) -> None:
+        record = message.record
+        extra = {field: record['extra'][field] for field in FORWARDED_FIELDS if field in record['extra']}
+        queue.put(('log', record['level'].name, record['message'], record['name'], record['function'], record['line'], extra))
+    return sink
+
+
+def run_shard(shard_index: int, shards_count: int, choice: int, keys: list, account_indices: list, total_accounts: int, proxies: list,
+              contracts_count: Optional[int], max_concurrency: Optional[int], state_path: str, resume: bool, config_path: Optional[str], seed: int, queue, stop_event) -> None:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if config_path:
+        from cli import load_config
+        load_config(config_path)
+
+    from config import LOG_PARAMS, SCHEDULER_PARAMS, TOKEN_NAMES_PARAMS
+    if SCHEDULER_PARAMS['start_rate']:
+        SCHEDULER_PARAMS['start_rate'] = SCHEDULER_PARAMS['start_rate'] / shards_count
+    TOKEN_NAMES_PARAMS['seed'] = seed
+
+    from src.name_generator import NameGenerator
+    NameGenerator.set_shard(shard_index, shards_count)
+
+    logger.remove()
+    logger.add(forward_logs(queue), level=min(logger.level(LOG_PARAMS['level']).no, logger.level(LOG_PARAMS['console_level']).no), format='{message}')
+
+    try:
+        asyncio.run(run_shard_async(shard_index, choice, keys, account_indices, total_accounts, proxies, contracts_count, max_concurrency, state_path, resume, queue, stop_event))
+    except Exception as e:
+        logger.exception(f'Shard {shard_index+1} | Failed: {e}')
+        queue.put(('error', shard_index, repr(e)))
+
+
+async def run_shard_async(shard_index: int, choice: int, keys: list, account_indices: list, total_accounts: int, proxies: list,
+                          contracts_count: Optional[int], max_concurrency: Optional[int], state_path: str, resume: bool, queue, stop_event) -> None:
+    from src.key_registry import Signer
+    from src.loop_monitor import LoopLagMonitor
+    from src.menu import Menu
+    from src.provider_pool import ProviderPool
+    from src.rpc_metrics import RpcMetrics
+    from src.signing import SigningExecutor
+    from src.state_store import StateStore
+    from config import METRICS_PARAMS
+
+    signers = [Signer.for_key(private_key, address) for private_key, address in keys]
+    state_store = StateStore(state_path, resume)
+    menu = Menu(max_concurrency=max_concurrency, state_store=state_store, account_indices=account_indices, total_accounts=total_accounts)
+
+    loop_monitor = LoopLagMonitor(METRICS_PARAMS['loop_lag_interval']) if METRICS_PARAMS['loop_lag_interval'] else None
+    if loop_monitor:
+        loop_monitor.start()
+
+    async def wait_for_stop() -> None:
+        while not stop_event.is_set():
+            await asyncio.sleep(STOP_POLL_INTERVAL)
+
+    run_task = asyncio.create_task(menu.handle_choice(choice, signers, proxies, contracts_count=contracts_count))
+    stop_task = asyncio.create_task(wait_for_stop())
+    results = [None] * len(signers)
+    try:
+        await asyncio.wait([run_task, stop_task], return_when=asyncio.FIRST_COMPLETED)
+        if not run_task.done():
+            run_task.cancel()
+        try:
+            results = await run_task or results
+        except asyncio.CancelledError:
+            logger.warning(f'Shard {shard_index+1} | Stopped by user.')
+    finally:
+        stop_task.cancel()
+        if loop_monitor:
+            loop_monitor.stop()
+            logger.info(f'Shard {shard_index+1} | Event loop lag: {loop_monitor}')
+        await ProviderPool.close()
+        SigningExecutor.shutdown()
+        state_store.close()
+
+    results = [RuntimeError(repr(result)) if isinstance(result, BaseException) else result for result in results]
+    queue.put(('done', shard_index, account_indices, results, menu.last_summary, dict(RpcMetrics.methods), dict(RpcMetrics.wallets)))
+
+
+class ShardedRunner:
+    def __init__(self, processes: int, max_concurrency: Optional[int] = None, state_path: Optional[str] = None, resume: bool = False, config_path: Optional[str] = None):
+        self.processes = processes
+        self.max_concurrency = max_concurrency
+        self.state_path = state_path
+        self.resume = resume
+        self.config_path = config_path
+        self.summary = None
+
+    def run(self, choice: int, private_keys: list, proxies: list, contracts_count: Optional[int] = None) -> list:
+        from src.rpc_metrics import RpcMetrics
+        from src.scheduler import RunSummary
+        from src.vars import STATE_PATH
+        from config import METRICS_PARAMS, SCHEDULER_PARAMS, TOKEN_NAMES_PARAMS
+
+        processes = max(1, min(self.processes, len(private_keys)))
+        shards = [list(range(index, len(private_keys), processes)) for index in range(processes)]
+        max_concurrency = math.ceil((self.max_concurrency or SCHEDULER_PARAMS['max_in_flight']) / processes)
+        seed = TOKEN_NAMES_PARAMS['seed'] if TOKEN_NAMES_PARAMS['seed'] is not None else random.getrandbits(32)
+
+        context = multiprocessing.get_context('spawn')
+        queue = context.Queue()
+        stop_event = context.Event()
+        workers = [
+            context.Process(target=run_shard, args=(
+                shard_index, processes, choice, [(private_keys[index].private_key, private_keys[index].address) for index in indices], indices, len(private_keys),
+                proxies, contracts_count, max_concurrency, self.state_path or STATE_PATH, self.resume, self.config_path, seed, queue, stop_event
+            ), name=f'shard-{shard_index+1}')
+            for shard_index, indices in enumerate(shards)
+        ]
+
+        logger.info(f'Running {len(private_keys)} accounts in {processes} processes, up to {max_concurrency} accounts in flight per process...')
+        self.summary = RunSummary(len(private_keys))
+        for worker in workers:
+            worker.start()
+
+        results = [None] * len(private_keys)
+        pending = set(range(processes))
+        interrupted = False
+
+        while pending:
+            try:
+                try:
+                    message = queue.get(timeout=QUEUE_POLL_INTERVAL)
+                except Empty:
+                    if not any(workers[shard_index].is_alive() for shard_index in pending):
+                        logger.error(f'Shards {", ".join(str(shard_index+1) for shard_index in sorted(pending))} exited without reporting results.')
+                        break
+                    continue
+
+                if message[0] == 'log':
+                    _, level, text, name, function, line, extra = message
+                    logger.patch(lambda record: record.update(name=name, function=function, line=line)).bind(**extra).log(level, text)
+                elif message[0] == 'done':
+                    _, shard_index, indices, shard_results, shard_summary, methods, wallets = message
+                    for index, result in zip(indices, shard_results):
+                        results[index] = result
+                    if shard_summary:
+                        self.merge_summary(shard_summary)
+                    RpcMetrics.merge(methods, wallets)
+                    pending.discard(shard_index)
+                elif message[0] == 'error':
+                    _, shard_index, error = message
+                    logger.error(f'Shard {shard_index+1} failed: {error}.')
+                    pending.discard(shard_index)
+
+            except KeyboardInterrupt:
+                if interrupted:
+                    for worker in workers:
+                        worker.terminate()
+                    raise
+                interrupted = True
+                stop_event.set()
+                logger.warning('Interrupted by user, waiting for shards to stop (press Ctrl+C again to kill them)...')
+
+        for worker in workers:
+            worker.join()
+
+        self.summary.finished_at = time.monotonic()
+        logger.info(f'Run summary: {self.summary}')
+
+        if METRICS_PARAMS['summary'] and RpcMetrics.methods:
+            logger.info(f'RPC summary:\n{RpcMetrics.get_summary()}')
+        if METRICS_PARAMS['dump_interval']:
+            asyncio.run(RpcMetrics.dump())
+
+        if interrupted:
+            raise KeyboardInterrupt
+        return results
+
+    def merge_summary(self, shard_summary) -> None:
+        self.summary.completed += shard_summary.completed
+        self.summary.failed += shard_summary.failed
+        self.summary.timed_out += shard_summary.timed_out
+        self.summary.cancelled += shard_summary.cancelled
+        self.summary.durations.extend(shard_summary.durations)
@@ -0,0 +1,99 @@
+import asyncio
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional
+
+from eth_account import Account
+from eth_account.datastructures import SignedTransaction
+from eth_account.signers.local import LocalAccount
+
+from src.key_registry import Signer
+from config import SIGNING_PARAMS
+
+
+@lru_cache(maxsize=1024)
+def get_account(private_key: str) -> LocalAccount:
+    return Account.from_key(private_key)
+
+
+def sign_transactions(items: list) -> list:
+    return [get_account(private_key).sign_transaction(tx_params) for private_key, tx_params in items]
+
+
+def sign_with_signers(items: list) -> list:
+    return [signer.sign_transaction(tx_params) for signer, tx_params in items]
+
+
+class SigningExecutor:
+    _executor: Optional[Executor] = None
+    _pending: list = []
+    _flush_handle: Optional[asyncio.Handle] = None
+    _tasks: set = set()
+
+    @classmethod
+    def get_executor(cls) -> Optional[Executor]:
+        if cls._executor is None and SIGNING_PARAMS['executor']:
+            workers = SIGNING_PARAMS['workers'] or os.cpu_count() or 1
+            if SIGNING_PARAMS['executor'] == 'process':
+                cls._executor = ProcessPoolExecutor(max_workers=workers)
+            else:
+                cls._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='signer')
+        return cls._executor
+
+    @classmethod
+    async def sign(cls, signer: Signer, tx_params: dict) -> SignedTransaction:
+        if cls.get_executor() is None:
+            return signer.sign_transaction(tx_params)
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        cls._pending.append((signer, tx_params, future))
+        if cls._flush_handle is None:
+            cls._flush_handle = loop.call_soon(cls._flush)
+        return await future
+
+    @classmethod
+    def _flush(cls) -> None:
+        cls._flush_handle = None
+        pending, cls._pending = cls._pending, []
+        task = asyncio.ensure_future(cls._sign_pending(pending))
+        cls._tasks.add(task)
+        task.add_done_callback(cls._tasks.discard)
+
+    @classmethod
+    async def _sign_pending(cls, pending: list) -> None:
+        try:
+            results = await cls.sign_many([(signer, tx_params) for signer, tx_params, _ in pending])
+        except Exception as e:
+            if len(pending) > 1:
+                await asyncio.gather(*[cls._sign_pending([item]) for item in pending])
+            elif not pending[0][2].done():
+                pending[0][2].set_exception(e)
+            return
+
+        for (_, _, future), signed in zip(pending, results):
+            if not future.done():
+                future.set_result(signed)
+
+    @classmethod
+    async def sign_many(cls, items: list) -> list:
+        executor = cls.get_executor()
+        if executor is None or not items:
+            return sign_with_signers(items)
+        if isinstance(executor, ProcessPoolExecutor):
+            function, items = sign_transactions, [(signer.private_key, tx_params) for signer, tx_params in items]
+        else:
+            function = sign_with_signers
+        workers = SIGNING_PARAMS['workers'] or os.cpu_count() or 1
+        chunk_size = -(-len(items) // workers)
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[loop.run_in_executor(executor, function, items[i:i + chunk_size]) for i in range(0, len(items), chunk_size)])
+        return [signed for chunk in results for signed in chunk]
+
+    @classmethod
+    def shutdown(cls) -> None:
+        if cls._executor is not None:
+            cls._executor.shutdown(wait=False, cancel_futures=True)
+            cls._executor = None
+        cls._pending, cls._flush_handle = [], None
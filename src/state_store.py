@@ -0,0 +1,167 @@
+import sqlite3
+import threading
+import time
+from queue import Empty, Queue
+from contextvars import ContextVar
+from typing import Any, Awaitable, Callable, Optional
+
+import ujson
+from hexbytes import HexBytes
+from loguru import logger
+
+
+current_task: ContextVar = ContextVar('current_task', default=None)
+BUSY_TIMEOUT = 30
+
+
+class TaskState:
+    def __init__(self, status: str, tx_hash: Optional[str], result: Optional[str], receipt: Optional[str]):
+        self.status = status
+        self.tx_hash = tx_hash
+        self.result = ujson.loads(result) if result is not None else None
+        self.receipt = ujson.loads(receipt) if receipt is not None else None
+
+
+class StateStore:
+    def __init__(self, path: str, resume: bool = False):
+        self.path = path
+        self.resume = resume
+        self._last_tx_hashes: dict = {}
+        self._writes: Queue = Queue()
+        self.connection = sqlite3.connect(path, timeout=BUSY_TIMEOUT)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS tasks (
+                address TEXT NOT NULL,
+                task TEXT NOT NULL,
+                status TEXT NOT NULL,
+                tx_hash TEXT,
+                result TEXT,
+                receipt TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (address, task)
+            )
+        ''')
+        self.connection.commit()
+        self._writer = threading.Thread(target=self._write_loop, name='state-writer', daemon=True)
+        self._writer.start()
+
+    def _write_loop(self) -> None:
+        connection = sqlite3.connect(self.path, timeout=BUSY_TIMEOUT)
+        stopped = False
+        while not stopped:
+            batch = [self._writes.get()]
+            while True:
+                try:
+                    batch.append(self._writes.get_nowait())
+                except Empty:
+                    break
+
+            stopped = None in batch
+            try:
+                with connection:
+                    for write in batch:
+                        if write is not None:
+                            connection.execute(*write)
+            except sqlite3.Error as e:
+                logger.error(f'Failed to save run state to {self.path}: {e}')
+        connection.close()
+
+    def get(self, address: str, task: str) -> Optional[TaskState]:
+        row = self.connection.execute('SELECT status, tx_hash, result, receipt FROM tasks WHERE address = ? AND task = ?', (address, task)).fetchone()
+        return TaskState(*row) if row else None
+
+    def save(self, address: str, task: str, status: str, tx_hash: Optional[str] = None, result: Any = None, receipt: Optional[dict] = None) -> None:
+        self._writes.put(('''
+            INSERT INTO tasks (address, task, status, tx_hash, result, receipt, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (address, task) DO UPDATE SET
+                status = excluded.status,
+                tx_hash = COALESCE(excluded.tx_hash, tasks.tx_hash),
+                result = excluded.result,
+                receipt = COALESCE(excluded.receipt, tasks.receipt),
+                updated_at = excluded.updated_at
+        ''', (address, task, status, tx_hash, ujson.dumps(result) if result is not None else None, ujson.dumps(receipt) if receipt is not None else None, time.time())))
+
+    def clear(self, address: str, task: str) -> None:
+        self._writes.put(('DELETE FROM tasks WHERE address = ? AND task = ?', (address, task)))
+
+    async def run(self, client, task: str, action: Callable[[], Awaitable], from_receipt: Optional[Callable] = None) -> Any:
+        if self.resume:
+            state = self.get(client.wallet_address, task)
+
+            if state and state.status == 'done':
+                logger.info(f'{client.wallet_address} | Task {task} is already completed, skipping.')
+                return state.result
+
+            if state and state.tx_hash:
+                logger.info(f'{client.wallet_address} | Task {task} already sent transaction {state.tx_hash}, checking it instead of resending...')
+                token = current_task.set((self, client.wallet_address, task))
+                try:
+                    receipt = await client.verif_tx(HexBytes(state.tx_hash))
+                finally:
+                    current_task.reset(token)
+
+                if receipt:
+                    result = from_receipt(receipt) if from_receipt else True
+                    self.save(client.wallet_address, task, 'done', result=result)
+                    return result
+
+        self.clear(client.wallet_address, task)
+        token = current_task.set((self, client.wallet_address, task))
+        started_at = time.monotonic()
+        try:
+            with logger.contextualize(address=client.wallet_address, network=client.network.name, action=task):
+                result = await action()
+        except Exception:
+            self.save(client.wallet_address, task, 'failed')
+            self._log_finished(client, task, 'failed', started_at)
+            raise
+        finally:
+            current_task.reset(token)
+
+        status = 'done' if result and not isinstance(result, Exception) else 'failed'
+        self.save(client.wallet_address, task, status, result=result if not isinstance(result, Exception) else None)
+        self._log_finished(client, task, status, started_at)
+        return result
+
+    def _log_finished(self, client, task: str, status: str, started_at: float) -> None:
+        duration = time.monotonic() - started_at
+        tx_hash = self._last_tx_hashes.pop((client.wallet_address, task), None)
+        logger.bind(address=client.wallet_address, network=client.network.name, action=task, status=status, tx_hash=tx_hash, duration=round(duration, 3)).info(
+            f'{client.wallet_address} | Task {task} finished with status {status} in {duration:.1f}s.'
+        )
+
+    @staticmethod
+    async def run_step(client, step: str, action: Callable[[], Awaitable], from_receipt: Optional[Callable] = None, shared: bool = False) -> Any:
+        task = current_task.get()
+        if task is None:
+            return await action()
+
+        store, _, name = task
+        return await store.run(client, step if shared else f'{name}_{step}', action, from_receipt)
+
+    @staticmethod
+    def record_tx(tx_hash: bytes) -> None:
+        task = current_task.get()
+        if task:
+            store, address, name = task
+            store._last_tx_hashes[(address, name)] = HexBytes(tx_hash).hex()
+            store.save(address, name, 'pending', tx_hash=HexBytes(tx_hash).hex())
+
+    @staticmethod
+    def record_receipt(receipt: dict) -> None:
+        task = current_task.get()
+        if task:
+            store, address, name = task
+            store.save(address, name, 'pending', tx_hash=HexBytes(receipt['transactionHash']).hex(), receipt={
+                'status': receipt.get('status'),
+                'blockNumber': receipt.get('blockNumber'),
+                'gasUsed': receipt.get('gasUsed'),
+                'contractAddress': receipt.get('contractAddress')
+            })
+
+    def close(self) -> None:
+        self._writes.put(None)
+        self._writer.join()
+        self.connection.close()
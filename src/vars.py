@@ -19,6 +19,8 @@ ERC721_BYTECODE = os.path.join(DATA_DIR, 'erc721bytecode.txt')
 ERC20_ABI = os.path.join(ABIS_DIR, 'erc20contract.json')
 ERC20_BYTECODE = os.path.join(DATA_DIR, 'erc20bytecode.txt')
 
+BATCH_EXECUTOR_BYTECODE = os.path.join(DATA_DIR, 'batch_executor_bytecode.txt')
+
 DOMAIN_ABI = os.path.join(ABIS_DIR, 'domain_abi.json')
 
 NAMES_PATH = os.path.join(DATA_DIR, 'token_names.txt')
@@ -29,3 +31,7 @@ PROXIES_PATH = os.path.join(FILES_DIR, 'proxies.txt')
 DOMAIN_NAMES_PATH = os.path.join(FILES_DIR, 'domain_names.txt')
 
 LOGS_PATH = os.path.join(LOGS_DIR, 'logs.txt')
+JSON_LOGS_PATH = os.path.join(LOGS_DIR, 'logs.jsonl')
+STATE_PATH = os.path.join(LOGS_DIR, 'state.db')
+METRICS_PATH = os.path.join(LOGS_DIR, 'metrics.json')
+ADDRESS_CACHE_PATH = os.path.join(LOGS_DIR, 'address_cache.json')
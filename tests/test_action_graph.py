@@ -0,0 +1,99 @@
+import asyncio
+
+import pytest
+
+from src.action_graph import ActionGraph
+
+
+def test_child_receives_parent_result():
+    async def deploy():
+        return '0xcontract'
+
+    async def mint(contract_address):
+        return contract_address == '0xcontract'
+
+    graph = ActionGraph()
+    deploy_name = graph.add('deploy', deploy)
+    graph.add('mint', mint, parents=(deploy_name,))
+
+    assert asyncio.run(graph.run()) == {'deploy': '0xcontract', 'mint': True}
+
+
+def test_failed_parent_skips_children_and_is_reported():
+    calls = []
+
+    async def deploy():
+        raise RuntimeError('deploy failed')
+
+    async def mint(contract_address):
+        calls.append(contract_address)
+        return True
+
+    async def register():
+        return True
+
+    graph = ActionGraph()
+    deploy_name = graph.add('deploy', deploy)
+    graph.add('mint', mint, parents=(deploy_name,))
+    graph.add('register', register)
+    results = asyncio.run(graph.run())
+
+    assert calls == []
+    assert results['mint'] is None
+    assert results['register'] is True
+    assert list(graph.get_errors()) == ['deploy']
+    assert isinstance(graph.get_errors()['deploy'], RuntimeError)
+
+
+def test_falsy_parent_result_skips_children():
+    async def deploy():
+        return None
+
+    async def mint(contract_address):
+        return True
+
+    graph = ActionGraph()
+    graph.add('mint', mint, parents=(graph.add('deploy', deploy),))
+
+    assert asyncio.run(graph.run())['mint'] is None
+    assert graph.get_errors() == {}
+
+
+def test_max_in_flight_limits_concurrency():
+    running, peak = 0, 0
+
+    async def action():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return True
+
+    graph = ActionGraph(max_in_flight=2)
+    for index in range(6):
+        graph.add(f'action_{index}', action)
+    asyncio.run(graph.run())
+
+    assert peak == 2
+
+
+def test_unknown_parent_is_rejected():
+    async def action():
+        return True
+
+    with pytest.raises(ValueError):
+        ActionGraph().add('mint', action, parents=('deploy',))
+
+
+def test_critical_path():
+    async def action(*results):
+        return True
+
+    graph = ActionGraph()
+    first = graph.add('first', action)
+    second = graph.add('second', action, parents=(first,))
+    graph.add('third', action, parents=(second,))
+    graph.add('other', action)
+
+    assert graph.get_critical_path() == 3
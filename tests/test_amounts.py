@@ -0,0 +1,93 @@
+import random
+
+import pytest
+
+from src import amounts
+from src.amounts import Amount
+
+
+BALANCES = [0, 1, 123_456_789, 10 ** 18, 3 * 10 ** 21, 987_654_321_987_654_321_987]
+
+
+def test_to_wei_is_exact():
+    assert Amount.to_wei(0.1) == 10 ** 17
+    assert Amount.to_wei('0.00005') == 5 * 10 ** 13
+    assert Amount.to_wei(1.23456789012345678) == 1_234_567_890_123_456_700
+
+
+def test_round_down_keeps_significant_digits():
+    assert Amount.round_down(123_456_789) == 123_000_000
+    assert Amount.round_down(999) == 999
+    assert Amount.round_down(0) == 0
+    assert Amount.round_down(987_654_321_987_654_321_987, 5) == 987_650_000_000_000_000_000
+
+
+def test_format():
+    assert Amount.format(123_456_789_012_345_678) == '0.123'
+    assert Amount.format(10 ** 18) == '1'
+    assert Amount.format(0) == '0'
+
+
+def test_fixed_percent_never_exceeds_share():
+    params = {'amount': False, 'percent': 7}
+    for balance in BALANCES:
+        amount = Amount.get_bridge_amount(balance, params)
+        assert amount <= balance * 7 // 100
+        assert amount == Amount.round_down(balance * 7 // 100)
+
+
+def test_random_amount_stays_in_range():
+    params = {'amount': (0.001, 0.002), 'percent': False}
+    rng = random.Random(1)
+    for _ in range(100):
+        amount = Amount.get_bridge_amount(10 ** 18, params, rng)
+        assert 10 ** 15 <= amount <= 2 * 10 ** 15
+
+
+@pytest.mark.parametrize('params, error', [
+    ({'amount': 1, 'percent': 5}, 'both amount and percent are set'),
+    ({'amount': False, 'percent': False}, 'both amount and percent are set to False'),
+    ({'amount': '1', 'percent': False}, 'amount is set to str'),
+])
+def test_invalid_bridge_params(params, error):
+    with pytest.raises(ValueError, match=error):
+        Amount.get_bridge_amounts(BALANCES, params)
+
+
+SMALL_BALANCES = [0, 1, 999, 123_456_789, 10 ** 18, 18 * 10 ** 18]
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+@pytest.mark.parametrize('balances', [BALANCES, SMALL_BALANCES])
+def test_batch_matches_single_amounts(monkeypatch, use_numpy, balances):
+    if use_numpy:
+        pytest.importorskip('numpy')
+    else:
+        monkeypatch.setattr(amounts, 'np', None)
+
+    for percent in (7, 0.5, 100):
+        fixed = {'amount': False, 'percent': percent}
+        assert Amount.get_bridge_amounts(balances, fixed) == [Amount.get_bridge_amount(balance, fixed) for balance in balances]
+
+    ranged = {'amount': False, 'percent': (5, 10)}
+    results = Amount.get_bridge_amounts(balances, ranged, seed=1)
+    assert results == Amount.get_bridge_amounts(balances, ranged, seed=1)
+    for balance, amount in zip(balances, results):
+        assert type(amount) is int
+        assert amount == Amount.round_down(amount)
+        assert amount <= balance // 10
+
+    for params in ({'amount': (0.001, 0.002), 'percent': False}, {'amount': (1, 100), 'percent': False}):
+        low, high = Amount.get_bridge_mode(params)[1]
+        for amount in Amount.get_bridge_amounts(balances, params, seed=2):
+            assert type(amount) is int
+            assert Amount.round_down(low) <= amount <= high
+            assert amount == Amount.round_down(amount)
+
+
+def test_fits_uint64():
+    assert Amount.fits_uint64(SMALL_BALANCES, 'percent', (5 * 10 ** 6, 10 ** 8))
+    assert not Amount.fits_uint64(BALANCES, 'percent', 10 ** 8)
+    assert not Amount.fits_uint64([amounts.MAX_UINT64], 'percent', 2 * 10 ** 8)
+    assert Amount.fits_uint64(BALANCES, 'amount', (10 ** 15, 10 ** 18))
+    assert not Amount.fits_uint64(BALANCES, 'amount', (1, 100 * 10 ** 18))
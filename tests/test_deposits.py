@@ -0,0 +1,72 @@
+import pytest
+import rlp
+from eth_utils import keccak
+
+from src.deposits import OPTIMISM_PORTAL, TRANSACTION_DEPOSITED_TOPIC, Deposit, get_deposits
+
+
+SENDER = '0x19E7E376E7C213B7E7e7e46cc70A5dD086DAff2A'
+BLOCK_HASH = '0x' + 'ab' * 32
+LOG_INDEX = 3
+MINT = 10 ** 17
+GAS = 200_000
+
+
+def make_log(to_: str = SENDER, is_creation: bool = False, data: bytes = b'', version: int = 0) -> dict:
+    opaque_data = MINT.to_bytes(32, 'big') + MINT.to_bytes(32, 'big') + GAS.to_bytes(8, 'big') + bytes([is_creation]) + data
+    encoded = (32).to_bytes(32, 'big') + len(opaque_data).to_bytes(32, 'big') + opaque_data.ljust(-(-len(opaque_data) // 32) * 32, b'\x00')
+    return {
+        'address': OPTIMISM_PORTAL,
+        'topics': [
+            TRANSACTION_DEPOSITED_TOPIC,
+            '0x' + '00' * 12 + SENDER[2:].lower(),
+            '0x' + '00' * 12 + to_[2:].lower(),
+            '0x' + version.to_bytes(32, 'big').hex()
+        ],
+        'data': '0x' + encoded.hex(),
+        'blockHash': BLOCK_HASH,
+        'logIndex': LOG_INDEX
+    }
+
+
+def test_from_log_decodes_opaque_data():
+    deposit = Deposit.from_log(make_log(data=b'\x12\x34'))
+
+    assert deposit.from_ == SENDER
+    assert deposit.to_ == SENDER
+    assert deposit.mint == MINT
+    assert deposit.value == MINT
+    assert deposit.gas == GAS
+    assert deposit.data == b'\x12\x34'
+
+
+def test_tx_hash_follows_user_deposit_derivation():
+    source_hash = keccak(bytes(32) + keccak(bytes.fromhex(BLOCK_HASH[2:]) + LOG_INDEX.to_bytes(32, 'big')))
+    sender = bytes.fromhex(SENDER[2:])
+    expected = keccak(b'\x7e' + rlp.encode([source_hash, sender, sender, MINT, MINT, GAS, 0, b'']))
+
+    assert Deposit.from_log(make_log()).tx_hash == expected
+
+
+def test_contract_creation_has_no_recipient():
+    deposit = Deposit.from_log(make_log(is_creation=True))
+    sender = bytes.fromhex(SENDER[2:])
+    expected = keccak(b'\x7e' + rlp.encode([deposit.source_hash, sender, b'', MINT, MINT, GAS, 0, b'']))
+
+    assert deposit.to_ is None
+    assert deposit.tx_hash == expected
+
+
+def test_unsupported_version_is_rejected():
+    with pytest.raises(ValueError):
+        Deposit.from_log(make_log(version=1))
+
+
+def test_get_deposits_filters_portal_logs():
+    other_log = {**make_log(), 'address': '0x' + '11' * 20}
+    receipt = {'logs': [other_log, make_log()]}
+
+    deposits = get_deposits(receipt)
+
+    assert len(deposits) == 1
+    assert deposits[0].to_ == SENDER
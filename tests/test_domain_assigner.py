@@ -0,0 +1,63 @@
+import asyncio
+
+import pytest
+
+from src.domain_assigner import DomainAssigner
+
+
+@pytest.fixture
+def assign(tmp_path, monkeypatch):
+    def run(names: list, taken: set, total_accounts: int) -> list:
+        path = tmp_path / 'domain_names.txt'
+        path.write_text('\n'.join(names))
+
+        async def get_availability(names: list) -> list:
+            return [name not in taken for name in names]
+
+        monkeypatch.setattr(DomainAssigner, 'get_availability', staticmethod(get_availability))
+        assigner = DomainAssigner(str(path))
+
+        async def get_names() -> list:
+            return await asyncio.gather(*[assigner.get_name(index, total_accounts) for index in range(total_accounts)])
+
+        return asyncio.run(get_names())
+    return run
+
+
+def test_available_names_are_kept_in_order(assign):
+    assert assign(['a', 'b', 'c'], set(), 3) == ['a', 'b', 'c']
+
+
+def test_taken_names_are_replaced_by_spares(assign):
+    assert assign(['a', 'b', 'c', 'spare1', 'spare2'], {'b', 'spare1'}, 3) == ['a', 'spare2', 'c']
+
+
+def test_duplicates_are_treated_as_taken(assign):
+    assert assign(['a', 'A', 'b', 'spare'], set(), 3) == ['a', 'spare', 'b']
+
+
+def test_accounts_without_spares_get_no_name(assign):
+    assert assign(['a', 'b', 'c'], {'a', 'c'}, 3) == [None, 'b', None]
+
+
+def test_too_few_names_assign_nothing(assign):
+    assert assign(['a'], set(), 2) == [None, None]
+
+
+def test_names_are_assigned_once(tmp_path, monkeypatch):
+    path = tmp_path / 'domain_names.txt'
+    path.write_text('a\nb')
+    checks = []
+
+    async def get_availability(names: list) -> list:
+        checks.append(names)
+        return [True] * len(names)
+
+    monkeypatch.setattr(DomainAssigner, 'get_availability', staticmethod(get_availability))
+    assigner = DomainAssigner(str(path))
+
+    async def get_names() -> list:
+        return await asyncio.gather(*[assigner.get_name(index, 2) for index in (0, 1, 0, 1)])
+
+    assert asyncio.run(get_names()) == ['a', 'b', 'a', 'b']
+    assert len(checks) == 1
@@ -0,0 +1,84 @@
+import asyncio
+
+from src.models import ink_sepolia
+from src.nonce_manager import NonceManager
+from src.provider_pool import ProviderPool
+
+
+ADDRESS = '0x0000000000000000000000000000000000000001'
+
+
+class FakeBatcher:
+    def __init__(self, nonce: int):
+        self.nonce = nonce
+        self.requests = 0
+
+    async def get_transaction_count(self, address: str, block: str = 'pending') -> int:
+        self.requests += 1
+        await asyncio.sleep(0)
+        return self.nonce
+
+
+def make_manager(nonce: int = 7) -> NonceManager:
+    manager = NonceManager(ProviderPool.get_w3(ink_sepolia), ADDRESS)
+    manager.batcher = FakeBatcher(nonce)
+    return manager
+
+
+def test_concurrent_senders_get_unique_sequential_nonces():
+    async def run():
+        manager = make_manager()
+        nonces = await asyncio.gather(*[manager.get_nonce() for _ in range(50)])
+        return manager, nonces
+
+    manager, nonces = asyncio.run(run())
+    assert sorted(nonces) == list(range(7, 57))
+    assert manager.batcher.requests == 1
+
+
+def test_release_of_last_nonce_reuses_it():
+    async def run():
+        manager = make_manager()
+        nonce = await manager.get_nonce()
+        is_gap = await manager.release(nonce)
+        return nonce, is_gap, await manager.get_nonce()
+
+    nonce, is_gap, next_nonce = asyncio.run(run())
+    assert not is_gap
+    assert next_nonce == nonce
+
+
+def test_release_below_handed_out_nonces_reports_gap():
+    async def run():
+        manager = make_manager()
+        first, second = await asyncio.gather(manager.get_nonce(), manager.get_nonce())
+        is_gap = await manager.release(first)
+        return second, is_gap, await manager.get_nonce()
+
+    second, is_gap, next_nonce = asyncio.run(run())
+    assert is_gap
+    assert next_nonce == second + 1
+
+
+def test_resync_reads_nonce_from_node():
+    async def run():
+        manager = make_manager()
+        await manager.get_nonce()
+        manager.batcher.nonce = 20
+        await manager.resync()
+        return manager, await manager.get_nonce()
+
+    manager, nonce = asyncio.run(run())
+    assert nonce == 20
+    assert manager.batcher.requests == 2
+
+
+def test_release_after_resync_is_not_a_gap():
+    async def run():
+        manager = make_manager()
+        nonce = await manager.get_nonce()
+        await manager.get_nonce()
+        await manager.resync()
+        return await manager.release(nonce)
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1,56 @@
+import asyncio
+
+import pytest
+
+from src import signing
+from src.key_registry import Signer
+from src.signing import SigningExecutor
+
+
+PRIVATE_KEY = '0x' + '11' * 32
+
+
+def make_tx(nonce: int) -> dict:
+    return {'to': '0x' + '22' * 20, 'value': 0, 'gas': 21_000, 'gasPrice': 10 ** 9, 'nonce': nonce, 'chainId': 1}
+
+
+@pytest.fixture
+def executor(monkeypatch):
+    monkeypatch.setitem(signing.SIGNING_PARAMS, 'executor', 'thread')
+    monkeypatch.setitem(signing.SIGNING_PARAMS, 'workers', 2)
+    yield SigningExecutor
+    SigningExecutor.shutdown()
+
+
+def test_concurrent_signs_share_one_batch(executor, monkeypatch):
+    signer = Signer(PRIVATE_KEY)
+    batches = []
+    sign_many = SigningExecutor.sign_many.__func__
+
+    async def record(cls, items: list) -> list:
+        batches.append(len(items))
+        return await sign_many(cls, items)
+
+    monkeypatch.setattr(SigningExecutor, 'sign_many', classmethod(record))
+
+    async def sign_all() -> list:
+        return await asyncio.gather(*[SigningExecutor.sign(signer, make_tx(nonce)) for nonce in range(5)])
+
+    results = asyncio.run(sign_all())
+
+    assert batches == [5]
+    assert [result.rawTransaction for result in results] == [signer.sign_transaction(make_tx(nonce)).rawTransaction for nonce in range(5)]
+
+
+def test_invalid_tx_fails_only_itself(executor):
+    signer = Signer(PRIVATE_KEY)
+
+    async def sign_all() -> list:
+        txs = [make_tx(0), {**make_tx(1), 'gas': 'invalid'}, make_tx(2)]
+        return await asyncio.gather(*[SigningExecutor.sign(signer, tx) for tx in txs], return_exceptions=True)
+
+    results = asyncio.run(sign_all())
+
+    assert isinstance(results[1], Exception)
+    assert results[0].rawTransaction == signer.sign_transaction(make_tx(0)).rawTransaction
+    assert results[2].rawTransaction == signer.sign_transaction(make_tx(2)).rawTransaction